@@ -0,0 +1 @@
+# Backend/benchmarks/__init__.py
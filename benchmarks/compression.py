@@ -0,0 +1,53 @@
+# Backend/benchmarks/compression.py
+"""계획 응답 압축 벤치마크 - 전송 바이트와 모바일 회선 다운로드 시간
+
+실행: python -m Backend.benchmarks.compression
+4주 계획 한 개(/plans/generate)와 다섯 개(/plans/all)의 ORJSON 응답 본문을
+identity/gzip/brotli로 인코딩해 크기와 압축 시간을 재고, 회선 대역폭으로 다운로드 시간을 계산합니다.
+(다운로드 시간 = 서버 압축 시간 + 전송 바이트 / 대역폭, RTT는 인코딩과 무관하므로 제외)
+"""
+
+import time
+
+from fastapi.responses import ORJSONResponse
+
+from ..utils.compression import compress, brotli
+from .plan_serialization import make_plan
+
+REPEAT = 20
+# 회선 이름, 대역폭(Mbps)
+LINKS = [("3G", 1.6), ("LTE(약전계)", 5.0), ("LTE", 20.0)]
+
+
+def timed_compress(body: bytes, encoding: str):
+    if encoding == "identity":
+        return body, 0.0
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        encoded = compress(body, encoding)
+    return encoded, (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    cases = [
+        ("/plans/generate (1 plan)", make_plan(0)),
+        ("/plans/all (5 plans)", [make_plan(i) for i in range(5)])
+    ]
+    header = f"{'encoding':>9} {'bytes':>9} {'ratio':>6} {'cpu':>8}" + "".join(f" {name:>12}" for name, _ in LINKS)
+    for label, content in cases:
+        body = ORJSONResponse(content).body
+        print(label)
+        print(header)
+        for encoding in encodings:
+            encoded, cpu_ms = timed_compress(body, encoding)
+            downloads = [cpu_ms + len(encoded) * 8 / (mbps * 1000) for _, mbps in LINKS]
+            print(
+                f"{encoding:>9} {len(encoded):>9,} {len(body) / len(encoded):5.1f}x {cpu_ms:6.2f}ms"
+                + "".join(f" {ms:10.0f}ms" for ms in downloads)
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Backend/benchmarks/json_extract.py
+"""JSON 추출 마이크로벤치마크 - 기존 정규식 방식 vs 단일 순회 추출기
+
+실행: python -m Backend.benchmarks.json_extract
+계획 생성 응답과 같은 형태(코드블록, 줄바꿈 들여쓰기, 학습 자료 포함)의 30~130KB 응답을 만들어
+전체 텍스트 추출과 스트리밍 조각 입력 시간을 비교합니다. dirty는 trailing comma가 섞인 응답입니다.
+"""
+
+import re
+import json
+import time
+from datetime import date, timedelta
+
+from ..services.json_extract import JSONExtractor, extract_json_object
+
+REPEAT = 20
+CHUNK_SIZE = 24  # 스트리밍 응답 한 조각의 평균 글자 수
+
+
+def legacy_extract_json(text: str):
+    """이전 gpt_service.extract_json (비교용)"""
+    def clean_json_string(json_str: str) -> str:
+        json_str = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', json_str)
+        json_str = re.sub(r'"(\d{1,3})(,\d{3})+"', lambda m: '"' + m.group(0).replace(',', '').strip('"') + '"', json_str)
+        json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
+        return json_str
+
+    json_match = None
+    try:
+        json_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
+        if json_match:
+            return json.loads(clean_json_string(json_match.group(1)))
+        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        if json_match:
+            return json.loads(clean_json_string(json_match.group()))
+    except json.JSONDecodeError:
+        try:
+            if json_match:
+                json_str = json_match.group(1) if '```json' in text else json_match.group()
+                json_str = json_str.replace('\n', ' ').replace('\r', ' ')
+                return json.loads(clean_json_string(json_str))
+        except Exception:
+            pass
+    return None
+
+
+def make_response(days: int, tasks_per_day: int, materials: int, dirty: bool) -> str:
+    start = date.today()
+    schedule = []
+    for d in range(days):
+        schedule.append({
+            "date": (start + timedelta(days=d)).isoformat(),
+            "tasks": [
+                {
+                    "id": f"task-{d}-{t}",
+                    "title": f"{d + 1}일차 파이썬 리스트와 딕셔너리 심화 {t + 1}",
+                    "description": "공식 문서를 읽으며 주요 메서드를 정리하고, 예제 코드를 직접 따라 작성해 보세요. "
+                                   "작은 연습 문제 3개를 풀고 결과를 노트에 정리합니다.",
+                    "duration": "1시간",
+                    "completed": False,
+                    "related_materials": [
+                        {"title": f"자료 {m + 1}: 리스트 컴프리헨션 완벽 정리", "type": "유튜브",
+                         "url": f"https://www.youtube.com/watch?v=abc{d}{t}{m}", "description": "핵심 개념을 예제로 설명하는 강의"}
+                        for m in range(materials)
+                    ]
+                }
+                for t in range(tasks_per_day)
+            ]
+        })
+    body = json.dumps({"plan_name": "Python 학습 계획", "total_duration": "4주", "daily_schedule": schedule},
+                      ensure_ascii=False, indent=2)
+    if dirty:
+        # GPT 응답에 가끔 섞이는 trailing comma
+        body = body.replace('설명하는 강의"', '설명하는 강의",')
+    return f"다음은 요청하신 학습 계획입니다.\n```json\n{body}\n```\n즐거운 학습 되세요!"
+
+
+def timed(fn, text: str) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn(text)
+    elapsed = (time.perf_counter() - start) / REPEAT * 1000
+    assert result and len(result["daily_schedule"]) > 0
+    return elapsed
+
+
+def feed_chunks(text: str):
+    chunks = [text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)]
+    extractor = JSONExtractor()
+    for chunk in chunks:
+        if extractor.feed(chunk) is not None:
+            break
+    return extractor.result
+
+
+if __name__ == "__main__":
+    print(f"{'size':>8} {'legacy':>10} {'single-pass':>12} {'streamed':>10}")
+    for days, tasks, materials in [(28, 2, 1), (28, 3, 2), (28, 3, 4)]:
+        for dirty in (False, True):
+            text = make_response(days, tasks, materials, dirty)
+            assert legacy_extract_json(text) == extract_json_object(text) == feed_chunks(text)
+            print(
+                f"{len(text.encode()) / 1024:6.0f}KB "
+                f"{timed(legacy_extract_json, text):8.2f}ms "
+                f"{timed(extract_json_object, text):10.2f}ms "
+                f"{timed(feed_chunks, text):8.2f}ms"
+                + ("  (dirty)" if dirty else "")
+            )
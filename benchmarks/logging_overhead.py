@@ -0,0 +1,96 @@
+# Backend/benchmarks/logging_overhead.py
+"""요청당 로깅 오버헤드 벤치마크 - 기존 print 로거 vs 큐 기반 로거
+
+실행: python -m Backend.benchmarks.logging_overhead
+요청 하나가 남기는 로그(log_request + log_stage + log_navigation + log_success)를
+N번 호출하는 동안 호출한 쪽(이벤트 루프)이 쓴 시간과, 모두 출력될 때까지의 시간을 잽니다.
+stdout은 줄 단위로 flush되는 파일(터미널/PYTHONUNBUFFERED 컨테이너와 같은 조건)로 바꿉니다.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import importlib
+
+REQUESTS = 20000
+
+
+def legacy_request_logs(Colors):
+    """이전 utils/logger의 print 구현 (비교용)"""
+    def log_request(endpoint, user="Anonymous", details=""):
+        print(f"\n{Colors.CYAN}┌{'─'*68}┐{Colors.ENDC}")
+        print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.BOLD}[REQUEST]{Colors.ENDC} {endpoint}")
+        print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}User:{Colors.ENDC} {user}")
+        if details:
+            print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}Details:{Colors.ENDC} {details}")
+        print(f"{Colors.CYAN}└{'─'*68}┘{Colors.ENDC}")
+
+    def log_stage(stage_num, stage_name, user=""):
+        print(f"\n{Colors.YELLOW}{'='*70}{Colors.ENDC}")
+        print(f"{Colors.YELLOW}  STAGE {stage_num}: 🏠 {stage_name}{Colors.ENDC}")
+        print(f"{Colors.YELLOW}  User: {user}{Colors.ENDC}")
+        print(f"{Colors.YELLOW}{'='*70}{Colors.ENDC}\n")
+
+    def log_navigation(user, screen):
+        print(f"{Colors.YELLOW}→ [NAVIGATION]{Colors.ENDC} {Colors.BOLD}{user}{Colors.ENDC} → {Colors.UNDERLINE}{screen}{Colors.ENDC}")
+
+    def log_success(message):
+        print(f"{Colors.GREEN}✓ [SUCCESS]{Colors.ENDC} {message}")
+
+    return log_request, log_stage, log_navigation, log_success, lambda: None
+
+
+def queued_request_logs(log_format: str, sample_rate: str = "1.0"):
+    os.environ["LOG_FORMAT"] = log_format
+    os.environ["LOG_SAMPLE_RATE"] = sample_rate
+    os.environ.pop("LOG_LEVEL", None)
+    # 큐가 넘쳐 버려지는 로그 없이 비교
+    os.environ["LOG_QUEUE_MAX_SIZE"] = str(REQUESTS * 5)
+    from ..utils import logger
+    logger = importlib.reload(logger)
+    return logger.log_request, logger.log_stage, logger.log_navigation, logger.log_success, logger.flush_logs
+
+
+def run(logs) -> tuple:
+    log_request, log_stage, log_navigation, log_success, flush = logs
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        log_request("GET /home/header", "홍길동", f"request={i}")
+        log_stage(3, "홈 화면", "홍길동")
+        log_navigation("홍길동", "홈 화면")
+        log_success("홈 헤더 조회 완료")
+    caller = time.perf_counter() - start
+    flush()
+    total = time.perf_counter() - start
+    return caller / REQUESTS * 1e6, total / REQUESTS * 1e6
+
+
+def main():
+    from ..utils.logger import Colors
+    cases = [
+        ("print (before)", lambda: legacy_request_logs(Colors)),
+        ("queue pretty", lambda: queued_request_logs("pretty")),
+        ("queue json", lambda: queued_request_logs("json")),
+        ("queue json 10%", lambda: queued_request_logs("json", "0.1"))
+    ]
+    results = []
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make in cases:
+            path = os.path.join(tmp, f"{len(results)}.log")
+            sys.stdout = open(path, "w", buffering=1, encoding="utf-8")
+            try:
+                caller_us, total_us = run(make())
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+            results.append((name, caller_us, total_us, os.path.getsize(path) / REQUESTS))
+
+    print(f"{'logger':>16} {'caller/req':>11} {'total/req':>10} {'bytes/req':>10}")
+    for name, caller_us, total_us, size in results:
+        print(f"{name:>16} {caller_us:9.1f}us {total_us:8.1f}us {size:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
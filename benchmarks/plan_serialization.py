@@ -0,0 +1,92 @@
+# Backend/benchmarks/plan_serialization.py
+"""계획 응답 직렬화 벤치마크 - dict + jsonable_encoder vs 응답 모델 + orjson
+
+실행: python -m Backend.benchmarks.plan_serialization
+4주 계획(28일 x 태스크 3개, 태스크마다 연관/복습 자료 2개씩) 한 개(/plans/generate)와
+다섯 개(/plans/all)를 FastAPI가 응답 본문을 만드는 것과 같은 경로로 직렬화합니다.
+"""
+
+import json
+import time
+import asyncio
+from typing import List
+from datetime import date, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from ..models.schemas import Plan
+
+REPEAT = 200
+
+
+def make_plan(index: int) -> dict:
+    start = date.today()
+
+    def materials(kind: str, d: int, t: int):
+        return [
+            {"title": f"{kind} 자료 {m + 1}: 파이썬 리스트 정리", "type": "유튜브" if m == 0 else "블로그",
+             "url": f"https://www.youtube.com/watch?v={index}{d}{t}{m}", "description": "핵심 개념을 예제로 설명합니다."}
+            for m in range(2)
+        ]
+
+    return {
+        "plan_name": f"Python 학습 계획 {index}",
+        "total_duration": "4주",
+        "daily_schedule": [
+            {
+                "date": (start + timedelta(days=d)).isoformat(),
+                "tasks": [
+                    {
+                        "id": f"{index}-{d}-{t}",
+                        "title": f"{d + 1}일차 학습 {t + 1}",
+                        "description": "공식 문서를 읽으며 주요 메서드를 정리하고 예제 코드를 따라 해보세요.",
+                        "duration": "40분",
+                        "completed": False,
+                        "related_materials": materials("연관", d, t),
+                        "review_materials": materials("복습", d, t)
+                    }
+                    for t in range(3)
+                ]
+            }
+            for d in range(28)
+        ]
+    }
+
+
+async def before(content) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def after(field):
+    async def render(content) -> bytes:
+        data = await serialize_response(field=field, response_content=content, exclude_unset=True)
+        return ORJSONResponse(data).body
+    return render
+
+
+async def timed(fn, content) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        body = await fn(content)
+    return (time.perf_counter() - start) / REPEAT * 1000, len(body)
+
+
+async def main():
+    cases = [
+        ("/plans/generate (1 plan)", make_plan(0), create_response_field(name="plan", type_=Plan)),
+        ("/plans/all (5 plans)", [make_plan(i) for i in range(5)], create_response_field(name="plans", type_=List[Plan]))
+    ]
+    for label, content, field in cases:
+        # 응답 모델을 거쳐도 본문 내용은 같아야 함
+        assert json.loads(await before(content)) == json.loads(await after(field)(content))
+        old_ms, old_size = await timed(before, content)
+        new_ms, new_size = await timed(after(field), content)
+        print(f"{label:<26} before {old_ms:6.2f} ms ({old_size / 1024:.0f}KB)  "
+              f"after {new_ms:6.2f} ms ({new_size / 1024:.0f}KB)  x{old_ms / new_ms:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+# Backend/benchmarks/plan_sharding.py
+"""단일 호출 vs 주차별 병렬 계획 생성 벤치마크
+
+실행: python -m Backend.benchmarks.plan_sharding [출력 글자당 지연(ms)]
+OpenAI 클라이언트를 출력 길이에 비례해 지연되는 가짜 클라이언트로 바꿔,
+출력 토큰이 순차 생성되는 상황에서의 전체 소요 시간을 비교합니다 (학습 자료 검색 제외).
+"""
+
+import sys
+import json
+import time
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+from ..models.schemas import PlanGenerateRequest
+from ..services import gpt_service
+from ..services.plan_builder import study_dates, parse_start_date
+from ..routers import plans
+
+
+def make_days(dates):
+    return [
+        {
+            "date": d,
+            "tasks": [
+                {"id": f"{d}-{t}", "title": f"{d} 학습 주제 {t}", "description": "공식 문서를 읽으며 예제를 따라 해보세요.",
+                 "duration": "1시간", "completed": False}
+                for t in range(2)
+            ]
+        }
+        for d in dates
+    ]
+
+
+def fake_client(request: PlanGenerateRequest, seconds_per_char: float):
+    weeks = study_dates(parse_start_date(request.startDate), request.restDays)
+
+    async def create(model, messages, **kwargs):
+        prompt = messages[0]["content"]
+        if "주차별 개요" in prompt:
+            content = json.dumps({"weeks": [
+                {"week": i + 1, "theme": f"{i + 1}주차", "topics": [f"주제 {d}" for d in dates]}
+                for i, dates in enumerate(weeks)
+            ]}, ensure_ascii=False)
+        elif "주차**의 날짜별 상세 일정" in prompt:
+            week = next(i for i, dates in enumerate(weeks) if dates and dates[0] in prompt)
+            content = json.dumps({"daily_schedule": make_days(weeks[week])}, ensure_ascii=False)
+        else:
+            all_dates = [d for dates in weeks for d in dates]
+            content = json.dumps({"plan_name": "계획", "total_duration": "4주", "daily_schedule": make_days(all_dates)},
+                                 ensure_ascii=False)
+        await asyncio.sleep(len(content) * seconds_per_char)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+async def main(ms_per_char: float):
+    request = PlanGenerateRequest(
+        skill="Python", hourPerDay=2, startDate=date.today().isoformat(), restDays=["일"], selfLevel="초급"
+    )
+    gpt_service.client = fake_client(request, ms_per_char / 1000)
+
+    start = time.perf_counter()
+    single = gpt_service.extract_json(await gpt_service.call_gpt(plans._build_plan_prompt(request)))
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sharded = await plans._generate_sharded_plan(request)
+    sharded_time = time.perf_counter() - start
+
+    print(f"single  ({len(single['daily_schedule'])} days): {single_time:6.2f} s")
+    print(f"sharded ({len(sharded['daily_schedule'])} days): {sharded_time:6.2f} s  (x{single_time / sharded_time:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5))
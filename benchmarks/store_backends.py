@@ -0,0 +1,80 @@
+# Backend/benchmarks/store_backends.py
+"""인메모리 DataStore vs SQLiteDataStore 비교 벤치마크
+
+실행: python -m Backend.benchmarks.store_backends [사용자 수]
+사용자마다 4주 계획(28일 x 태스크 3개)을 저장한 뒤 주요 연산의 평균 지연시간을 비교합니다.
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+from datetime import date, timedelta
+
+from ..services.store import DataStore
+from ..services.sqlite_store import SQLiteDataStore
+
+OPS = 2000
+
+
+def make_plan(user_index: int) -> dict:
+    start = date.today()
+    return {
+        "plan_name": "벤치마크 계획",
+        "total_duration": "4주",
+        "daily_schedule": [
+            {
+                "date": (start + timedelta(days=d)).isoformat(),
+                "tasks": [
+                    {
+                        "id": f"u{user_index}-d{d}-t{t}",
+                        "title": f"태스크 {d}-{t}",
+                        "description": "설명",
+                        "duration": "1시간",
+                        "completed": False,
+                        "related_materials": [{"title": "자료", "type": "유튜브", "url": "https://www.youtube.com/watch?v=x"}]
+                    }
+                    for t in range(3)
+                ]
+            }
+            for d in range(28)
+        ]
+    }
+
+
+def timed(label: str, fn, args_list):
+    start = time.perf_counter()
+    for args in args_list:
+        fn(*args)
+    per_op = (time.perf_counter() - start) / len(args_list) * 1e6
+    print(f"  {label:<22} {per_op:9.1f} us")
+
+
+def bench(name: str, store, n_users: int):
+    print(f"[{name}] {n_users:,} users")
+    start = time.perf_counter()
+    user_ids = []
+    for i in range(n_users):
+        user = store.create_user(f"user{i}", f"user{i}@test.com", "pw", f"user{i}", "2000-01-01")
+        store.add_plan(user['user_id'], make_plan(i))
+        user_ids.append(user['user_id'])
+    print(f"  {'load (signup+plan)':<22} {time.perf_counter() - start:9.2f} s")
+
+    today = date.today().isoformat()
+    picks = [random.randrange(n_users) for _ in range(OPS)]
+    timed("login", store.login, [(f"user{i}@test.com", "pw") for i in picks])
+    timed("get_day", store.get_day, [(user_ids[i], today) for i in picks])
+    timed("get_progress", store.get_progress, [(user_ids[i], today) for i in picks])
+    timed("update_task", store.update_task, [(user_ids[i], today, f"u{i}-d0-t1", True) for i in picks])
+    timed("add_plan", store.add_plan, [(user_ids[i], make_plan(i)) for i in picks[:200]])
+
+
+if __name__ == "__main__":
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    bench("memory", DataStore(), n_users)
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_store = SQLiteDataStore(os.path.join(tmp, "bench.db"))
+        bench("sqlite", sqlite_store, n_users)
+        print(f"  {'db size':<22} {os.path.getsize(os.path.join(tmp, 'bench.db')) / 1e6:9.1f} MB")
+        sqlite_store.close()
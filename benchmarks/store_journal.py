@@ -0,0 +1,74 @@
+# Backend/benchmarks/store_journal.py
+"""저널 저장소 콜드 스타트 벤치마크
+
+실행: python -m Backend.benchmarks.store_journal [사용자 수] [계획 일수] [스냅샷 이후 변경 수]
+사용자마다 계획 1개를 저장하고 스냅샷을 만든 뒤, 추가 변경(태스크 완료/로그인)을 저널에 남기고
+스냅샷 로드 + 저널 tail 재생에 걸리는 시간을 측정합니다.
+"""
+
+import sys
+import time
+import random
+import shutil
+import tempfile
+from datetime import date, timedelta
+
+from ..services.journal import JournaledDataStore
+
+
+def make_plan(user_index: int, days: int) -> dict:
+    start = date.today()
+    return {
+        "plan_name": "벤치마크 계획",
+        "total_duration": "4주",
+        "daily_schedule": [
+            {
+                "date": (start + timedelta(days=d)).isoformat(),
+                "tasks": [
+                    {"id": f"u{user_index}-d{d}-t{t}", "title": f"태스크 {d}-{t}", "duration": "1시간", "completed": False}
+                    for t in range(2)
+                ]
+            }
+            for d in range(days)
+        ]
+    }
+
+
+def main(n_users: int, days: int, tail: int):
+    directory = tempfile.mkdtemp()
+    try:
+        store = JournaledDataStore(directory, snapshot_interval=3600)
+        start = time.perf_counter()
+        user_ids = []
+        for i in range(n_users):
+            user = store.create_user(f"user{i}", f"user{i}@test.com", "pw", f"user{i}", "2000-01-01")
+            store.add_plan(user['user_id'], make_plan(i, days))
+            user_ids.append(user['user_id'])
+        print(f"load {n_users:,} users x {days}-day plans: {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        store.snapshot()
+        print(f"snapshot (background compaction): {time.perf_counter() - start:.2f} s")
+
+        today = date.today().isoformat()
+        for _ in range(tail):
+            i = random.randrange(n_users)
+            store.update_task(user_ids[i], today, f"u{i}-d0-t0", True)
+            store.login(f"user{i}@test.com", "pw")
+        store.close()
+        del store, user_ids
+
+        start = time.perf_counter()
+        restored = JournaledDataStore(directory, snapshot_interval=3600)
+        print(f"cold start (snapshot + {tail * 2:,} journal records): {time.perf_counter() - start:.2f} s")
+        restored.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    n_users = args[0] if len(args) > 0 else 100_000
+    days = args[1] if len(args) > 1 else 7
+    tail = args[2] if len(args) > 2 else 10_000
+    main(n_users, days, tail)
@@ -0,0 +1,44 @@
+# Backend/benchmarks/store_login.py
+"""DataStore 로그인/중복 확인 지연시간 벤치마크
+
+실행: python -m Backend.benchmarks.store_login [사용자 수 ...]
+기본값은 1천 ~ 100만 명이며, 사용자 수와 무관하게 지연시간이 일정해야 합니다.
+"""
+
+import sys
+import time
+import random
+
+from ..services.store import DataStore
+
+LOOKUPS = 10000
+
+
+def build_store(n_users: int) -> DataStore:
+    store = DataStore()
+    for i in range(n_users):
+        store.create_user(f"user{i}", f"user{i}@test.com", "pw", f"user{i}", "2000-01-01")
+    return store
+
+
+def bench(n_users: int):
+    store = build_store(n_users)
+    emails = [f"user{random.randrange(n_users)}@test.com" for _ in range(LOOKUPS)]
+
+    start = time.perf_counter()
+    for email in emails:
+        store.login(email, "pw")
+    login_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    start = time.perf_counter()
+    for email in emails:
+        store.create_user("dup", email, "pw", "dup", "2000-01-01")
+    dup_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    print(f"{n_users:>9,} users | login {login_us:7.2f} us | duplicate signup {dup_us:7.2f} us")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000]
+    for n in sizes:
+        bench(n)
@@ -6,12 +6,20 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from datetime import datetime
 
-from .utils.logger import Colors
-from .routers import auth, quiz, profile, home, plans, recommend, friends, notifications, review, plan_apply
+from .utils.logger import Colors, log_banner, log_info, flush_logs
+from .utils.compression import CompressionMiddleware
+from .utils.metrics import MetricsMiddleware, metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .routers import auth, quiz, profile, home, plans, recommend, friends, notifications, review, plan_apply, jobs, admin
+from .services import web_search, gpt_service
+from .services.jobs import job_queue
+from .services.store import store
+from .services.usage import usage_tracker
 
-app = FastAPI(title="Palearn API", version="1.0.0")
+# 큰 계획 응답도 빠르게 직렬화하도록 orjson 사용
+app = FastAPI(title="Palearn API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -22,6 +30,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 계획/추천/복습 자료처럼 큰 JSON 응답만 gzip/brotli 압축 (SSE는 제외)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 지연/상태 코드/진행 중 요청 수 (가장 바깥에서 측정, 결과는 /metrics)
+app.add_middleware(MetricsMiddleware, routes_app=app)
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(quiz.router)
@@ -33,6 +47,8 @@ app.include_router(friends.router)
 app.include_router(notifications.router)
 app.include_router(review.router)
 app.include_router(plan_apply.router)
+app.include_router(jobs.router)
+app.include_router(admin.router)
 
 
 @app.get("/health")
@@ -40,6 +56,12 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 메트릭 (워커 프로세스별 값)"""
+    return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/")
 async def root():
     return {"message": "Palearn API Server", "version": "1.0.0", "docs": "/docs"}
@@ -47,7 +69,12 @@ async def root():
 
 @app.on_event("startup")
 async def startup_event():
-    print(f"""
+    await web_search.init_http_client()
+    await job_queue.start()
+    await usage_tracker.start()
+
+    log_info("서버 시작: http://localhost:8000 (API 문서 /docs)")
+    log_banner(f"""
 {Colors.CYAN}{'='*70}
 
     ____        _
@@ -74,18 +101,39 @@ async def startup_event():
      friends.py     - 친구
      notifications.py - 알림
      review.py      - 복습 자료
+     jobs.py        - 백그라운드 작업 조회
+     admin.py       - 관리자 (GPT 사용량)
 
   services/
      store.py       - 데이터 저장소
+     sqlite_store.py - SQLite 저장소 (STORE_BACKEND=sqlite)
+     journal.py     - 저널/스냅샷 저장소 (STORE_BACKEND=journal)
      gpt_service.py - GPT 호출
+     json_extract.py - GPT 응답 JSON 추출
+     web_search.py  - 유튜브/블로그 검색
+     search_cache.py - 검색 결과 디스크 캐시
+     jobs.py        - 백그라운드 작업 큐
+     usage.py       - GPT 토큰 사용량/비용 집계
 
   utils/
      logger.py      - 로깅
+     compression.py - 응답 압축 (gzip/brotli)
+     metrics.py     - 지연 시간 메트릭 (/metrics)
 
 {Colors.CYAN}대기 중... Flutter 앱에서 요청을 보내주세요!{Colors.ENDC}
 """)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await job_queue.stop()
+    await usage_tracker.stop()
+    await web_search.close_http_client()
+    gpt_service.response_cache.close()
+    store.close()
+    flush_logs()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,8 +1,9 @@
 # Backend/models/schemas.py
 """Pydantic 모델 정의"""
 
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Union
+from typing_extensions import Annotated
 
 
 class SignupRequest(BaseModel):
@@ -66,3 +67,64 @@ class ApplyRecommendationRequest(BaseModel):
     hourPerDay: float
     startDate: str
     restDays: List[str]
+
+
+# ───────── 응답 모델 ─────────
+# GPT가 만든 데이터를 그대로 담으므로 선언하지 않은 필드도 유지합니다 (extra="allow").
+# 라우터는 response_model_exclude_unset=True로 응답해, 원본에 없던 필드는 null로 추가되지 않습니다.
+# GPT에서 온 필드는 모두 기본값이 있고 형식을 강제하지 않습니다 (숫자 title, 목록이 아닌 tasks 등).
+# 이미 저장된 데이터 때문에 응답 검증 오류(500)가 나지 않도록, 형식이 맞지 않는 값은 그대로 전달합니다.
+
+
+def Loose(tp):
+    """tp로 검증하되 실패하면 값을 그대로 통과 (왼쪽부터 시도)"""
+    return Annotated[Union[tp, Any], Field(union_mode="left_to_right")]
+
+
+class Material(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    title: Any = None
+    type: Any = None
+    url: Any = None
+    description: Any = None
+
+
+class PlanTask(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    id: Any = None
+    title: Any = None
+    description: Any = None
+    duration: Any = None
+    completed: Any = False
+    related_materials: Loose(List[Loose(Material)]) = None
+    review_materials: Loose(List[Loose(Material)]) = None
+
+
+class PlanDay(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    date: Any = None
+    tasks: Loose(List[Loose(PlanTask)]) = None
+
+
+class Plan(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    plan_name: Any = None
+    total_duration: Any = None
+    daily_schedule: Loose(List[Loose(PlanDay)]) = None
+
+
+class PlanDateResponse(BaseModel):
+    date: str
+    tasks: Loose(List[Loose(PlanTask)]) = None
+    plan_name: Any = None
+    message: Optional[str] = None
+
+
+class ApplyRecommendationResponse(BaseModel):
+    success: bool
+    plan: Loose(Plan) = None
+    message: Optional[str] = None
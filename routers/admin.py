@@ -0,0 +1,44 @@
+# Backend/routers/admin.py
+"""관리자용 라우터 - GPT 토큰 사용량/비용 조회"""
+
+import os
+import hmac
+from fastapi import APIRouter, HTTPException, Header, Query
+from dotenv import load_dotenv
+
+from ..services.usage import usage_tracker
+from ..utils.logger import log_request
+
+load_dotenv()
+
+# 비어 있으면 관리자 엔드포인트 비활성화
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def _check_admin(token: str):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다.")
+
+
+@router.get("/usage")
+async def get_usage(
+    group_by: str = Query("site", pattern="^(site|model|user)$"),
+    limit: int = Query(None, ge=1, le=1000),
+    flush: bool = False,
+    x_admin_token: str = Header(None)
+):
+    """GPT 토큰 사용량/예상 비용 (이 워커 프로세스 시작 이후, 비용이 큰 순서)
+
+    - group_by: site(호출 위치) | model | user
+    - flush=true: 대기 중인 증가분을 바로 파일에 기록
+    """
+    _check_admin(x_admin_token)
+    log_request("GET /admin/usage", "admin", f"group_by={group_by}")
+
+    if flush:
+        usage_tracker.flush()
+    return usage_tracker.summary(group_by, limit)
@@ -2,20 +2,27 @@
 """인증 관련 라우터"""
 
 from fastapi import APIRouter, HTTPException, Depends, Header
-from typing import Dict
-import uuid
+from typing import Dict, Optional
 
 from ..models.schemas import SignupRequest, LoginRequest
-from ..services.store import store
+from ..services.store import store, astore
+from ..services.usage import set_usage_user
 from ..utils.logger import log_request, log_stage, log_success, log_error, log_navigation
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 async def get_current_user(authorization: str = Header(None)) -> Dict:
-    """현재 인증된 사용자 가져오기"""
+    """현재 인증된 사용자 가져오기 (GPT 토큰 사용량도 이 사용자로 집계)"""
+    user = await astore.run(_resolve_user, authorization)
+    set_usage_user(user['user_id'])
+    return user
+
+
+def _resolve_user(authorization: Optional[str]) -> Dict:
     if not authorization:
-        if not store.users:
+        default_user = store.get_default_user()
+        if not default_user:
             test_user = store.create_user(
                 username="admin",
                 email="admin@test.com",
@@ -23,10 +30,12 @@ async def get_current_user(authorization: str = Header(None)) -> Dict:
                 name="admin",
                 birth="2000-01-01"
             )
-            token = str(uuid.uuid4())
-            store.tokens[token] = test_user['user_id']
+            if not test_user:
+                # 다른 워커가 먼저 생성한 경우
+                return store.get_default_user()
+            store.issue_token(test_user['user_id'])
             return test_user
-        return list(store.users.values())[0]
+        return default_user
 
     token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
     user = store.get_user_by_token(token)
@@ -42,7 +51,7 @@ async def signup(request: SignupRequest):
     log_request("POST /auth/signup", request.name, f"email={request.email}")
     log_stage(1, "회원가입", request.name)
 
-    user = store.create_user(
+    user = await astore.create_user(
         username=request.username,
         email=request.email,
         password=request.password,
@@ -69,7 +78,7 @@ async def login(request: LoginRequest):
     log_request("POST /auth/login", request.email)
     log_stage(2, "로그인", request.email)
 
-    result = store.login(request.email, request.password)
+    result = await astore.login(request.email, request.password)
 
     if not result:
         log_error(f"로그인 실패: {request.email}")
@@ -93,7 +102,7 @@ async def logout(current_user: Dict = Depends(get_current_user), authorization:
 
     if authorization:
         token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
-        store.logout(token)
+        await astore.logout(token)
 
     log_success(f"로그아웃 완료: {current_user['name']}")
     return {"success": True}
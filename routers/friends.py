@@ -1,50 +1,51 @@
 # Backend/routers/friends.py
 """친구 관련 라우터"""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from typing import Dict
 from datetime import date, datetime
 
 from ..models.schemas import AddFriendRequest, CheckFriendPlanRequest
-from ..services.store import store
+from ..services.store import store, astore
 from ..utils.logger import log_request, log_stage, log_success, log_error, log_navigation
+from ..utils.etag import check_not_modified
 from .auth import get_current_user
 
 router = APIRouter(prefix="/friends", tags=["Friends"])
 
 
 @router.get("")
-async def get_friends(current_user: Dict = Depends(get_current_user)):
+async def get_friends(request: Request, response: Response, current_user: Dict = Depends(get_current_user)):
+    user_id = current_user['user_id']
+    friend_ids = await astore.get_friend_ids(user_id)
+    today_str = date.today().isoformat()
+
+    # 친구의 이름/사진/오늘 진행률도 포함되므로 친구들의 변경 카운터까지 반영
+    versions = await astore.get_versions([user_id, *friend_ids])
+    not_modified = check_not_modified(
+        request, response, store.epoch, today_str, *(f"{uid}:{v}" for uid, v in versions.items())
+    )
+    if not_modified:
+        return not_modified
+
     log_request("GET /friends", current_user['name'])
     log_stage(8, "친구 목록", current_user['name'])
     log_navigation(current_user['name'], "친구 화면")
 
-    user_id = current_user['user_id']
-    friend_ids = store.friendships.get(user_id, [])
+    return await astore.run(_friend_rows, friend_ids, today_str)
+
 
+def _friend_rows(friend_ids, today_str: str):
     friends = []
     for fid in friend_ids:
-        friend = store.users.get(fid)
+        friend = store.get_user(fid)
         if friend:
-            today_rate = 0
-            friend_plans = store.plans.get(fid, [])
-            if friend_plans:
-                current_plan = friend_plans[-1]
-                today_str = date.today().isoformat()
-                for day in current_plan.get('daily_schedule', []):
-                    if day['date'] == today_str:
-                        total = len(day['tasks'])
-                        completed = sum(1 for t in day['tasks'] if t.get('completed', False))
-                        today_rate = int((completed / total * 100) if total > 0 else 0)
-                        break
-
             friends.append({
                 "id": fid,
                 "name": friend['name'],
                 "avatarUrl": friend.get('photo_url'),
-                "todayRate": today_rate
+                "todayRate": store.get_progress(fid, today_str)
             })
-
     return friends
 
 
@@ -55,7 +56,7 @@ async def add_friend(request: AddFriendRequest, current_user: Dict = Depends(get
     user_id = current_user['user_id']
     friend_code = request.code.upper()
 
-    friend_id = store.friend_codes.get(friend_code)
+    friend_id = await astore.get_user_id_by_friend_code(friend_code)
 
     if not friend_id:
         log_error(f"친구 코드 없음: {friend_code}")
@@ -64,14 +65,13 @@ async def add_friend(request: AddFriendRequest, current_user: Dict = Depends(get
     if friend_id == user_id:
         raise HTTPException(status_code=400, detail="자기 자신은 친구로 추가할 수 없습니다.")
 
-    if friend_id in store.friendships[user_id]:
+    if await astore.are_friends(user_id, friend_id):
         raise HTTPException(status_code=400, detail="이미 친구입니다.")
 
-    store.friendships[user_id].append(friend_id)
-    store.friendships[friend_id].append(user_id)
+    await astore.add_friendship(user_id, friend_id)
 
-    friend = store.users.get(friend_id)
-    store.notifications[friend_id]['new'].append(f"{current_user['name']}님이 친구로 추가했습니다.")
+    friend = await astore.get_user(friend_id)
+    await astore.add_notification(friend_id, f"{current_user['name']}님이 친구로 추가했습니다.")
 
     log_success(f"친구 추가 완료: {friend['name']}")
 
@@ -94,25 +94,19 @@ async def get_friend_plans(
 ):
     user_id = current_user['user_id']
 
-    if friend_id not in store.friendships.get(user_id, []):
+    if not await astore.are_friends(user_id, friend_id):
         raise HTTPException(status_code=403, detail="친구가 아닙니다.")
 
-    friend_plans = store.plans.get(friend_id, [])
+    target_date = date or datetime.today().date().isoformat()
+    day = await astore.get_day(friend_id, target_date)
 
-    if not friend_plans:
+    if not day:
         return []
 
-    current_plan = friend_plans[-1]
-    target_date = date or datetime.today().isoformat()
-
-    for day in current_plan.get('daily_schedule', []):
-        if day['date'] == target_date:
-            return [
-                {"id": task['id'], "title": task['title'], "done": task.get('completed', False)}
-                for task in day['tasks']
-            ]
-
-    return []
+    return [
+        {"id": task['id'], "title": task['title'], "done": task.get('completed', False)}
+        for task in day['tasks']
+    ]
 
 
 @router.post("/{friend_id}/plans/check")
@@ -121,11 +115,9 @@ async def check_friend_plan(
     request: CheckFriendPlanRequest,
     current_user: Dict = Depends(get_current_user)
 ):
-    friend = store.users.get(friend_id)
+    friend = await astore.get_user(friend_id)
     if friend:
-        store.notifications[friend_id]['new'].append(
-            f"{current_user['name']}님이 응원합니다! 💪"
-        )
+        await astore.add_notification(friend_id, f"{current_user['name']}님이 응원합니다! 💪")
         log_success(f"{current_user['name']} → {friend['name']} 응원 전송")
 
     return {"success": True}
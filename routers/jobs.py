@@ -0,0 +1,42 @@
+# Backend/routers/jobs.py
+"""백그라운드 작업 조회 라우터"""
+
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
+from typing import Any, Awaitable, Callable, Dict
+
+from ..services.jobs import job_queue, JobQueueFull
+from ..utils.logger import log_request, log_info
+from .auth import get_current_user
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# long-poll 최대 대기 시간 (초)
+MAX_WAIT_SECONDS = 30
+
+
+def submit_job(kind: str, current_user: Dict, work: Callable[[], Awaitable[Any]]) -> ORJSONResponse:
+    """작업을 큐에 넣고 202 + 작업 정보 반환 (대기열이 가득 차면 503)"""
+    try:
+        job = job_queue.submit(kind, current_user['user_id'], work)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "10"})
+    log_info(f"백그라운드 작업 등록: {kind} ({job.id})")
+    return ORJSONResponse(status_code=202, content=job.to_dict())
+
+
+@router.get("/stats")
+async def get_job_stats(current_user: Dict = Depends(get_current_user)):
+    """작업 큐 상태 (대기열 길이, 종류별 대기/실행 시간)"""
+    return job_queue.stats()
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, wait: float = 0, current_user: Dict = Depends(get_current_user)):
+    """작업 상태/결과 조회 - wait초 동안 완료를 기다림 (long-poll, 최대 30초)"""
+    log_request(f"GET /jobs/{job_id}", current_user['name'])
+
+    job = await job_queue.fetch(job_id, current_user['user_id'], min(max(wait, 0), MAX_WAIT_SECONDS))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
@@ -1,24 +1,29 @@
 # Backend/routers/notifications.py
 """알림 관련 라우터"""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from typing import Dict
 
-from ..services.store import store
+from ..services.store import store, astore
 from ..utils.logger import log_request, log_stage, log_success, log_navigation
+from ..utils.etag import check_not_modified
 from .auth import get_current_user
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 @router.get("")
-async def get_notifications(current_user: Dict = Depends(get_current_user)):
+async def get_notifications(request: Request, response: Response, current_user: Dict = Depends(get_current_user)):
+    user_id = current_user['user_id']
+    not_modified = check_not_modified(request, response, store.epoch, user_id, await astore.get_version(user_id))
+    if not_modified:
+        return not_modified
+
     log_request("GET /notifications", current_user['name'])
     log_stage(9, "알림 확인", current_user['name'])
     log_navigation(current_user['name'], "알림 화면")
 
-    user_id = current_user['user_id']
-    notifications = store.notifications.get(user_id, {'new': [], 'old': []})
+    notifications = await astore.get_notifications(user_id)
 
     return {
         "new_alerts": notifications['new'],
@@ -28,11 +33,7 @@ async def get_notifications(current_user: Dict = Depends(get_current_user)):
 
 @router.post("/read")
 async def mark_notifications_read(current_user: Dict = Depends(get_current_user)):
-    user_id = current_user['user_id']
-    notifications = store.notifications.get(user_id, {'new': [], 'old': []})
-
-    notifications['old'] = notifications['new'] + notifications['old']
-    notifications['new'] = []
+    await astore.mark_notifications_read(current_user['user_id'])
 
     log_success("알림 읽음 처리 완료")
     return {"success": True}
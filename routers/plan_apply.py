@@ -3,21 +3,37 @@
 
 from fastapi import APIRouter, Depends
 from typing import Dict
+from functools import partial
 import uuid
 
-from ..models.schemas import ApplyRecommendationRequest
-from ..services.store import store
+from ..models.schemas import ApplyRecommendationRequest, ApplyRecommendationResponse
+from ..services.store import astore
 from ..services.gpt_service import call_gpt, extract_json
+from ..services.jobs import report_progress
 from ..utils.logger import log_request, log_success, log_error, log_navigation
 from .auth import get_current_user
+from .jobs import submit_job
 
 router = APIRouter(prefix="/plan", tags=["Plan"])
 
 
-@router.post("/apply_recommendation")
-async def apply_recommendation(request: ApplyRecommendationRequest, current_user: Dict = Depends(get_current_user)):
+@router.post(
+    "/apply_recommendation", response_model=ApplyRecommendationResponse, response_model_exclude_unset=True
+)
+async def apply_recommendation(
+    request: ApplyRecommendationRequest,
+    background: bool = False,
+    current_user: Dict = Depends(get_current_user)
+):
+    """선택한 강좌 기반 계획 생성 - background=true면 작업 id를 바로 반환"""
     log_request("POST /plan/apply_recommendation", current_user['name'])
 
+    if background:
+        return submit_job("plan_apply_recommendation", current_user, partial(_apply_recommendation, request, current_user))
+    return await _apply_recommendation(request, current_user)
+
+
+async def _apply_recommendation(request: ApplyRecommendationRequest, current_user: Dict) -> Dict:
     user_id = current_user['user_id']
     course = request.selected_course
     syllabus = course.get('syllabus', [])
@@ -57,7 +73,8 @@ async def apply_recommendation(request: ApplyRecommendationRequest, current_user
 ```
 """
 
-    response = call_gpt(prompt, use_search=False)
+    report_progress("계획 생성")
+    response = await call_gpt(prompt, use_search=False, site="plan_apply")
     data = extract_json(response)
 
     if data and 'daily_schedule' in data:
@@ -68,7 +85,7 @@ async def apply_recommendation(request: ApplyRecommendationRequest, current_user
                 if 'completed' not in task:
                     task['completed'] = False
 
-        store.plans[user_id].append(data)
+        await astore.add_plan(user_id, data)
         log_success("추천 기반 계획 생성 완료")
         log_navigation(current_user['name'], "홈 화면")
         return {"success": True, "plan": data}
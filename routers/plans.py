@@ -1,35 +1,116 @@
 # Backend/routers/plans.py
 """학습 계획 관련 라우터"""
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional, AsyncIterator
 from datetime import datetime, date, timedelta
+from functools import partial
+import asyncio
+import json
+import time
 import uuid
 
-from ..models.schemas import PlanGenerateRequest, ApplyRecommendationRequest
-from ..services.store import store
-from ..services.gpt_service import call_gpt, extract_json
-from ..services.web_search import search_materials_for_topic
-from ..utils.logger import log_request, log_stage, log_success, log_navigation, log_info
+from ..models.schemas import PlanGenerateRequest, ApplyRecommendationRequest, Plan, PlanDateResponse
+from ..services.store import store, astore
+from ..services.gpt_service import (
+    call_gpt, stream_gpt, extract_json, ScheduleStreamParser, GPTCallError, CACHE_TTL_MATERIALS, json_with_key
+)
+from ..services.web_search import batch_search_materials, MaterialSearcher
+from ..services.plan_builder import (
+    PLAN_GENERATION_MODE, PLAN_WEEKS, parse_start_date, study_dates, merge_week_schedules
+)
+from ..services.jobs import report_progress
+from ..services.search_status import search_status
+from ..utils.logger import log_request, log_stage, log_success, log_navigation, log_info, log_error
+from ..utils.etag import check_not_modified
 from .auth import get_current_user
+from .jobs import submit_job
 
 router = APIRouter(prefix="/plans", tags=["Plans"])
 
 
-@router.get("/all")
-async def get_all_plans(current_user: Dict = Depends(get_current_user)):
-    """사용자의 모든 학습 계획 목록 조회"""
-    log_request("GET /plans/all", current_user['name'])
+# 연관/복습 자료 필드 (/plans/all?materials=false로 제외)
+MATERIAL_FIELDS = ('related_materials', 'review_materials')
+
+
+@router.get("/all", response_model=List[Plan], response_model_exclude_unset=True)
+async def get_all_plans(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    materials: bool = True,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    current_user: Dict = Depends(get_current_user)
+):
+    """사용자의 모든 학습 계획 목록 조회
 
+    - fields: 태스크에 남길 필드 (쉼표 구분, 예: title,completed - id는 항상 포함)
+    - materials=false: 연관/복습 자료 제외
+    - offset/limit: 계획 단위 페이지네이션 (전체 개수는 X-Total-Count 헤더)
+    - start/end: daily_schedule 날짜 범위 (YYYY-MM-DD, 양 끝 포함)
+    """
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
+    not_modified = check_not_modified(
+        request, response, store.epoch, user_id, await astore.get_version(user_id), request.url.query
+    )
+    if not_modified:
+        return not_modified
+
+    log_request("GET /plans/all", current_user['name'])
 
-    return plans
+    plans = await astore.get_plans(user_id, offset, limit)
+    response.headers["X-Total-Count"] = str(await astore.count_plans(user_id))
+
+    task_fields = None
+    if fields:
+        task_fields = {f.strip() for f in fields.split(',') if f.strip()} | {'id'}
+    if task_fields is None and materials and start is None and end is None:
+        return plans
+
+    return [
+        _project_plan(
+            plan, task_fields, materials,
+            start.isoformat() if start else None, end.isoformat() if end else None
+        )
+        for plan in plans
+    ]
+
+
+def _project_plan(
+    plan: Dict, task_fields: Optional[set], materials: bool, start: Optional[str], end: Optional[str]
+) -> Dict:
+    """저장된 계획을 바꾸지 않고 날짜 범위/태스크 필드만 골라 복사"""
+    days = []
+    for day in plan.get('daily_schedule', []):
+        if start or end:
+            # 날짜가 없거나 문자열이 아닌 날은 범위 조회에서 제외
+            day_date = day.get('date')
+            if not isinstance(day_date, str) or (start and day_date < start) or (end and day_date > end):
+                continue
+        tasks = [
+            {
+                k: v for k, v in task.items()
+                if (task_fields is None or k in task_fields) and (materials or k not in MATERIAL_FIELDS)
+            }
+            for task in day['tasks']
+        ]
+        days.append({**day, 'tasks': tasks})
+    return {**plan, 'daily_schedule': days}
 
 
 @router.get("/related_materials")
-async def get_related_materials(topic: str, current_user: Dict = Depends(get_current_user)):
-    """특정 학습 주제에 대한 연관 자료 검색"""
+async def get_related_materials(
+    topic: str,
+    response: Response,
+    refresh: bool = False,
+    search_id: Optional[str] = None,
+    current_user: Dict = Depends(get_current_user)
+):
+    """특정 학습 주제에 대한 연관 자료 검색 - 진행 상태는 /recommend/search_status?search_id=로 조회"""
     log_request("GET /plans/related_materials", current_user['name'], f"topic={topic}")
     
     #------------------------------
@@ -94,8 +175,13 @@ async def get_related_materials(topic: str, current_user: Dict = Depends(get_cur
 
 
 
-    response = call_gpt(prompt, use_search=True)
-    data = extract_json(response)
+    search_id = search_status.start(current_user['user_id'], search_id)
+    response.headers["X-Search-Id"] = search_id
+    content = await call_gpt(
+        prompt, use_search=True, cache_ttl=CACHE_TTL_MATERIALS, use_cache=not refresh, search_id=search_id,
+        site="related_materials", cache_if=json_with_key('materials')
+    )
+    data = extract_json(content)
 
     if data and 'materials' in data:
         valid_materials = [m for m in data['materials'] if 'example' not in m.get('url', '').lower()]
@@ -114,34 +200,37 @@ async def get_related_materials(topic: str, current_user: Dict = Depends(get_cur
     }
 
 
-@router.get("")
-async def get_plans(scope: str = "daily", current_user: Dict = Depends(get_current_user)):
-    log_request("GET /plans", current_user['name'], f"scope={scope}")
-
+@router.get("", response_model=List[str])
+async def get_plans(
+    request: Request,
+    response: Response,
+    scope: str = "daily",
+    current_user: Dict = Depends(get_current_user)
+):
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
+    today = date.today()
+    not_modified = check_not_modified(
+        request, response, store.epoch, user_id, await astore.get_version(user_id), today, scope
+    )
+    if not_modified:
+        return not_modified
 
-    if not plans:
+    log_request("GET /plans", current_user['name'], f"scope={scope}")
+
+    if scope == "daily":
+        start = end = today
+    elif scope == "weekly":
+        start = today - timedelta(days=today.weekday())
+        end = start + timedelta(days=6)
+    elif scope == "monthly":
+        start = today.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    else:
         return []
 
-    current_plan = plans[-1]
-    today = date.today()
     result = []
-
-    if 'daily_schedule' in current_plan:
-        for day in current_plan['daily_schedule']:
-            day_date = datetime.strptime(day['date'], '%Y-%m-%d').date()
-
-            if scope == "daily" and day_date == today:
-                result.extend([task['title'] for task in day['tasks']])
-            elif scope == "weekly":
-                week_start = today - timedelta(days=today.weekday())
-                week_end = week_start + timedelta(days=6)
-                if week_start <= day_date <= week_end:
-                    result.extend([task['title'] for task in day['tasks']])
-            elif scope == "monthly":
-                if day_date.year == today.year and day_date.month == today.month:
-                    result.extend([task['title'] for task in day['tasks']])
+    for day in await astore.get_days_between(user_id, start.isoformat(), end.isoformat()):
+        result.extend([task['title'] for task in day['tasks']])
 
     return result
 
@@ -149,21 +238,14 @@ async def get_plans(scope: str = "daily", current_user: Dict = Depends(get_curre
 @router.get("/review")
 async def get_review_plans(current_user: Dict = Depends(get_current_user)):
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
-
-    if not plans:
-        return []
-
-    current_plan = plans[-1]
     yesterday = (date.today() - timedelta(days=1)).isoformat()
 
     result = []
-    if 'daily_schedule' in current_plan:
-        for day in current_plan['daily_schedule']:
-            if day['date'] == yesterday:
-                for task in day['tasks']:
-                    if task.get('completed', False):
-                        result.append({"title": task['title'], "id": task.get('id', str(uuid.uuid4()))})
+    day = await astore.get_day(user_id, yesterday)
+    if day:
+        for task in day['tasks']:
+            if task.get('completed', False):
+                result.append({"title": task['title'], "id": task.get('id', str(uuid.uuid4()))})
 
     return result
 
@@ -174,38 +256,26 @@ async def get_yesterday_review(current_user: Dict = Depends(get_current_user)):
     log_request("GET /plans/yesterday_review", current_user['name'])
 
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
-
-    if not plans:
-        return {"has_review": False, "materials": [], "yesterday_topic": ""}
-
-    current_plan = plans[-1]
     yesterday = (date.today() - timedelta(days=1)).isoformat()
 
     # 어제 학습한 내용 찾기
-    yesterday_topics = []
-    if 'daily_schedule' in current_plan:
-        for day in current_plan['daily_schedule']:
-            if day['date'] == yesterday:
-                for task in day['tasks']:
-                    yesterday_topics.append(task.get('title', ''))
-
-    if not yesterday_topics:
+    day = await astore.get_day(user_id, yesterday)
+    yesterday_tasks = day['tasks'] if day else []
+
+    if not yesterday_tasks:
         return {"has_review": False, "materials": [], "yesterday_topic": ""}
 
     # 첫 번째 토픽으로 복습 자료 검색
-    topic = yesterday_topics[0]
+    topic = yesterday_tasks[0].get('title', '')
 
     # 태스크에 미리 저장된 복습 자료가 있는지 확인
-    for day in current_plan.get('daily_schedule', []):
-        if day['date'] == yesterday:
-            for task in day['tasks']:
-                if task.get('review_materials'):
-                    return {
-                        "has_review": True,
-                        "materials": task['review_materials'][:2],  # 유튜브 1 + 블로그 1
-                        "yesterday_topic": topic
-                    }
+    for task in yesterday_tasks:
+        if task.get('review_materials'):
+            return {
+                "has_review": True,
+                "materials": task['review_materials'][:2],  # 유튜브 1 + 블로그 1
+                "yesterday_topic": topic
+            }
 
     # 없으면 기본 검색 링크 반환
     search_query = topic.replace(' ', '+')
@@ -219,32 +289,20 @@ async def get_yesterday_review(current_user: Dict = Depends(get_current_user)):
     }
 
 
-def _get_materials_for_task(topic: str) -> dict:
-    """태스크에 대한 학습 자료 검색 (웹 검색 API 사용)"""
-    try:
-        return search_materials_for_topic(topic)
-    except Exception as e:
-        log_info(f"웹 검색 실패, 기본 URL 사용: {e}")
-        # 실패 시 기본 검색 URL
-        from urllib.parse import quote_plus
-        search_query = quote_plus(topic)
-        default_materials = [
-            {"title": f"{topic} 강의 영상", "type": "유튜브", "url": f"https://www.youtube.com/results?search_query={search_query}+강의", "description": "유튜브에서 검색"},
-            {"title": f"{topic} 블로그 글", "type": "블로그", "url": f"https://www.google.com/search?q={search_query}+블로그", "description": "구글에서 검색"},
-        ]
-        return {
-            "related_materials": default_materials,
-            "review_materials": default_materials
-        }
-
-
-@router.post("/generate")
-async def generate_plan(request: PlanGenerateRequest, current_user: Dict = Depends(get_current_user)):
-    log_request("POST /plans/generate", current_user['name'], f"skill={request.skill}")
-    log_stage(7, "계획 생성", current_user['name'])
+async def _attach_materials(tasks: List[Dict], default_topic: str):
+    """태스크 목록에 학습 자료(related/review)를 채움 - 같은 제목은 한 번만 검색"""
+    if not tasks:
+        return
+    topics = [str(task.get('title') or default_topic) for task in tasks]
+    materials_by_topic = await batch_search_materials(topics)
+    for task, topic in zip(tasks, topics):
+        materials = materials_by_topic[topic]
+        task['related_materials'] = list(materials.get('related_materials', []))
+        task['review_materials'] = list(materials.get('review_materials', []))
 
-    user_id = current_user['user_id']
 
+def _build_plan_prompt(request: PlanGenerateRequest) -> str:
+    """4주 학습 계획 생성 프롬프트"""
     #------------------------------
     # 프롬포트 수정
     #------------------------------
@@ -327,31 +385,139 @@ async def generate_plan(request: PlanGenerateRequest, current_user: Dict = Depen
 
 위 규칙을 모두 지킨 하나의 JSON 객체만 출력하세요.
 """
+    return prompt
 
 
-    response = call_gpt(prompt, use_search=False)
-    data = extract_json(response)
+def _build_outline_prompt(request: PlanGenerateRequest, week_dates: List[List[str]]) -> str:
+    """주차별 생성용 4주 커리큘럼 개요 프롬프트 (짧은 출력)"""
+    week_lines = "\n".join(
+        f"- {i + 1}주차: 학습일 {len(dates)}일" for i, dates in enumerate(week_dates)
+    )
+    return f"""[시스템 지시]
+당신은 개인 맞춤형 학습 플래너입니다.
+아래 정보를 바탕으로 4주짜리 학습 커리큘럼의 **주차별 개요**만 설계합니다. **오직 JSON만** 출력하세요.
 
-    if data and 'daily_schedule' in data:
-        log_info("학습 자료 검색 시작...")
-        for day in data['daily_schedule']:
-            for task in day['tasks']:
-                if 'id' not in task:
-                    task['id'] = str(uuid.uuid4())
-                if 'completed' not in task:
-                    task['completed'] = False
-                # 각 태스크에 연관 자료 미리 추가 (웹 검색 API 사용)
-                if 'related_materials' not in task or 'review_materials' not in task:
-                    materials = _get_materials_for_task(task.get('title', request.skill))
-                    task['related_materials'] = materials.get('related_materials', [])
-                    task['review_materials'] = materials.get('review_materials', [])
-
-        store.plans[user_id].append(data)
-        log_success(f"학습 계획 생성 완료: {data.get('plan_name', 'Unknown')}")
-        log_navigation(current_user['name'], "퀴즈 화면")
-        return data
+[입력 정보]
+- 스킬(skill): "{request.skill}"
+- 하루 공부 시간(hourPerDay): {request.hourPerDay}시간
+- 학습자 수준(selfLevel): {request.selfLevel}
+- 주차별 학습일 수:
+{week_lines}
+
+[규칙]
+- 초반에는 기초 개념 → 중반에 응용/실습 → 후반에 프로젝트/정리 순서로 구성합니다.
+- 각 주차의 topics 개수는 그 주차의 학습일 수와 같아야 하며, 하루에 하나씩 배정됩니다.
+- topics는 "파이썬 리스트와 튜플 개념 정리"처럼 구체적인 학습 주제로 작성합니다.
+
+[출력 형식]
+{{
+  "plan_name": "{request.skill} 학습 계획",
+  "weeks": [
+    {{"week": 1, "theme": "주차 목표", "topics": ["1일차 주제", "2일차 주제"]}}
+  ]
+}}
+
+마크다운 코드블록 없이 하나의 JSON 객체만 출력하세요.
+"""
 
-    # 기본 계획 생성
+
+def _build_week_prompt(
+    request: PlanGenerateRequest, week: int, dates: List[str], themes: List[str], topics: List[str]
+) -> str:
+    """주차별 생성용 상세 일정 프롬프트 - 해당 주차의 날짜만 작성"""
+    curriculum = "\n".join(f"- {i + 1}주차: {theme}" for i, theme in enumerate(themes))
+    day_lines = "\n".join(
+        f"- {day_date}: {topics[i] if i < len(topics) else themes[week]}" for i, day_date in enumerate(dates)
+    )
+    return f"""[시스템 지시]
+당신은 개인 맞춤형 학습 플래너입니다.
+4주 커리큘럼 중 **{week + 1}주차**의 날짜별 상세 일정만 작성합니다. **오직 JSON만** 출력하세요.
+
+[입력 정보]
+- 스킬(skill): "{request.skill}"
+- 하루 공부 시간(hourPerDay): {request.hourPerDay}시간
+- 학습자 수준(selfLevel): {request.selfLevel}
+
+[전체 커리큘럼]
+{curriculum}
+
+[{week + 1}주차 날짜별 주제]
+{day_lines}
+
+[규칙]
+- daily_schedule에는 위에 나열된 날짜만, 같은 순서로 한 번씩 포함합니다.
+- 하루에 2~3개의 구체적인 태스크를 배정하고, 각 날짜의 duration 총합은 **반드시 {request.hourPerDay}시간 이하**여야 합니다.
+- title은 그날의 구체적인 학습 내용, description은 학습 방법이나 범위를 1~2문장으로 작성합니다.
+- duration은 "30분", "1시간", "1시간 30분"처럼 작성하고, completed는 항상 false입니다.
+
+[출력 형식]
+{{
+  "daily_schedule": [
+    {{
+      "date": "YYYY-MM-DD",
+      "tasks": [
+        {{"id": "고유 문자열", "title": "...", "description": "...", "duration": "1시간", "completed": false}}
+      ]
+    }}
+  ]
+}}
+
+마크다운 코드블록 없이 하나의 JSON 객체만 출력하세요.
+"""
+
+
+async def _generate_sharded_plan(request: PlanGenerateRequest) -> Dict:
+    """개요 1회 + 주차별 병렬 GPT 호출로 계획 생성 후 날짜 순 병합"""
+    week_dates = study_dates(parse_start_date(request.startDate), request.restDays)
+
+    outline = extract_json(await call_gpt(_build_outline_prompt(request, week_dates), site="plan_outline"))
+    weeks = outline.get('weeks') if outline else None
+    if not isinstance(weeks, list) or len(weeks) < PLAN_WEEKS:
+        log_info("커리큘럼 개요 생성 실패, 기본 주차 구성 사용")
+        outline = {}
+        weeks = [{} for _ in range(PLAN_WEEKS)]
+
+    # dict가 아닌 주차 항목이나 목록이 아닌 topics는 기본값 사용
+    weeks = [w if isinstance(w, dict) else {} for w in weeks[:PLAN_WEEKS]]
+    themes = [str(w.get('theme') or f"{request.skill} {i + 1}주차 학습") for i, w in enumerate(weeks)]
+    week_topics = [
+        [str(t) for t in (w.get('topics') if isinstance(w.get('topics'), list) else []) if t] or [themes[i]]
+        for i, w in enumerate(weeks)
+    ]
+
+    log_info(f"주차별 상세 일정 병렬 생성: {PLAN_WEEKS}개")
+    responses = await asyncio.gather(*[
+        call_gpt(_build_week_prompt(request, i, week_dates[i], themes, week_topics[i]), site="plan_week")
+        for i in range(PLAN_WEEKS)
+    ])
+    week_schedules = []
+    for response in responses:
+        data = extract_json(response)
+        schedule = data.get('daily_schedule') if data else None
+        week_schedules.append(schedule if isinstance(schedule, list) else None)
+
+    return {
+        "plan_name": outline.get('plan_name') or f"{request.skill} 학습 계획",
+        "total_duration": "4주",
+        "daily_schedule": merge_week_schedules(week_dates, week_schedules, week_topics, request.hourPerDay)
+    }
+
+
+def _prepare_tasks(day: Dict) -> List[Dict]:
+    """GPT가 만든 day의 태스크 기본값 채움 - 학습 자료가 필요한 태스크 목록 반환"""
+    pending_tasks = []
+    for task in day['tasks']:
+        if 'id' not in task:
+            task['id'] = str(uuid.uuid4())
+        if 'completed' not in task:
+            task['completed'] = False
+        if 'related_materials' not in task or 'review_materials' not in task:
+            pending_tasks.append(task)
+    return pending_tasks
+
+
+def _default_plan(request: PlanGenerateRequest) -> Dict:
+    """GPT 실패 시 기본 계획 (학습 자료 제외)"""
     start = datetime.strptime(request.startDate.split('T')[0], '%Y-%m-%d').date()
     schedule = []
     day_names = ['월', '화', '수', '목', '금', '토', '일']
@@ -364,7 +530,6 @@ async def generate_plan(request: PlanGenerateRequest, current_user: Dict = Depen
             continue
 
         task_title = f"{request.skill} 학습 Day {len(schedule) + 1}"
-        materials = _get_materials_for_task(task_title)
         schedule.append({
             "date": current_date.isoformat(),
             "tasks": [
@@ -373,25 +538,183 @@ async def generate_plan(request: PlanGenerateRequest, current_user: Dict = Depen
                     "title": task_title,
                     "description": f"{request.skill} 학습을 진행합니다.",
                     "duration": f"{request.hourPerDay}시간",
-                    "completed": False,
-                    "related_materials": materials.get('related_materials', []),
-                    "review_materials": materials.get('review_materials', [])
+                    "completed": False
                 }
             ]
         })
 
-    plan = {
+    return {
         "plan_name": f"{request.skill} 학습 계획",
         "total_duration": "4주",
         "daily_schedule": schedule
     }
 
-    store.plans[user_id].append(plan)
+
+@router.post("/generate", response_model=Plan, response_model_exclude_unset=True)
+async def generate_plan(
+    request: PlanGenerateRequest,
+    mode: Optional[str] = None,
+    background: bool = False,
+    current_user: Dict = Depends(get_current_user)
+):
+    """학습 계획 생성 - mode=sharded면 주차별 병렬 생성 (기본값은 PLAN_GENERATION_MODE)
+
+    background=true면 작업 id를 바로 반환하고, 결과는 /jobs/{job_id}로 조회합니다.
+    """
+    mode = mode or PLAN_GENERATION_MODE
+    log_request("POST /plans/generate", current_user['name'], f"skill={request.skill}, mode={mode}")
+    log_stage(7, "계획 생성", current_user['name'])
+
+    if background:
+        return submit_job("plans_generate", current_user, partial(_generate_plan, request, mode, current_user))
+    return await _generate_plan(request, mode, current_user)
+
+
+async def _generate_plan(request: PlanGenerateRequest, mode: str, current_user: Dict) -> Dict:
+    user_id = current_user['user_id']
+
+    report_progress("계획 생성")
+    if mode == "sharded":
+        data = await _generate_sharded_plan(request)
+    else:
+        response = await call_gpt(_build_plan_prompt(request), use_search=False, site="plan_generate")
+        data = extract_json(response)
+
+    report_progress("학습 자료 검색")
+    if data and 'daily_schedule' in data:
+        log_info("학습 자료 검색 시작...")
+        pending_tasks = []
+        for day in data['daily_schedule']:
+            pending_tasks.extend(_prepare_tasks(day))
+
+        # 각 태스크에 연관 자료 미리 추가 (웹 검색 API, 주제별 병렬 검색)
+        await _attach_materials(pending_tasks, request.skill)
+
+        await astore.add_plan(user_id, data)
+        log_success(f"학습 계획 생성 완료: {data.get('plan_name', 'Unknown')}")
+        log_navigation(current_user['name'], "퀴즈 화면")
+        return data
+
+    # 기본 계획 생성
+    plan = _default_plan(request)
+    await _attach_materials([day['tasks'][0] for day in plan['daily_schedule']], request.skill)
+
+    await astore.add_plan(user_id, plan)
     log_success(f"기본 학습 계획 생성 완료")
     return plan
 
 
-@router.get("/date/{target_date}")
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/generate/stream")
+async def generate_plan_stream(request: PlanGenerateRequest, current_user: Dict = Depends(get_current_user)):
+    """학습 계획 생성 (SSE 스트리밍)
+
+    이벤트 순서:
+    - day: daily_schedule의 하루가 완성될 때마다 (학습 자료 제외)
+    - materials: 태스크별 학습 자료 검색이 끝날 때마다 (date, task_id, related/review_materials)
+    - plan: 모든 학습 자료가 채워진 최종 계획 (저장 완료 후)
+    - error: GPT 스트리밍이 중간에 실패한 경우 (계획은 저장되지 않음)
+    """
+    log_request("POST /plans/generate/stream", current_user['name'], f"skill={request.skill}")
+    log_stage(7, "계획 생성 (스트리밍)", current_user['name'])
+
+    return StreamingResponse(
+        _plan_events(request, current_user['user_id']),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _plan_events(request: PlanGenerateRequest, user_id: str) -> AsyncIterator[str]:
+    started = time.perf_counter()
+    searcher = MaterialSearcher()
+    updates: asyncio.Queue = asyncio.Queue()
+    enrichments: List[asyncio.Future] = []
+    days: List[Dict] = []
+    received = 0
+
+    async def enrich(day_date: Optional[str], task: Dict):
+        # 검색이 실패해도 항상 하나를 넣어 아래의 대기 횟수가 맞도록 함 (실패는 None)
+        event = None
+        try:
+            materials = await searcher.search(task.get('title') or request.skill)
+            task['related_materials'] = list(materials.get('related_materials', []))
+            task['review_materials'] = list(materials.get('review_materials', []))
+            event = _sse("materials", {
+                "date": day_date,
+                "task_id": task['id'],
+                "related_materials": task['related_materials'],
+                "review_materials": task['review_materials']
+            })
+        except Exception as e:
+            log_error(f"학습 자료 검색 실패: {e}")
+        finally:
+            updates.put_nowait(event)
+
+    def accept(day: Dict) -> str:
+        """day를 계획에 추가하고 학습 자료 검색을 바로 시작"""
+        if not days:
+            log_info(f"첫 일정 전송 ({time.perf_counter() - started:.1f}초)")
+        days.append(day)
+        for task in _prepare_tasks(day):
+            enrichments.append(asyncio.ensure_future(enrich(day.get('date'), task)))
+        return _sse("day", day)
+
+    try:
+        parser = ScheduleStreamParser()
+        try:
+            async for chunk in stream_gpt(_build_plan_prompt(request), site="plan_stream"):
+                for day in parser.feed(chunk):
+                    yield accept(day)
+                while not updates.empty():
+                    received += 1
+                    event = updates.get_nowait()
+                    if event:
+                        yield event
+        except GPTCallError as e:
+            if days:
+                log_error(f"스트리밍 계획 생성 중단: {e}")
+                yield _sse("error", {"message": f"GPT 호출 중 오류: {str(e)}"})
+                return
+
+        # 전체 응답 기준 계획 정보 (day가 하나도 추출되지 않았으면 전체 파싱 또는 기본 계획)
+        data = extract_json(parser.text) if parser.text else None
+        if not (data and 'daily_schedule' in data):
+            data = None
+        if not days:
+            fallback = data or _default_plan(request)
+            for day in fallback['daily_schedule']:
+                yield accept(day)
+        plan = dict(data) if data else {
+            "plan_name": f"{request.skill} 학습 계획",
+            "total_duration": "4주"
+        }
+        plan['daily_schedule'] = days
+
+        # 스트리밍 중에 이미 보낸 것을 제외한 나머지 검색 결과
+        while received < len(enrichments):
+            received += 1
+            event = await updates.get()
+            if event:
+                yield event
+
+        await astore.add_plan(user_id, plan)
+        log_success(
+            f"스트리밍 학습 계획 생성 완료: {plan.get('plan_name', 'Unknown')} "
+            f"({len(days)}일, {time.perf_counter() - started:.1f}초)"
+        )
+        yield _sse("plan", plan)
+    finally:
+        # 클라이언트가 연결을 끊은 경우 남은 검색 중단
+        for task in enrichments:
+            task.cancel()
+        searcher.cancel()
+
+
+@router.get("/date/{target_date}", response_model=PlanDateResponse, response_model_exclude_unset=True)
 async def get_plans_by_date(
     target_date: str,
     current_user: Dict = Depends(get_current_user)
@@ -400,21 +723,19 @@ async def get_plans_by_date(
     log_request("GET /plans/date", current_user['name'], f"date={target_date}")
 
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
+    current_plan = await astore.get_current_plan_meta(user_id)
 
-    if not plans:
+    if not current_plan:
         return {"date": target_date, "tasks": [], "message": "아직 학습 계획이 없습니다."}
 
-    current_plan = plans[-1]
-
-    for day in current_plan.get('daily_schedule', []):
-        if day['date'] == target_date:
-            return {
-                "date": target_date,
-                "tasks": day['tasks'],
-                "plan_name": current_plan.get('plan_name', '학습 계획'),
-                "message": None
-            }
+    day = await astore.get_day(user_id, target_date)
+    if day:
+        return {
+            "date": target_date,
+            "tasks": day['tasks'],
+            "plan_name": current_plan.get('plan_name', '학습 계획'),
+            "message": None
+        }
 
     return {"date": target_date, "tasks": [], "message": "해당 날짜에 계획이 없습니다."}
 
@@ -427,19 +748,12 @@ async def update_task(
     current_user: Dict = Depends(get_current_user)
 ):
     user_id = current_user['user_id']
-    plans = store.plans.get(user_id, [])
 
-    if not plans:
-        raise HTTPException(status_code=404, detail="No plans found")
-
-    current_plan = plans[-1]
-
-    for day in current_plan['daily_schedule']:
-        if day['date'] == date:
-            for task in day['tasks']:
-                if task['id'] == task_id:
-                    task['completed'] = completed
-                    log_success(f"태스크 업데이트: {task['title']} → {'완료' if completed else '미완료'}")
-                    return {"success": True}
+    task = await astore.update_task(user_id, date, task_id, completed)
+    if task:
+        log_success(f"태스크 업데이트: {task['title']} → {'완료' if completed else '미완료'}")
+        return {"success": True}
 
+    if not await astore.has_current_plan(user_id):
+        raise HTTPException(status_code=404, detail="No plans found")
     raise HTTPException(status_code=404, detail="Task not found")
@@ -3,10 +3,9 @@
 
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict
-import hashlib
 
 from ..models.schemas import ProfileUpdateRequest
-from ..services.store import store
+from ..services.store import astore
 from ..utils.logger import log_request, log_stage, log_success, log_navigation
 from .auth import get_current_user
 
@@ -33,18 +32,13 @@ async def get_profile(current_user: Dict = Depends(get_current_user)):
 async def update_profile(request: ProfileUpdateRequest, current_user: Dict = Depends(get_current_user)):
     log_request("POST /profile/update", current_user['name'])
 
-    user = store.users.get(request.user_id)
+    user = await astore.get_user(request.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if request.email:
-        user['email'] = request.email
-    if request.name:
-        user['name'] = request.name
-    if request.birth:
-        user['birth'] = request.birth
-    if request.password:
-        user['password'] = hashlib.sha256(request.password.encode()).hexdigest()
+    if request.email and not await astore.update_email(user['user_id'], request.email):
+        raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다.")
+    await astore.update_user(user['user_id'], name=request.name, birth=request.birth, password=request.password)
 
     log_success(f"프로필 업데이트 완료: {current_user['name']}")
     return {"success": True}
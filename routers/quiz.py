@@ -5,8 +5,8 @@ from fastapi import APIRouter, Depends
 from typing import Dict
 
 from ..models.schemas import QuizSubmitRequest
-from ..services.store import store
-from ..services.gpt_service import call_gpt, extract_json
+from ..services.store import astore
+from ..services.gpt_service import call_gpt, extract_json, CACHE_TTL_QUIZ, json_with_key
 from ..utils.logger import log_request, log_stage, log_success, log_navigation
 from .auth import get_current_user
 
@@ -18,6 +18,7 @@ async def get_quiz_items(
     skill: str = "general",
     level: str = "초급",
     limit: int = 10,
+    refresh: bool = False,
     current_user: Dict = Depends(get_current_user)
 ):
     log_request("GET /quiz/items", current_user['name'], f"skill={skill}, level={level}, limit={limit}")
@@ -71,11 +72,14 @@ async def get_quiz_items(
 """
 
 
-    response = call_gpt(prompt, use_search=False)
+    response = await call_gpt(
+        prompt, use_search=False, cache_ttl=CACHE_TTL_QUIZ, use_cache=not refresh, site="quiz",
+        cache_if=json_with_key('quizzes')
+    )
     data = extract_json(response)
 
     if data and 'quizzes' in data:
-        store.quiz_answers[current_user['user_id']] = data['quizzes']
+        await astore.set_quiz_answers(current_user['user_id'], data['quizzes'])
         log_success(f"퀴즈 {len(data['quizzes'])}개 생성 완료")
         return data['quizzes']
 
@@ -92,7 +96,7 @@ async def get_quiz_items(
         {"id": 9, "type": "OX", "question": "IP 주소는 인터넷에서 컴퓨터를 식별하는 고유한 주소이다.", "options": [], "answerKey": "O", "explanation": "IP(Internet Protocol) 주소는 네트워크상에서 각 장치를 식별하기 위한 고유한 숫자 주소입니다. IPv4는 32비트, IPv6는 128비트를 사용합니다."},
         {"id": 10, "type": "OX", "question": "클라우드 컴퓨팅은 반드시 인터넷 연결 없이도 사용할 수 있다.", "options": [], "answerKey": "X", "explanation": "클라우드 컴퓨팅은 인터넷을 통해 원격 서버의 리소스를 사용하는 기술이므로, 기본적으로 인터넷 연결이 필요합니다."},
     ]
-    store.quiz_answers[current_user['user_id']] = default_quizzes
+    await astore.set_quiz_answers(current_user['user_id'], default_quizzes)
     return default_quizzes[:limit]
 
 
@@ -101,7 +105,7 @@ async def grade_quiz(request: QuizSubmitRequest, current_user: Dict = Depends(ge
     log_request("POST /quiz/grade", current_user['name'], f"answers={len(request.answers)}개")
     log_stage(5, "퀴즈 채점", current_user['name'])
 
-    saved_quizzes = store.quiz_answers.get(current_user['user_id'], [])
+    saved_quizzes = await astore.get_quiz_answers(current_user['user_id'])
     answer_map = {q['id']: q['answerKey'] for q in saved_quizzes}
 
     total = len(request.answers)
@@ -1,35 +1,65 @@
 # Backend/routers/recommend.py
 """강좌 추천 관련 라우터"""
 
-from fastapi import APIRouter, Depends
-from typing import Dict
+from fastapi import APIRouter, Depends, Response
+from typing import Dict, List, Optional
+from functools import partial
 import uuid
 
 from ..models.schemas import SelectCourseRequest, ApplyRecommendationRequest
-from ..services.store import store
-from ..services.gpt_service import call_gpt, extract_json, get_search_status
+from ..services.gpt_service import call_gpt, extract_json, CACHE_TTL_RECOMMEND, json_with_key
+from ..services.jobs import report_progress
+from ..services.search_status import search_status
 from ..utils.logger import log_request, log_stage, log_success, log_navigation, log_info
 from .auth import get_current_user
+from .jobs import submit_job
 
 router = APIRouter(prefix="/recommend", tags=["Recommend"])
 
 
 @router.get("/search_status")
-async def get_current_search_status():
-    """현재 AI 검색 상태 반환 (프론트엔드 로딩 화면용)"""
-    return get_search_status()
+async def get_current_search_status(search_id: Optional[str] = None, current_user: Dict = Depends(get_current_user)):
+    """AI 검색 상태 반환 (프론트엔드 로딩 화면용)
+
+    search_id(요청 시 지정한 값, X-Search-Id 헤더 또는 작업 id)로 조회하며,
+    생략하면 사용자의 가장 최근 검색 상태를 반환합니다.
+    """
+    if search_id:
+        return search_status.get(search_id, current_user['user_id'])
+    return search_status.latest(current_user['user_id'])
 
 
 @router.get("/courses")
 async def get_recommended_courses(
+    response: Response,
     skill: str = "programming",
     level: str = "초급",
+    refresh: bool = False,
+    background: bool = False,
+    search_id: Optional[str] = None,
     current_user: Dict = Depends(get_current_user)
 ):
+    """강좌 추천 (GPT 웹검색) - background=true면 작업 id를 바로 반환
+
+    검색 진행 상태는 /recommend/search_status?search_id=로 조회합니다
+    (search_id를 생략하면 작업 id 또는 X-Search-Id 헤더 값).
+    """
     log_request("GET /recommend/courses", current_user['name'], f"skill={skill}, level={level}")
     log_stage(6, "강좌 추천", current_user['name'])
     log_navigation(current_user['name'], "강좌 추천 화면")
 
+    if background:
+        return submit_job(
+            "recommend_courses", current_user, partial(_recommend_courses, skill, level, refresh, current_user, search_id)
+        )
+    return await _recommend_courses(skill, level, refresh, current_user, search_id, response)
+
+
+async def _recommend_courses(
+    skill: str, level: str, refresh: bool, current_user: Dict, search_id: Optional[str] = None,
+    response: Optional[Response] = None
+) -> List[Dict]:
+
     # 강화된 프롬프트 - 실제 강좌/도서 링크 + 커리큘럼 일치 강제
     #------------------------------
     # 프롬포트 수정
@@ -130,8 +160,15 @@ async def get_recommended_courses(
     """
 
 
-    response = call_gpt(prompt, use_search=True)
-    data = extract_json(response)
+    report_progress("강좌 검색")
+    search_id = search_status.start(current_user['user_id'], search_id)
+    if response is not None:
+        response.headers["X-Search-Id"] = search_id
+    content = await call_gpt(
+        prompt, use_search=True, cache_ttl=CACHE_TTL_RECOMMEND, use_cache=not refresh, search_id=search_id,
+        site="recommend_courses", cache_if=json_with_key('recommendations', 'courses')
+    )
+    data = extract_json(content)
 
     if data:
         # recommendations 또는 courses 키 모두 지원
@@ -1,12 +1,13 @@
 # Backend/routers/review.py
 """복습 자료 관련 라우터"""
 
-from fastapi import APIRouter, Depends
-from typing import Dict, List
+from fastapi import APIRouter, Depends, Response
+from typing import Dict, List, Optional
 from datetime import date, timedelta
 
-from ..services.store import store
-from ..services.gpt_service import call_gpt, extract_json
+from ..services.store import astore
+from ..services.gpt_service import call_gpt, extract_json, CACHE_TTL_REVIEW, json_with_key
+from ..services.search_status import search_status
 from ..utils.logger import log_request, log_success, log_navigation, log_info
 from .auth import get_current_user
 
@@ -15,27 +16,28 @@ router = APIRouter(prefix="/review", tags=["Review"])
 
 @router.get("/yesterday")
 async def get_review_materials(
+    response: Response,
     user_id: str = None,
+    refresh: bool = False,
+    search_id: Optional[str] = None,
     current_user: Dict = Depends(get_current_user)
 ):
+    """어제 복습 자료 (GPT 웹검색) - 진행 상태는 /recommend/search_status?search_id=로 조회"""
     log_request("GET /review/yesterday", current_user['name'])
     log_navigation(current_user['name'], "복습 화면")
 
     uid = user_id or current_user['user_id']
-    plans = store.plans.get(uid, [])
 
-    if not plans:
+    if not await astore.has_current_plan(uid):
         log_info("학습 계획이 없습니다")
         return {"materials": [], "topics": [], "message": "아직 학습 계획이 없습니다."}
 
-    current_plan = plans[-1]
     yesterday = (date.today() - timedelta(days=1)).isoformat()
 
     completed_topics = []
-    for day in current_plan.get('daily_schedule', []):
-        if day['date'] == yesterday:
-            completed_topics = [t['title'] for t in day['tasks'] if t.get('completed', False)]
-            break
+    day = await astore.get_day(uid, yesterday)
+    if day:
+        completed_topics = [t['title'] for t in day['tasks'] if t.get('completed', False)]
 
     if not completed_topics:
         log_info("어제 완료한 학습 항목이 없습니다")
@@ -108,8 +110,13 @@ async def get_review_materials(
     - description에는 URL·도메인·링크 표현 금지
     """
 
-    response = call_gpt(prompt, use_search=True)
-    data = extract_json(response)
+    search_id = search_status.start(current_user['user_id'], search_id)
+    response.headers["X-Search-Id"] = search_id
+    content = await call_gpt(
+        prompt, use_search=True, cache_ttl=CACHE_TTL_REVIEW, use_cache=not refresh, search_id=search_id,
+        site="review_yesterday", cache_if=json_with_key('materials')
+    )
+    data = extract_json(content)
 
     if data and 'materials' in data:
         valid_materials = [m for m in data['materials'] if 'example' not in m.get('url', '').lower()]
@@ -142,21 +149,18 @@ async def get_yesterday_topics(
     log_request("GET /review/topics", current_user['name'])
 
     uid = current_user['user_id']
-    plans = store.plans.get(uid, [])
 
-    if not plans:
+    if not await astore.has_current_plan(uid):
         return {"topics": [], "date": None}
 
-    current_plan = plans[-1]
     yesterday = (date.today() - timedelta(days=1)).isoformat()
 
     completed_topics = []
-    for day in current_plan.get('daily_schedule', []):
-        if day['date'] == yesterday:
-            completed_topics = [
-                {"title": t['title'], "completed": t.get('completed', False)}
-                for t in day['tasks']
-            ]
-            break
+    day = await astore.get_day(uid, yesterday)
+    if day:
+        completed_topics = [
+            {"title": t['title'], "completed": t.get('completed', False)}
+            for t in day['tasks']
+        ]
 
     return {"topics": completed_topics, "date": yesterday}
@@ -1,55 +1,409 @@
 # Backend/services/gpt_service.py
 """OpenAI GPT 서비스"""
 
-from openai import OpenAI
-import json
+from openai import AsyncOpenAI
+import asyncio
+import hashlib
 import re
 import os
-from typing import Optional, Dict
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, List, AsyncIterator, Callable
 from dotenv import load_dotenv
 
 from ..utils.logger import log_info, log_error, log_gpt
+from ..utils.metrics import metrics, gpt_call_duration, json_extract_duration
+from .search_status import search_status
+from .usage import usage_tracker
+from .json_extract import JSONExtractor, extract_json_object
 
 load_dotenv()
 
-# OpenAI 클라이언트 설정
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# OpenAI 클라이언트 설정 (비동기 - 이벤트 루프를 막지 않음)
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# 동시에 진행할 수 있는 GPT 호출 수 (프로세스 전체)
+GPT_MAX_CONCURRENCY = int(os.getenv("GPT_MAX_CONCURRENCY", "32"))
+_gpt_semaphore = asyncio.Semaphore(GPT_MAX_CONCURRENCY)
+
+# 응답 캐시 메모리 상한 (바이트)
+GPT_CACHE_MAX_BYTES = int(os.getenv("GPT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# 멀티 워커 배포 시 공유 상태 디렉터리 - 지정하면 응답 캐시를 SQLite 파일로 공유
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", "")
+GPT_CACHE_PATH = os.getenv(
+    "GPT_CACHE_PATH", os.path.join(SHARED_STATE_DIR, "gpt_cache.db") if SHARED_STATE_DIR else ""
+)
 
 # 모델 설정 - fallback 지원
 OPENAI_MODEL_SEARCH_PRIMARY = "gpt-5-search-api"  # 1차 웹 검색용 모델
 OPENAI_MODEL_SEARCH_FALLBACK = "gpt-4o-search-preview"  # 2차 fallback 모델
 OPENAI_MODEL_NORMAL = "gpt-4o"  # 일반 모델
 
-# 현재 사용 중인 모델 상태 (프론트엔드에서 조회 가능)
-current_search_status = {"model": None, "status": "idle"}
+# 엔드포인트별 응답 캐시 TTL (초) - 사용자와 무관하게 같은 프롬프트가 반복되는 호출만 캐시
+CACHE_TTL_QUIZ = 24 * 3600
+CACHE_TTL_RECOMMEND = 6 * 3600
+CACHE_TTL_MATERIALS = 6 * 3600
+CACHE_TTL_REVIEW = 6 * 3600
+
+async def _create_completion(model: str, prompt: str, role: str = "primary", site: str = "unknown") -> str:
+    """단일 GPT 요청 - 전역 동시성 제한 적용
+
+    호출 시간은 role(primary/fallback)별 메트릭에, 토큰 사용량은 호출 위치(site)별로 기록합니다.
+    """
+    async with _gpt_semaphore:
+        messages = [{"role": "user", "content": prompt}]
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages
+            )
+            outcome = "ok"
+        finally:
+            latency = time.perf_counter() - start
+            gpt_call_duration.observe(latency, model, role, outcome)
+    usage_tracker.record(site, model, getattr(response, "usage", None), latency)
+    return response.choices[0].message.content
+
+
+class GPTResponseCache:
+    """프롬프트 기반 GPT 응답 캐시 (TTL + LRU, 메모리 상한)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        # 줄 앞뒤 공백/들여쓰기 차이는 같은 프롬프트로 취급
+        normalized = ' '.join(prompt.split())
+        digest = hashlib.sha256(normalized.encode()).hexdigest()
+        return f"{model}:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, content = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return content
+
+    def set(self, key: str, content: str, ttl: float):
+        size = len(content.encode())
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (time.monotonic() + ttl, content)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def aget(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, content: str, ttl: float):
+        self.set(key, content, ttl)
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def close(self):
+        pass
+
+    def _remove(self, key: str):
+        _, content = self.entries.pop(key)
+        self.total_bytes -= len(content.encode())
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class SQLiteGPTResponseCache:
+    """여러 워커 프로세스가 공유하는 GPT 응답 캐시 (SQLite 파일, GPTResponseCache와 같은 인터페이스)
+
+    aget/aset은 스레드에서 실행되어 디스크 I/O와 다른 워커의 쓰기 잠금 대기가 이벤트 루프를 막지 않습니다.
+    조회 시각(accessed_at)은 적중할 때마다 쓰지 않고 모아 두었다가 다음 저장 때 한 번에 기록합니다.
+    항목 수/전체 크기는 열 때와 저장할 때 세어 두므로 stats()는 DB에 접근하지 않습니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # 기록 대기 중인 조회 시각 (키 -> 마지막 적중 시각)
+        self._touched: Dict[str, float] = {}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS gpt_cache (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_gpt_cache_accessed ON gpt_cache(accessed_at)")
+        self._conn.commit()
+        self.entries, self.total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM gpt_cache"
+        ).fetchone()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expires_at FROM gpt_cache WHERE key=?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._touched[key] = now
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, content: str, ttl: float):
+        size = len(content.encode())
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO gpt_cache VALUES (?, ?, ?, ?, ?)", (key, content, size, now + ttl, now)
+            )
+            self._flush_touched()
+            self._conn.execute("DELETE FROM gpt_cache WHERE expires_at <= ?", (now,))
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM gpt_cache"
+            ).fetchone()
+            while total > self.max_bytes:
+                oldest = self._conn.execute(
+                    "SELECT key, size FROM gpt_cache ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                self._conn.execute("DELETE FROM gpt_cache WHERE key=?", (oldest[0],))
+                entries -= 1
+                total -= oldest[1]
+                self.evictions += 1
+            self.entries, self.total_bytes = entries, total
+
+    async def aget(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, content: str, ttl: float):
+        await asyncio.to_thread(self.set, key, content, ttl)
+
+    def _flush_touched(self):
+        """_lock + 트랜잭션 안에서 호출 - 모아 둔 조회 시각 기록 (LRU 제거 순서에만 쓰임)"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE gpt_cache SET accessed_at=? WHERE key=?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM gpt_cache")
+            self._touched.clear()
+            self.entries = self.total_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entries,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "shared": True
+        }
+
+    def close(self):
+        with self._lock:
+            try:
+                with self._conn:
+                    self._flush_touched()
+            except sqlite3.Error as e:
+                log_error(f"GPT 캐시 조회 시각 기록 실패: {e}")
+            self._conn.close()
+
+
+if GPT_CACHE_PATH:
+    response_cache = SQLiteGPTResponseCache(GPT_CACHE_PATH, GPT_CACHE_MAX_BYTES)
+else:
+    response_cache = GPTResponseCache(GPT_CACHE_MAX_BYTES)
+
+
+def get_cache_stats() -> dict:
+    """GPT 응답 캐시 통계 반환"""
+    return response_cache.stats()
+
+
+metrics.stats(get_cache_stats, {
+    "entries": ("gpt_cache_entries", "gauge", "GPT 응답 캐시 항목 수"),
+    "bytes": ("gpt_cache_bytes", "gauge", "GPT 응답 캐시 크기 (바이트)"),
+    "hits": ("gpt_cache_hits_total", "counter", "GPT 응답 캐시 적중 수 (이 워커)"),
+    "misses": ("gpt_cache_misses_total", "counter", "GPT 응답 캐시 미스 수 (이 워커)"),
+    "evictions": ("gpt_cache_evictions_total", "counter", "메모리 상한으로 밀려난 GPT 응답 캐시 항목 수 (이 워커)")
+})
+
+
+def json_with_key(*keys: str) -> Callable[[str], bool]:
+    """call_gpt의 cache_if용 - 응답이 keys 중 하나를 가진 JSON 객체일 때만 캐시"""
+    def check(content: str) -> bool:
+        data = extract_json_object(content)
+        return isinstance(data, dict) and any(k in data for k in keys)
+    return check
 
 
-def get_search_status() -> dict:
-    """현재 검색 상태 반환"""
-    return current_search_status
+def _is_json_object(content: str) -> bool:
+    return extract_json_object(content) is not None
 
 
-def call_gpt(prompt: str, use_search: bool = False) -> str:
-    """GPT 호출 - fallback 로직 포함"""
-    global current_search_status
+class GPTCallError(Exception):
+    """1차/2차 모델 모두 실패한 GPT 호출"""
 
+
+# 진행 중인 GPT 요청 (캐시 키 -> 공유 Task, 진행 상태를 받을 search_id 목록)
+_inflight: Dict[str, "asyncio.Future"] = {}
+_inflight_watchers: Dict[str, List[str]] = {}
+_singleflight_stats = {"coalesced": 0}
+
+
+async def call_gpt(
+    prompt: str,
+    use_search: bool = False,
+    cache_ttl: Optional[float] = None,
+    use_cache: bool = True,
+    search_id: Optional[str] = None,
+    site: str = "unknown",
+    cache_if: Optional[Callable[[str], bool]] = None
+) -> str:
+    """GPT 호출 - 응답 캐시 + 동일 요청 병합 + fallback 로직 포함
+
+    cache_ttl이 주어진 호출만 캐시되며, use_cache=False면 캐시를 건너뜁니다.
+    cache_if(응답)가 참인 응답만 캐시합니다 (기본: JSON 객체로 파싱되는 응답) - 깨진 응답이 TTL 동안 재사용되지 않도록.
+    같은 모델/프롬프트로 동시에 들어온 호출은 하나의 upstream 요청을 공유합니다.
+    search_id가 주어지면 웹 검색 진행 상태를 search_status에 기록합니다.
+    site는 토큰 사용량 집계에 쓰이는 호출 위치 이름입니다 (services/usage.py).
+    """
+    model = OPENAI_MODEL_SEARCH_PRIMARY if use_search else OPENAI_MODEL_NORMAL
+    cacheable = use_cache and cache_ttl is not None and cache_ttl > 0
+    key = GPTResponseCache.make_key(model, prompt)
+
+    if cacheable:
+        cached = await response_cache.aget(key)
+        if cached is not None:
+            log_info(f"GPT 캐시 적중 ({model})")
+            search_status.update(search_id, "cache", "completed")
+            return cached
+
+    # 같은 프롬프트가 이미 진행 중이면 그 결과를 함께 기다림 (single-flight)
+    task = _inflight.get(key)
+    leader = task is None
+    if leader:
+        watchers = [search_id] if search_id else []
+        task = asyncio.ensure_future(_call_gpt_upstream(prompt, use_search, watchers, site))
+        _inflight[key] = task
+        _inflight_watchers[key] = watchers
+        task.add_done_callback(lambda t: _finish_inflight(key, t))
+    else:
+        _singleflight_stats["coalesced"] += 1
+        log_info(f"진행 중인 동일 GPT 요청에 합류 ({model})")
+        if search_id:
+            _inflight_watchers[key].append(search_id)
+            search_status.update(search_id, model, "searching")
+
+    try:
+        # 한 대기자가 취소되어도 공유 요청은 계속 진행
+        content = await asyncio.shield(task)
+    except GPTCallError as e:
+        return f"GPT 호출 중 오류: {str(e)}"
+
+    if cacheable and leader:
+        if (cache_if or _is_json_object)(content):
+            await response_cache.aset(key, content, cache_ttl)
+        else:
+            log_info(f"GPT 응답 형식이 맞지 않아 캐시하지 않음 ({model})")
+    return content
+
+
+def _finish_inflight(key: str, task: "asyncio.Future"):
+    """공유 요청 종료 처리 - 모든 대기자가 취소된 경우에도 예외를 회수"""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+        del _inflight_watchers[key]
+    if not task.cancelled():
+        task.exception()
+
+
+def get_singleflight_stats() -> dict:
+    """진행 중인 공유 GPT 요청 수와 합류 횟수 반환"""
+    return {"inflight": len(_inflight), "coalesced": _singleflight_stats["coalesced"]}
+
+
+metrics.stats(get_singleflight_stats, {
+    "inflight": ("gpt_singleflight_inflight", "gauge", "진행 중인 공유 GPT 요청 수"),
+    "coalesced": ("gpt_singleflight_coalesced_total", "counter", "진행 중인 동일 GPT 요청에 합류한 호출 수")
+})
+
+
+def _report_search(watchers: List[str], model: Optional[str], status: str, attempt: int):
+    for search_id in watchers:
+        search_status.update(search_id, model, status, attempt)
+
+
+async def _call_gpt_upstream(prompt: str, use_search: bool, watchers: List[str], site: str = "unknown") -> str:
+    """실제 OpenAI 호출 - 최종 실패 시 GPTCallError
+
+    watchers는 이 요청의 진행 상태를 받을 search_id 목록 (합류한 요청이 뒤에 추가될 수 있음)
+    """
     if use_search:
         # 1차 시도: gpt-5-search-api
-        current_search_status = {"model": "gpt-5-search-api", "status": "searching"}
+        _report_search(watchers, "gpt-5-search-api", "searching", 1)
         log_info(f"GPT 호출 중... (1차: gpt-5-search-api)")
 
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL_SEARCH_PRIMARY,
-                messages=messages
-            )
-            content = response.choices[0].message.content
+            content = await _create_completion(OPENAI_MODEL_SEARCH_PRIMARY, prompt, "primary", site)
 
             # 응답이 JSON을 포함하는지 확인 (검색 거부 응답 감지)
             if '```json' in content or '"recommendations"' in content or '"id"' in content:
                 log_gpt(prompt[:100], content)
-                current_search_status = {"model": "gpt-5-search-api", "status": "completed"}
+                _report_search(watchers, "gpt-5-search-api", "completed", 1)
                 return content
             else:
                 log_info("1차 모델이 JSON 응답을 반환하지 않음, fallback 시도")
@@ -59,7 +413,7 @@ def call_gpt(prompt: str, use_search: bool = False) -> str:
             log_error(f"1차 모델 실패: {str(e)}")
 
             # 2차 시도: gpt-4o-search-preview (fallback)
-            current_search_status = {"model": "gpt-4o-search-preview (fallback)", "status": "searching"}
+            _report_search(watchers, "gpt-4o-search-preview (fallback)", "searching", 2)
             log_info(f"GPT fallback 호출 중... (2차: gpt-4o-search-preview)")
 
             try:
@@ -70,72 +424,144 @@ def call_gpt(prompt: str, use_search: bool = False) -> str:
 
 ⚠️ 중요: 위 요청에 대해 반드시 JSON 형식으로만 응답하세요. 추가 질문이나 설명 없이 오직 JSON만 출력합니다."""
 
-                messages = [{"role": "user", "content": fallback_prompt}]
-                response = client.chat.completions.create(
-                    model=OPENAI_MODEL_SEARCH_FALLBACK,
-                    messages=messages
-                )
-                content = response.choices[0].message.content
+                content = await _create_completion(OPENAI_MODEL_SEARCH_FALLBACK, fallback_prompt, "fallback", site)
                 log_gpt(prompt[:100], content)
-                current_search_status = {"model": "gpt-4o-search-preview (fallback)", "status": "completed"}
+                _report_search(watchers, "gpt-4o-search-preview (fallback)", "completed", 2)
                 return content
 
             except Exception as e2:
                 log_error(f"2차 모델도 실패: {str(e2)}")
-                current_search_status = {"model": None, "status": "failed"}
-                return f"GPT 호출 중 오류: {str(e2)}"
+                _report_search(watchers, None, "failed", 2)
+                raise GPTCallError(str(e2)) from e2
     else:
         # 일반 모델 사용
+        _report_search(watchers, OPENAI_MODEL_NORMAL, "searching", 1)
         try:
             log_info(f"GPT 호출 중... (일반 모델: gpt-4o)")
-            messages = [{"role": "user", "content": prompt}]
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL_NORMAL,
-                messages=messages
-            )
-            content = response.choices[0].message.content
+            content = await _create_completion(OPENAI_MODEL_NORMAL, prompt, "primary", site)
             log_gpt(prompt[:100], content)
+            _report_search(watchers, OPENAI_MODEL_NORMAL, "completed", 1)
             return content
 
         except Exception as e:
             log_error(f"GPT 호출 실패: {str(e)}")
-            return f"GPT 호출 중 오류: {str(e)}"
+            _report_search(watchers, None, "failed", 1)
+            raise GPTCallError(str(e)) from e
 
 
-def extract_json(text: str) -> Optional[Dict]:
-    """GPT 응답에서 JSON을 추출 - 더 robust한 파싱"""
-    def clean_json_string(json_str: str) -> str:
-        """JSON 문자열 정리"""
-        # 제어 문자 제거
-        json_str = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', json_str)
-        # 숫자 내 쉼표 제거 (예: "1,234" -> "1234") - 따옴표 내 숫자 패턴
-        json_str = re.sub(r'"(\d{1,3})(,\d{3})+"', lambda m: '"' + m.group(0).replace(',', '').strip('"') + '"', json_str)
-        # trailing comma 제거
-        json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
-        return json_str
+async def stream_gpt(prompt: str, site: str = "stream") -> AsyncIterator[str]:
+    """일반 모델 스트리밍 호출 - 생성되는 텍스트 조각을 순서대로 반환 (실패 시 GPTCallError)
 
+    응답 캐시와 동일 요청 병합은 적용되지 않습니다.
+    """
+    log_info(f"GPT 스트리밍 호출 중... (일반 모델: gpt-4o)")
+    chunks = []
+    start = None
+    usage = None
+    outcome = "error"
     try:
-        # JSON 블록 찾기
-        json_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-        if json_match:
-            json_str = clean_json_string(json_match.group(1))
-            return json.loads(json_str)
-
-        # 중괄호로 시작하는 JSON 찾기
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            json_str = clean_json_string(json_match.group())
-            return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        log_error(f"JSON 파싱 실패: {e}")
-        # 재시도: 더 공격적인 정리
-        try:
-            if json_match:
-                json_str = json_match.group(1) if '```json' in text else json_match.group()
-                # 모든 줄바꿈을 공백으로
-                json_str = json_str.replace('\n', ' ').replace('\r', ' ')
-                json_str = clean_json_string(json_str)
-                return json.loads(json_str)
-        except:
-            log_error("재시도 파싱도 실패")
-    return None
+        async with _gpt_semaphore:
+            start = time.perf_counter()
+            stream = await client.chat.completions.create(
+                model=OPENAI_MODEL_NORMAL,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True,
+                # 마지막 조각에 토큰 사용량 포함
+                extra_body={"stream_options": {"include_usage": True}}
+            )
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+            outcome = "ok"
+    except Exception as e:
+        log_error(f"GPT 스트리밍 호출 실패: {str(e)}")
+        raise GPTCallError(str(e)) from e
+    finally:
+        if start is not None:
+            latency = time.perf_counter() - start
+            gpt_call_duration.observe(latency, OPENAI_MODEL_NORMAL, "stream", outcome)
+            if outcome == "ok":
+                usage_tracker.record(site, OPENAI_MODEL_NORMAL, usage, latency)
+    log_gpt(prompt[:100], ''.join(chunks))
+
+
+# daily_schedule 배열에서 다음 day 객체의 시작('{') 또는 배열 끝(']')
+_DAY_START = re.compile(r'[^\s,]')
+
+
+class ScheduleStreamParser:
+    """스트리밍 응답에서 daily_schedule 배열의 day 객체를 완성되는 즉시 추출
+
+    feed()로 텍스트 조각을 넣으면 이번 조각으로 닫힌 day 객체 목록을 반환합니다.
+    배열을 찾은 뒤에는 day마다 JSONExtractor에 조각을 이어서 넣습니다.
+    """
+
+    MARKER = '"daily_schedule"'
+
+    def __init__(self):
+        self.done = False
+        self._chunks: List[str] = []
+        self._head = ""
+        self._in_array = False
+        self._day: Optional[JSONExtractor] = None
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 응답"""
+        return ''.join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Dict]:
+        self._chunks.append(chunk)
+        days = []
+        if self.done:
+            return days
+
+        if not self._in_array:
+            self._head += chunk
+            marker = self._head.find(self.MARKER)
+            if marker < 0:
+                # 마커가 조각 경계에 걸친 경우를 위해 끝부분만 남김
+                self._head = self._head[-len(self.MARKER):]
+                return days
+            bracket = self._head.find('[', marker + len(self.MARKER))
+            if bracket < 0:
+                self._head = self._head[marker:]
+                return days
+            self._in_array = True
+            chunk = self._head[bracket + 1:]
+            self._head = ""
+
+        while chunk:
+            if self._day is None:
+                m = _DAY_START.search(chunk)
+                if m is None:
+                    break
+                if chunk[m.start()] != '{':
+                    # 배열 끝
+                    self.done = True
+                    break
+                self._day = JSONExtractor()
+                chunk = chunk[m.start():]
+            day = self._day.feed(chunk)
+            if not self._day.done:
+                break
+            chunk = self._day.remainder
+            self._day = None
+            if isinstance(day.get('tasks'), list):
+                days.append(day)
+        return days
+
+
+def extract_json(text: str) -> Optional[Dict]:
+    """GPT 응답에서 JSON 객체 추출 - 한 번의 순회 + 보정 (services/json_extract.py)"""
+    start = time.perf_counter()
+    data = extract_json_object(text)
+    json_extract_duration.observe(time.perf_counter() - start, "ok" if data is not None else "failed")
+    if data is None:
+        log_error("JSON 파싱 실패")
+    return data
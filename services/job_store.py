@@ -0,0 +1,65 @@
+# Backend/services/job_store.py
+"""백그라운드 작업 상태 공유 저장소 (SQLite) - 멀티 워커 배포용
+
+작업을 실행하는 워커가 상태가 바뀔 때마다(등록/시작/진행 단계/완료) 기록하고,
+다른 워커는 /jobs/{job_id} 조회 시 이 파일에서 읽습니다.
+작업 실행 자체는 등록한 워커에서만 이루어지므로, 실행 중 워커가 종료되면 상태가 running으로 남습니다.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+from ..utils.logger import log_error
+
+
+class SQLiteJobStore:
+    """job_id -> (user_id, to_dict() 결과) - 호출은 이벤트 루프 밖(전용 스레드)에서"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                finished_at REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs(finished_at)")
+        self._conn.commit()
+
+    def save(self, user_id: str, data: Dict):
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?)",
+                    (data["job_id"], user_id, json.dumps(data, ensure_ascii=False, default=str), data.get("finished_at"))
+                )
+        except sqlite3.Error as e:
+            log_error(f"작업 상태 기록 실패: {data.get('job_id')} - {e}")
+
+    def load(self, job_id: str) -> Optional[Tuple[str, Dict]]:
+        with self._lock:
+            row = self._conn.execute("SELECT user_id, data FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def expire(self, cutoff: float):
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM jobs WHERE finished_at < ?", (cutoff,))
+        except sqlite3.Error as e:
+            log_error(f"만료된 작업 상태 삭제 실패: {e}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,304 @@
+# Backend/services/jobs.py
+"""인프로세스 백그라운드 작업 큐 - 오래 걸리는 GPT 작업을 요청과 분리
+
+submit()은 작업을 큐에 넣고 바로 Job을 반환하며, 고정 개수의 워커가 순서대로 실행합니다.
+완료된 작업은 JOB_RESULT_TTL 동안 보관 후 삭제됩니다.
+SHARED_STATE_DIR(또는 JOB_STATE_PATH)이 지정되면 작업 상태를 SQLite 파일에도 기록해
+다른 워커로 들어온 /jobs/{job_id} 조회도 응답합니다 (services/job_store.py).
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from dotenv import load_dotenv
+
+from ..utils.logger import log_info, log_error
+
+load_dotenv()
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAX_SIZE = int(os.getenv("JOB_QUEUE_MAX_SIZE", "100"))
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "300"))
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "600"))
+# 다른 워커의 작업을 long-poll로 기다릴 때 공유 저장소를 다시 읽는 간격 (초)
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "0.5"))
+
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", "")
+JOB_STATE_PATH = os.getenv(
+    "JOB_STATE_PATH", os.path.join(SHARED_STATE_DIR, "jobs.db") if SHARED_STATE_DIR else ""
+)
+
+# 작업 안에서 report_progress()가 현재 작업을 찾을 때 사용
+_current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar("current_job", default=None)
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업 수가 JOB_QUEUE_MAX_SIZE에 도달"""
+
+
+class Job:
+    """백그라운드 작업 하나의 상태 (queued → running → succeeded/failed)"""
+
+    def __init__(self, kind: str, user_id: str, work: Callable[[], Awaitable[Any]]):
+        self.id = str(uuid.uuid4())
+        self.kind = kind
+        self.user_id = user_id
+        self.status = "queued"
+        self.progress: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._work = work
+        self._done = asyncio.Event()
+        # 상태가 바뀔 때 호출 (공유 저장소 기록)
+        self.on_change: Optional[Callable[["Job"], None]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    async def wait(self, timeout: float) -> bool:
+        """완료될 때까지 최대 timeout초 대기 (long-poll)"""
+        if timeout > 0 and not self.finished:
+            try:
+                await asyncio.wait_for(self._done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.finished
+
+    def to_dict(self) -> dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+        if self.status == "succeeded":
+            data["result"] = self.result
+        elif self.status == "failed":
+            data["error"] = self.error
+        return data
+
+
+def current_job_id() -> Optional[str]:
+    """실행 중인 작업 id (작업 밖이면 None)"""
+    job = _current_job.get()
+    return job.id if job is not None else None
+
+
+def current_job_user_id() -> Optional[str]:
+    """실행 중인 작업을 등록한 사용자 id (작업 밖이면 None)"""
+    job = _current_job.get()
+    return job.user_id if job is not None else None
+
+
+def report_progress(stage: str):
+    """실행 중인 작업의 진행 단계 갱신 (작업 밖에서 호출되면 무시)"""
+    job = _current_job.get()
+    if job is not None:
+        job.progress = stage
+        if job.on_change:
+            job.on_change(job)
+
+
+class _Timing:
+    """대기/실행 시간 누적 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 1)
+        }
+
+
+class JobQueue:
+    """고정 크기 워커 풀 + 제한된 대기열
+
+    shared_path가 주어지면 상태 변경을 전용 스레드 하나에서 순서대로 SQLite에 기록합니다.
+    """
+
+    def __init__(self, workers: int, max_size: int, timeout: float, result_ttl: float, shared_path: str = ""):
+        self.workers = workers
+        self.max_size = max_size
+        self.timeout = timeout
+        self.result_ttl = result_ttl
+        self.jobs: Dict[str, Job] = {}
+        self.running = 0
+        self.rejected = 0
+        self.counts: Dict[str, int] = {"succeeded": 0, "failed": 0}
+        self.wait_times: Dict[str, _Timing] = {}
+        self.run_times: Dict[str, _Timing] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._shared = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        if shared_path:
+            from .job_store import SQLiteJobStore
+            self._shared = SQLiteJobStore(shared_path)
+
+    async def start(self):
+        self._ensure_started()
+
+    def _ensure_started(self):
+        # startup 이벤트 없이 사용되는 경우(스크립트, 테스트)를 위해 첫 submit에서도 시작
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        # 워커가 처음 submit한 요청의 컨텍스트(사용량 집계 사용자 등)를 물려받지 않도록 빈 컨텍스트에서 생성
+        self._tasks = [
+            contextvars.Context().run(asyncio.create_task, self._worker()) for _ in range(self.workers)
+        ]
+        if self._shared is not None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-state")
+        log_info(
+            f"작업 큐 시작: 워커 {self.workers}개, 대기열 {self.max_size}"
+            + (f", 상태 공유 {self._shared.path}" if self._shared is not None else "")
+        )
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        if self._writer is not None:
+            # 취소된 작업의 최종 상태까지 기록
+            await asyncio.to_thread(self._writer.shutdown)
+            self._writer = None
+
+    def submit(self, kind: str, user_id: str, work: Callable[[], Awaitable[Any]]) -> Job:
+        """작업을 대기열에 추가 (가득 차면 JobQueueFull)"""
+        self._ensure_started()
+        self._expire()
+        job = Job(kind, user_id, work)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise JobQueueFull(f"대기 중인 작업이 {self.max_size}개입니다")
+        self.jobs[job.id] = job
+        if self._shared is not None:
+            job.on_change = self._persist
+            self._persist(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    async def fetch(self, job_id: str, user_id: str, wait: float) -> Optional[dict]:
+        """user_id의 작업 상태 - 최대 wait초 동안 완료를 기다림 (없거나 다른 사용자의 작업이면 None)
+
+        이 워커의 작업은 메모리에서, 다른 워커의 작업은 공유 저장소를 JOB_POLL_INTERVAL마다 다시 읽어 확인합니다.
+        """
+        job = self.jobs.get(job_id)
+        if job is not None:
+            if job.user_id != user_id:
+                return None
+            await job.wait(wait)
+            return job.to_dict()
+        if self._shared is None:
+            return None
+
+        deadline = time.monotonic() + wait
+        while True:
+            found = await asyncio.to_thread(self._shared.load, job_id)
+            if found is None or found[0] != user_id:
+                return None
+            data = found[1]
+            if data["status"] in ("succeeded", "failed") or time.monotonic() >= deadline:
+                return data
+            await asyncio.sleep(min(JOB_POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+
+    def _persist(self, job: Job):
+        """현재 상태를 공유 저장소에 기록 (기록 순서 유지를 위해 스레드 하나에서 실행)"""
+        if self._writer is not None:
+            self._writer.submit(self._shared.save, job.user_id, job.to_dict())
+
+    def _expire(self):
+        """보관 기간이 지난 완료 작업 삭제"""
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self.jobs.items() if job.finished_at and job.finished_at < cutoff]
+        for job_id in expired:
+            del self.jobs[job_id]
+        if self._writer is not None:
+            self._writer.submit(self._shared.expire, cutoff)
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job):
+        job.status = "running"
+        job.started_at = time.time()
+        self.running += 1
+        self.wait_times.setdefault(job.kind, _Timing()).add(job.started_at - job.created_at)
+        if job.on_change:
+            job.on_change(job)
+        token = _current_job.set(job)
+        try:
+            job.result = await asyncio.wait_for(job._work(), self.timeout)
+            job.status = "succeeded"
+        except asyncio.TimeoutError:
+            job.status = "failed"
+            job.error = f"작업 시간 초과 ({self.timeout:.0f}초)"
+            log_error(f"작업 시간 초과: {job.kind} {job.id}")
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "서버 종료로 작업이 취소되었습니다"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            log_error(f"작업 실패: {job.kind} {job.id} - {e}")
+        finally:
+            _current_job.reset(token)
+            self.running -= 1
+            job.finished_at = time.time()
+            job._work = None
+            self.counts[job.status] = self.counts.get(job.status, 0) + 1
+            self.run_times.setdefault(job.kind, _Timing()).add(job.finished_at - job.started_at)
+            job._done.set()
+            if job.on_change:
+                job.on_change(job)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_max_size": self.max_size,
+            "running": self.running,
+            "retained_jobs": len(self.jobs),
+            "succeeded": self.counts.get("succeeded", 0),
+            "failed": self.counts.get("failed", 0),
+            "rejected": self.rejected,
+            "wait_time": {kind: t.to_dict() for kind, t in self.wait_times.items()},
+            "run_time": {kind: t.to_dict() for kind, t in self.run_times.items()}
+        }
+
+
+# 싱글톤 인스턴스 (워커는 서버 시작 시 start())
+job_queue = JobQueue(JOB_WORKERS, JOB_QUEUE_MAX_SIZE, JOB_TIMEOUT, JOB_RESULT_TTL, JOB_STATE_PATH)
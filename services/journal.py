@@ -0,0 +1,318 @@
+# Backend/services/journal.py
+"""인메모리 저장소 영속화 - append-only 저널 + 주기적 스냅샷
+
+모든 변경은 저널 세그먼트(journal-XXXXXXXX.log, JSON lines)에 추가되고,
+백그라운드 스레드가 fsync_interval마다 모인 레코드를 한 번에 기록/fsync합니다 (지연 fsync).
+변경 연산은 fsync를 기다리지 않고 바로 반환하므로(group commit 아님),
+프로세스나 서버가 비정상 종료되면 이미 응답한 변경 중 마지막 fsync_interval 동안의 것은 유실될 수 있습니다.
+스냅샷 스레드는 세그먼트를 교체한 뒤, 라이브 저장소를 건드리지 않고
+디스크의 이전 스냅샷 + 닫힌 세그먼트만으로 새 스냅샷을 만듭니다.
+콜드 스타트는 스냅샷 로드 후 남은 세그먼트만 재생합니다.
+"""
+
+import os
+import gc
+import json
+import time
+import pickle
+import threading
+from typing import Dict, List, Optional
+
+from .store import DataStore
+from ..utils.logger import log_info, log_error, log_success
+
+SNAPSHOT_FILE = "snapshot.pickle"
+
+
+def _segment_path(directory: str, segment: int) -> str:
+    return os.path.join(directory, f"journal-{segment:08d}.log")
+
+
+def _list_segments(directory: str) -> List[int]:
+    segments = []
+    for name in os.listdir(directory):
+        if name.startswith("journal-") and name.endswith(".log"):
+            segments.append(int(name[len("journal-"):-len(".log")]))
+    return sorted(segments)
+
+
+def export_state(store: DataStore) -> Dict:
+    return {
+        'users': store.users,
+        'tokens': store.tokens,
+        'friendships': store.friendships,
+        'notifications': store.notifications,
+        'quiz_answers': store.quiz_answers,
+        'plans': store.plans
+    }
+
+
+def import_state(store: DataStore, state: Dict):
+    for user in state['users'].values():
+        DataStore._insert_user(store, user)
+    store.tokens.update(state['tokens'])
+    store.friendships.update(state['friendships'])
+    store.notifications.update(state['notifications'])
+    store.quiz_answers.update(state['quiz_answers'])
+    for user_id, plans in state['plans'].items():
+        for plan in plans:
+            DataStore.add_plan(store, user_id, plan)
+
+
+def apply_record(store: DataStore, record: List):
+    """저널 레코드 하나를 저장소에 재적용 (DataStore 메서드 직접 호출 - 재기록 없음)"""
+    op = record[0]
+    if op == "user":
+        DataStore._insert_user(store, record[1])
+    elif op == "token":
+        store.tokens[record[1]] = record[2]
+    elif op == "logout":
+        DataStore.logout(store, record[1])
+    elif op == "email":
+        DataStore.update_email(store, record[1], record[2])
+    elif op == "profile":
+        DataStore._set_user_fields(store, record[1], record[2])
+    elif op == "friend":
+        DataStore.add_friendship(store, record[1], record[2])
+    elif op == "notify":
+        DataStore.add_notification(store, record[1], record[2])
+    elif op == "notify_read":
+        DataStore.mark_notifications_read(store, record[1])
+    elif op == "quiz":
+        DataStore.set_quiz_answers(store, record[1], record[2])
+    elif op == "plan":
+        DataStore.add_plan(store, record[1], record[2])
+    elif op == "task":
+        DataStore.update_task(store, record[1], record[2], record[3], record[4])
+    else:
+        raise ValueError(f"알 수 없는 저널 레코드: {op}")
+
+
+def load_into(store: DataStore, directory: str, upto: Optional[int] = None, pause_gc: bool = False) -> int:
+    """스냅샷 + 세그먼트(upto 미만)를 store에 적재하고, 재생한 레코드 수를 반환
+
+    pause_gc=True면 적재하는 동안 순환 GC를 멈춥니다 (수백만 개의 dict를 만드는 동안 GC가 반복 실행되지 않도록).
+    GC 중지는 프로세스 전체에 적용되므로, 요청을 처리하는 중에 도는 스냅샷 스레드에서는 쓰지 않고
+    서버 시작 전 복구에서만 사용합니다.
+    """
+    if not pause_gc:
+        return _load_into(store, directory, upto)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _load_into(store, directory, upto)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _load_into(store: DataStore, directory: str, upto: Optional[int]) -> int:
+    first_segment = 0
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+        first_segment = snapshot['segment']
+        import_state(store, snapshot['state'])
+
+    replayed = 0
+    for segment in _list_segments(directory):
+        if segment < first_segment or (upto is not None and segment >= upto):
+            continue
+        with open(_segment_path(directory, segment), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 마지막 줄이 기록 도중 끊긴 경우 - 해당 세그먼트는 여기까지만 유효
+                    log_error(f"저널 세그먼트 {segment} 손상된 줄 무시")
+                    break
+                apply_record(store, record)
+                replayed += 1
+    return replayed
+
+
+class StoreJournal:
+    """저널 세그먼트 writer - 버퍼링 후 주기적으로 write + fsync (지연 fsync)"""
+
+    def __init__(self, directory: str, segment: int, fsync_interval: float):
+        self.directory = directory
+        self.segment = segment
+        self.fsync_interval = fsync_interval
+        self.appended = 0
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._file = open(_segment_path(directory, segment), 'a', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, name="store-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, record: List):
+        """레코드를 버퍼에 추가 - 디스크 기록을 기다리지 않음 (다음 flush까지는 비정상 종료 시 유실 가능)"""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            self.appended += 1
+
+    def _flush_locked(self):
+        """_io_lock을 잡은 상태에서 호출 - 버퍼를 현재 세그먼트에 기록 후 fsync"""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if lines:
+            self._file.write(''.join(lines))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def flush(self):
+        with self._io_lock:
+            self._flush_locked()
+
+    def rotate(self) -> int:
+        """새 세그먼트로 교체하고 새 세그먼트 번호를 반환 (이전 세그먼트는 닫힘)"""
+        with self._io_lock:
+            self._flush_locked()
+            self._file.close()
+            self.segment += 1
+            self._file = open(_segment_path(self.directory, self.segment), 'a', encoding='utf-8')
+            return self.segment
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.fsync_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                log_error(f"저널 기록 실패: {e}")
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        with self._io_lock:
+            self._flush_locked()
+            self._file.close()
+
+
+class JournaledDataStore(DataStore):
+    """변경 내역을 저널에 남기는 인메모리 저장소"""
+
+    def __init__(self, directory: str, fsync_interval: float = 0.05, snapshot_interval: float = 300):
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self._journal: Optional[StoreJournal] = None
+
+        start = time.perf_counter()
+        replayed = load_into(self, directory, pause_gc=True)
+        log_success(
+            f"저장소 복구 완료: 사용자 {len(self.users)}명, 저널 {replayed}건 재생 "
+            f"({time.perf_counter() - start:.2f}초)"
+        )
+
+        # 이전 세그먼트에는 이어 쓰지 않음 (끊긴 마지막 줄 보호)
+        segments = _list_segments(directory)
+        self._journal = StoreJournal(directory, (segments[-1] + 1) if segments else 0, fsync_interval)
+        self._snapshotted_at = self._journal.appended
+        self._stop = threading.Event()
+        self._snapshot_thread = threading.Thread(target=self._snapshot_loop, name="store-snapshot", daemon=True)
+        self._snapshot_thread.start()
+
+    def _log(self, *record):
+        if self._journal is not None:
+            self._journal.append(list(record))
+
+    # ───────── 변경 연산 (저널 기록) ─────────
+
+    def _insert_user(self, user: Dict) -> Dict:
+        result = super()._insert_user(user)
+        self._log("user", user)
+        return result
+
+    def issue_token(self, user_id: str) -> str:
+        token = super().issue_token(user_id)
+        self._log("token", token, user_id)
+        return token
+
+    def logout(self, token: str) -> bool:
+        removed = super().logout(token)
+        if removed:
+            self._log("logout", token)
+        return removed
+
+    def update_email(self, user_id: str, email: str) -> bool:
+        updated = super().update_email(user_id, email)
+        if updated:
+            self._log("email", user_id, email)
+        return updated
+
+    def _set_user_fields(self, user_id: str, fields: Dict):
+        super()._set_user_fields(user_id, fields)
+        if fields:
+            self._log("profile", user_id, fields)
+
+    def add_friendship(self, user_id: str, friend_id: str):
+        super().add_friendship(user_id, friend_id)
+        self._log("friend", user_id, friend_id)
+
+    def add_notification(self, user_id: str, message: str):
+        super().add_notification(user_id, message)
+        self._log("notify", user_id, message)
+
+    def mark_notifications_read(self, user_id: str):
+        super().mark_notifications_read(user_id)
+        self._log("notify_read", user_id)
+
+    def set_quiz_answers(self, user_id: str, quizzes: List[Dict]):
+        super().set_quiz_answers(user_id, quizzes)
+        self._log("quiz", user_id, quizzes)
+
+    def add_plan(self, user_id: str, plan: Dict):
+        super().add_plan(user_id, plan)
+        self._log("plan", user_id, plan)
+
+    def update_task(self, user_id: str, day_date: str, task_id: str, completed: bool) -> Optional[Dict]:
+        task = super().update_task(user_id, day_date, task_id, completed)
+        if task:
+            self._log("task", user_id, day_date, task_id, completed)
+        return task
+
+    # ───────── 스냅샷 ─────────
+
+    def snapshot(self):
+        """세그먼트를 교체하고, 닫힌 세그먼트까지를 새 스냅샷으로 압축"""
+        self._snapshotted_at = self._journal.appended
+        segment = self._journal.rotate()
+
+        start = time.perf_counter()
+        compacted = DataStore()
+        load_into(compacted, self.directory, upto=segment)
+
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp_path = snapshot_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'segment': segment, 'state': export_state(compacted)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, snapshot_path)
+
+        for old in _list_segments(self.directory):
+            if old < segment:
+                os.remove(_segment_path(self.directory, old))
+        log_info(f"저장소 스냅샷 완료: 세그먼트 {segment} 이전 압축 ({time.perf_counter() - start:.2f}초)")
+
+    def _snapshot_loop(self):
+        while not self._stop.wait(self.snapshot_interval):
+            if self._journal.appended == self._snapshotted_at:
+                continue
+            try:
+                self.snapshot()
+            except Exception as e:
+                log_error(f"저장소 스냅샷 실패: {e}")
+
+    def close(self):
+        self._stop.set()
+        self._snapshot_thread.join()
+        self._journal.close()
@@ -0,0 +1,197 @@
+# Backend/services/json_extract.py
+"""GPT 응답에서 JSON 객체를 한 번의 순회로 추출 (스트리밍 조각 입력 지원)
+
+문자열 안/밖에서 의미 있는 문자만 정규식으로 건너뛰며 찾고, 그 사이 구간은 그대로 복사합니다.
+괄호 균형으로 객체의 끝을 찾으며, 추출하면서 다음을 함께 보정합니다.
+- 닫는 괄호 앞의 trailing comma 제거
+- 문자열 안의 제어 문자(줄바꿈/탭 등)를 이스케이프, 잘못된 이스케이프(\\x 등)는 역슬래시를 이스케이프
+- ```json 코드블록이 있으면 그 안의 객체를 우선 사용
+- 자릿수 쉼표만 있는 문자열 값은 쉼표 제거 (예: "1,234" -> "1234", 기존 extract_json과 같은 동작)
+완성된 후보가 파싱되지 않으면 다음 '{'부터 다시 찾습니다.
+"""
+
+import re
+import json
+from typing import Dict, List, Optional
+
+# 문자열 밖: 보정이 필요 없는 완전한 문자열(한 번에 복사), 따옴표, 괄호, 쉼표, (공백류를 제외한) 제어 문자
+_OUTSIDE = re.compile(r'"(?:[^"\\\x00-\x1f]|\\["\\/bfnrtu])*"|["{}\[\],\x00-\x08\x0b\x0c\x0e-\x1f]')
+# 문자열 안: 따옴표, 역슬래시, 제어 문자
+_INSIDE = re.compile(r'["\\\x00-\x1f]')
+_NON_SPACE = re.compile(r'\S')
+_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+_VALID_ESCAPES = frozenset('"\\/bfnrtu')
+
+CODE_FENCE = '```json'
+
+# 따옴표로 감싼 자릿수 구분 숫자 ("1,234") - 응답에 있을 때만 파싱 결과를 순회하며 보정
+_GROUPED_NUMBER = re.compile(r'"\d{1,3}(?:,\d{3})+"')
+_GROUPED_VALUE = re.compile(r'\d{1,3}(?:,\d{3})+')
+
+
+def _strip_grouping(value):
+    """문자열 값(키 포함)이 자릿수 쉼표 숫자 전체이면 쉼표 제거"""
+    if isinstance(value, str):
+        return value.replace(',', '') if _GROUPED_VALUE.fullmatch(value) else value
+    if isinstance(value, dict):
+        return {_strip_grouping(k): _strip_grouping(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_strip_grouping(v) for v in value]
+    return value
+
+
+def _fix_grouping(result, text: str, start: int = 0, end: Optional[int] = None):
+    if _GROUPED_NUMBER.search(text, start, len(text) if end is None else end):
+        return _strip_grouping(result)
+    return result
+
+
+class JSONExtractor:
+    """텍스트 조각을 순서대로 feed()하면 첫 번째로 완성된 JSON 객체를 반환
+
+    완성 후 result/done이 설정되고, 객체 뒤에 남은 텍스트는 remainder에 남습니다.
+    """
+
+    def __init__(self):
+        self.result: Optional[Dict] = None
+        self.done = False
+        self.remainder = ""
+        self._reset()
+
+    def _reset(self):
+        self._parts: List[str] = []
+        self._raw: List[str] = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._comma = False
+
+    def feed(self, chunk: str) -> Optional[Dict]:
+        pending = chunk
+        while pending and not self.done:
+            end = self._scan(pending)
+            if end is None:
+                break
+            try:
+                candidate = ''.join(self._parts)
+                self.result = _fix_grouping(json.loads(candidate), candidate)
+                self.done = True
+                self.remainder = pending[end:]
+            except json.JSONDecodeError:
+                # 후보의 여는 괄호 다음부터 다시 탐색
+                retry = ''.join(self._raw)[1:] + pending[end:]
+                self._reset()
+                pending = retry
+        return self.result
+
+    def _scan(self, text: str) -> Optional[int]:
+        """text를 이어서 검사 - 객체가 닫히면 그 다음 위치, 아니면 None"""
+        n = len(text)
+        if not self._started:
+            pos = text.find('{')
+            if pos < 0:
+                return None
+            self._started = True
+        else:
+            pos = 0
+        raw_start = pos
+        parts = self._parts
+
+        while pos < n:
+            if self._in_string:
+                if self._escape:
+                    c = text[pos]
+                    parts.append('\\' + c if c in _VALID_ESCAPES else '\\\\' + c)
+                    self._escape = False
+                    pos += 1
+                    continue
+                m = _INSIDE.search(text, pos)
+                if m is None:
+                    parts.append(text[pos:])
+                    pos = n
+                    break
+                i = m.start()
+                if i > pos:
+                    parts.append(text[pos:i])
+                c = text[i]
+                pos = i + 1
+                if c == '"':
+                    self._in_string = False
+                    parts.append('"')
+                elif c == '\\':
+                    self._escape = True
+                else:
+                    parts.append(_CONTROL_ESCAPES.get(c, ' '))
+            else:
+                if self._comma:
+                    # 쉼표 다음 첫 글자가 닫는 괄호면 쉼표를 버림
+                    m = _NON_SPACE.search(text, pos)
+                    if m is None:
+                        pos = n
+                        break
+                    pos = m.start()
+                    if text[pos] not in '}]':
+                        parts.append(',')
+                    self._comma = False
+                m = _OUTSIDE.search(text, pos)
+                if m is None:
+                    parts.append(text[pos:])
+                    pos = n
+                    break
+                i = m.start()
+                if m.end() - i > 1:
+                    # 조각 안에서 닫힌 정상 문자열 - 앞 구간과 함께 그대로 복사
+                    parts.append(text[pos:m.end()])
+                    pos = m.end()
+                    continue
+                if i > pos:
+                    parts.append(text[pos:i])
+                c = text[i]
+                pos = i + 1
+                if c == '"':
+                    self._in_string = True
+                    parts.append('"')
+                elif c == '{' or c == '[':
+                    self._depth += 1
+                    parts.append(c)
+                elif c == '}' or c == ']':
+                    self._depth -= 1
+                    parts.append(c)
+                    if self._depth == 0:
+                        self._raw.append(text[raw_start:pos])
+                        return pos
+                elif c == ',':
+                    self._comma = True
+                else:
+                    parts.append(' ')
+
+        self._raw.append(text[raw_start:pos])
+        return None
+
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+def extract_json_object(text: str) -> Optional[Dict]:
+    """전체 텍스트에서 JSON 객체 추출 (```json 코드블록 우선)
+
+    보정이 필요 없는 응답은 첫 '{'에서 C 디코더(raw_decode)로 바로 읽고,
+    실패하면 JSONExtractor로 보정하며 다시 추출합니다.
+    """
+    fence = text.find(CODE_FENCE)
+    start = text.find('{', fence + len(CODE_FENCE) if fence >= 0 else 0)
+    if start < 0:
+        return None
+    try:
+        result, end = _decoder.raw_decode(text, start)
+        if isinstance(result, dict):
+            return _fix_grouping(result, text, start, end)
+    except json.JSONDecodeError:
+        pass
+
+    if fence >= 0:
+        result = JSONExtractor().feed(text[fence + len(CODE_FENCE):])
+        if result is not None:
+            return result
+    return JSONExtractor().feed(text)
@@ -0,0 +1,131 @@
+# Backend/services/plan_builder.py
+"""주차별(shard) 학습 계획 생성 보조 함수 - 날짜 범위 계산, 주차 결과 병합/검증"""
+
+import os
+import re
+import uuid
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 계획 생성 방식 - "single": GPT 1회로 28일 생성, "sharded": 개요 생성 후 주차별 병렬 생성
+PLAN_GENERATION_MODE = os.getenv("PLAN_GENERATION_MODE", "single")
+PLAN_WEEKS = 4
+
+DAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+_HOURS_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*시간')
+_MINUTES_PATTERN = re.compile(r'(\d+)\s*분')
+
+
+def parse_start_date(start_date: str) -> date:
+    """'YYYY-MM-DD' 또는 ISO8601 문자열의 날짜 부분"""
+    return date.fromisoformat(start_date.split('T')[0])
+
+
+def study_dates(start: date, rest_days: List[str], weeks: int = PLAN_WEEKS) -> List[List[str]]:
+    """주차별 학습 날짜 목록 (쉬는 요일 제외, 주차는 시작일 기준 7일 단위)"""
+    result = []
+    for week in range(weeks):
+        dates = []
+        for offset in range(7):
+            current = start + timedelta(days=week * 7 + offset)
+            if DAY_NAMES[current.weekday()] not in rest_days:
+                dates.append(current.isoformat())
+        result.append(dates)
+    return result
+
+
+def parse_duration_minutes(duration: str) -> Optional[int]:
+    """'1시간 30분', '1.5시간', '90분' 형식의 소요 시간을 분 단위로 변환 (해석 불가 시 None)"""
+    if not isinstance(duration, str):
+        return None
+    hours = _HOURS_PATTERN.search(duration)
+    minutes = _MINUTES_PATTERN.search(duration)
+    if not hours and not minutes:
+        return None
+    total = 0.0
+    if hours:
+        total += float(hours.group(1)) * 60
+    if minutes:
+        total += int(minutes.group(1))
+    return int(round(total))
+
+
+def format_duration(minutes: int) -> str:
+    hours, rest = divmod(minutes, 60)
+    if hours and rest:
+        return f"{hours}시간 {rest}분"
+    if hours:
+        return f"{hours}시간"
+    return f"{rest}분"
+
+
+def _fit_tasks(tasks: List[Dict], limit_minutes: int) -> List[Dict]:
+    """하루 공부 시간 상한에 맞게 태스크 정리 - 넘치는 태스크는 제외하고, 첫 태스크는 상한으로 줄임"""
+    fitted = []
+    used = 0
+    for task in tasks:
+        if not isinstance(task, dict) or not task.get('title'):
+            continue
+        minutes = parse_duration_minutes(task.get('duration'))
+        if minutes is None:
+            fitted.append(task)
+            continue
+        if used + minutes > limit_minutes:
+            if fitted:
+                continue
+            minutes = limit_minutes
+            task['duration'] = format_duration(minutes)
+        used += minutes
+        fitted.append(task)
+    return fitted
+
+
+def _default_day(day_date: str, topic: str, hour_per_day: float) -> Dict:
+    return {
+        "date": day_date,
+        "tasks": [
+            {
+                "id": str(uuid.uuid4()),
+                "title": topic,
+                "description": f"{topic} 학습을 진행합니다.",
+                "duration": format_duration(max(int(hour_per_day * 60), 10)),
+                "completed": False
+            }
+        ]
+    }
+
+
+def merge_week_schedules(
+    week_dates: List[List[str]],
+    week_schedules: List[Optional[List[Dict]]],
+    week_topics: List[List[str]],
+    hour_per_day: float
+) -> List[Dict]:
+    """주차별 GPT 결과를 날짜 순으로 병합
+
+    - 해당 주차의 학습 날짜(쉬는 요일 제외)만 사용하고, 같은 날짜는 처음 것만 남김
+    - 하루 태스크 소요 시간 합이 hour_per_day를 넘지 않도록 조정
+    - 결과가 없거나 빠진 날짜는 주차 주제로 기본 태스크를 채움
+    """
+    limit_minutes = max(int(hour_per_day * 60), 10)
+    merged = []
+    for dates, schedule, topics in zip(week_dates, week_schedules, week_topics):
+        by_date: Dict[str, Dict] = {}
+        for day in schedule or []:
+            if not isinstance(day, dict) or day.get('date') not in dates or day['date'] in by_date:
+                continue
+            tasks = _fit_tasks(day.get('tasks') or [], limit_minutes)
+            if tasks:
+                by_date[day['date']] = {**day, "tasks": tasks}
+
+        for index, day_date in enumerate(dates):
+            day = by_date.get(day_date)
+            if day is None:
+                topic = topics[index % len(topics)] if topics else "학습"
+                day = _default_day(day_date, topic, hour_per_day)
+            merged.append(day)
+    return merged
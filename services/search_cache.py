@@ -0,0 +1,179 @@
+# Backend/services/search_cache.py
+"""웹 검색 결과 디스크 캐시 (SQLite)"""
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from typing import List, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+from ..utils.logger import log_error
+
+load_dotenv()
+
+# 빈 문자열이면 디스크 캐시 비활성화 (SHARED_STATE_DIR 지정 시 해당 디렉터리에 생성)
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", "")
+SEARCH_CACHE_PATH = os.getenv(
+    "SEARCH_CACHE_PATH", os.path.join(SHARED_STATE_DIR, "search_cache.db") if SHARED_STATE_DIR else "search_cache.db"
+)
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(7 * 24 * 3600)))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "50000"))
+
+
+class SearchResultCache:
+    """(provider, 정규화된 검색어, max_results) 기준 검색 결과 캐시
+
+    TTL이 지난 항목은 조회 시 무시되고, 항목 수가 상한을 넘으면
+    가장 오래 조회되지 않은 항목부터 삭제합니다.
+    조회 시각(accessed_at)은 적중할 때마다 쓰지 않고 모아 두었다가 다음 저장 때 한 번에 기록합니다.
+    비동기 코드에서는 aget/aset을 사용합니다 (스레드에서 실행).
+    항목 수(entries)는 연결을 열 때와 저장할 때 세어 두므로 stats()는 DB에 접근하지 않습니다.
+    """
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.entries = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # 기록 대기 중인 조회 시각 (키 -> 마지막 적중 시각)
+        self._touched: Dict[Tuple[str, str, int], float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return ' '.join(query.lower().split())
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    provider TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    results TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (provider, query, max_results)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache(accessed_at)")
+            conn.commit()
+            self.entries = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, provider: str, query: str, max_results: int) -> Optional[List[Dict]]:
+        if not self.enabled:
+            return None
+        key = (provider, self.normalize_query(query), max_results)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT results, created_at FROM search_cache WHERE provider=? AND query=? AND max_results=?",
+                    key
+                ).fetchone()
+                if row is None or row[1] + self.ttl <= now:
+                    self.misses += 1
+                    return None
+                self._touched[key] = now
+                self.hits += 1
+            return json.loads(row[0])
+        except sqlite3.Error as e:
+            log_error(f"검색 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, provider: str, query: str, max_results: int, results: List[Dict]):
+        if not self.enabled:
+            return
+        key = (provider, self.normalize_query(query), max_results)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, json.dumps(results, ensure_ascii=False), now, now)
+                )
+                self.writes += 1
+                self._flush_touched(conn)
+                self._evict(conn, now)
+                conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"검색 캐시 저장 실패: {e}")
+
+    async def aget(self, provider: str, query: str, max_results: int) -> Optional[List[Dict]]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, provider, query, max_results)
+
+    async def aset(self, provider: str, query: str, max_results: int, results: List[Dict]):
+        if self.enabled:
+            await asyncio.to_thread(self.set, provider, query, max_results, results)
+
+    def _flush_touched(self, conn: sqlite3.Connection):
+        """_lock 안에서 호출 - 모아 둔 조회 시각 기록 (오래된 항목 삭제 순서에만 쓰임)"""
+        if self._touched:
+            conn.executemany(
+                "UPDATE search_cache SET accessed_at=? WHERE provider=? AND query=? AND max_results=?",
+                [(accessed_at, *key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        expired = conn.execute("DELETE FROM search_cache WHERE created_at <= ?", (now - self.ttl,)).rowcount
+        count = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM search_cache WHERE rowid IN "
+                "(SELECT rowid FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+        self.evictions += expired + max(overflow, 0)
+        self.entries = min(count, self.max_entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": self.entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    with self._conn:
+                        self._flush_touched(self._conn)
+                except sqlite3.Error as e:
+                    log_error(f"검색 캐시 조회 시각 기록 실패: {e}")
+                self._conn.close()
+                self._conn = None
+
+
+# 싱글톤 인스턴스
+search_cache = SearchResultCache(SEARCH_CACHE_PATH, SEARCH_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES)
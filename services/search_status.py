@@ -0,0 +1,105 @@
+# Backend/services/search_status.py
+"""GPT 웹 검색 진행 상태 - 요청(또는 작업) 단위로 기록
+
+각 검색은 search_id로 구분되며 모델, 시도 횟수(1차/2차), 상태, 경과 시간을 가집니다.
+항목은 시작 후 SEARCH_STATUS_TTL이 지나면 자동으로 삭제됩니다.
+상태는 프로세스 메모리에만 있으므로 멀티 워커 배포(SHARED_STATE_DIR)에서는 검색을 실행한 워커로
+조회가 들어온 경우에만 진행 상태가 보이고, 다른 워커에서는 idle로 응답합니다.
+"""
+
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional
+from dotenv import load_dotenv
+
+from .jobs import current_job_id
+
+load_dotenv()
+
+SEARCH_STATUS_TTL = float(os.getenv("SEARCH_STATUS_TTL", "600"))
+SEARCH_STATUS_MAX_ENTRIES = int(os.getenv("SEARCH_STATUS_MAX_ENTRIES", "10000"))
+
+
+class SearchStatusRegistry:
+    """search_id -> 검색 상태 (시작 순서로 보관, 오래된 항목부터 만료)"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._latest_by_user: Dict[str, str] = {}
+
+    def start(self, user_id: str, search_id: Optional[str] = None) -> str:
+        """새 검색 등록 후 search_id 반환 (지정하지 않으면 현재 작업 id 또는 새 UUID)
+
+        다른 사용자가 쓰고 있는 search_id가 지정되면 그 항목을 덮어쓰지 않고 새 UUID를 발급합니다.
+        """
+        search_id = search_id or current_job_id() or str(uuid.uuid4())
+        existing = self._entries.get(search_id)
+        if existing is not None and existing["user_id"] != user_id:
+            search_id = str(uuid.uuid4())
+        now = time.time()
+        self._entries.pop(search_id, None)
+        self._entries[search_id] = {
+            "user_id": user_id,
+            "model": None,
+            "attempt": 0,
+            "status": "queued",
+            "started_at": now,
+            "finished_at": None
+        }
+        self._latest_by_user[user_id] = search_id
+        self._expire(now)
+        return search_id
+
+    def update(self, search_id: Optional[str], model: str, status: str, attempt: Optional[int] = None):
+        entry = self._entries.get(search_id) if search_id else None
+        if entry is None:
+            return
+        entry["model"] = model
+        entry["status"] = status
+        if attempt is not None:
+            entry["attempt"] = attempt
+        if status in ("completed", "failed"):
+            entry["finished_at"] = time.time()
+
+    def get(self, search_id: str, user_id: str) -> dict:
+        """검색 상태 조회 - 없거나 만료되었거나 다른 사용자의 검색이면 idle"""
+        self._expire(time.time())
+        entry = self._entries.get(search_id)
+        if entry is None or entry["user_id"] != user_id:
+            return {"search_id": search_id, "model": None, "attempt": 0, "status": "idle", "elapsed_ms": 0}
+        end = entry["finished_at"] or time.time()
+        return {
+            "search_id": search_id,
+            "model": entry["model"],
+            "attempt": entry["attempt"],
+            "status": entry["status"],
+            "elapsed_ms": int((end - entry["started_at"]) * 1000)
+        }
+
+    def latest(self, user_id: str) -> dict:
+        """사용자의 가장 최근 검색 상태 (search_id 없이 조회하는 기존 클라이언트용)"""
+        search_id = self._latest_by_user.get(user_id)
+        if search_id is None:
+            return {"search_id": None, "model": None, "attempt": 0, "status": "idle", "elapsed_ms": 0}
+        return self.get(search_id, user_id)
+
+    def _expire(self, now: float):
+        cutoff = now - self.ttl
+        while self._entries:
+            search_id, entry = next(iter(self._entries.items()))
+            if entry["started_at"] > cutoff and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+            if self._latest_by_user.get(entry["user_id"]) == search_id:
+                del self._latest_by_user[entry["user_id"]]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "ttl": self.ttl, "max_entries": self.max_entries}
+
+
+# 싱글톤 인스턴스
+search_status = SearchStatusRegistry(SEARCH_STATUS_TTL, SEARCH_STATUS_MAX_ENTRIES)
@@ -0,0 +1,471 @@
+# Backend/services/sqlite_store.py
+"""SQLite 데이터 저장소 - DataStore와 같은 인터페이스"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import os
+import json
+import sqlite3
+import threading
+import uuid
+import hashlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    name TEXT NOT NULL,
+    birth TEXT NOT NULL,
+    photo_url TEXT,
+    friend_code TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    token TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS friendships (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    friend_id TEXT NOT NULL,
+    UNIQUE (user_id, friend_id)
+);
+CREATE TABLE IF NOT EXISTS notifications (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    message TEXT NOT NULL,
+    read_seq INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id, read_seq);
+CREATE TABLE IF NOT EXISTS quiz_answers (
+    user_id TEXT PRIMARY KEY,
+    quizzes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plans (
+    plan_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    meta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_plans_user ON plans(user_id, plan_id);
+CREATE TABLE IF NOT EXISTS plan_days (
+    plan_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    date TEXT,
+    meta TEXT NOT NULL,
+    PRIMARY KEY (plan_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_plan_days_date ON plan_days(plan_id, date, position);
+CREATE TABLE IF NOT EXISTS plan_tasks (
+    plan_id INTEGER NOT NULL,
+    day_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    task_id TEXT,
+    completed INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (plan_id, day_position, position)
+);
+CREATE INDEX IF NOT EXISTS idx_plan_tasks_id ON plan_tasks(plan_id, task_id);
+CREATE TABLE IF NOT EXISTS user_versions (
+    user_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+USER_COLUMNS = ('user_id', 'username', 'email', 'password', 'name', 'birth', 'photo_url', 'friend_code', 'created_at')
+
+
+class SQLiteDataStore:
+    """SQLite(WAL) 기반 저장소
+
+    계획은 plans/plan_days/plan_tasks 세 테이블로 나누어 저장하므로
+    태스크 완료 변경은 한 행만 갱신하고, 날짜 조회는 (plan_id, date) 인덱스를 사용합니다.
+    반환되는 dict는 복사본이므로 변경은 반드시 메서드를 통해야 합니다.
+    사용자별 변경 카운터(user_versions)는 변경과 같은 트랜잭션에서 증가하므로 워커 간에 공유됩니다.
+    """
+
+    # 카운터가 DB에 저장되므로 재시작/워커와 무관하게 같은 값
+    epoch = "db"
+    # 라우터는 astore를 통해 스레드에서 호출 (services/store.py AsyncStore)
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # 여러 워커 프로세스가 같은 파일을 열 수 있으므로 쓰기 잠금은 최대 10초 대기
+        self._conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _query_all(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, sql: str, params: tuple = (), bump: Tuple[str, ...] = ()) -> sqlite3.Cursor:
+        """변경 실행 - 행이 바뀌었으면 bump 사용자들의 변경 카운터도 같은 트랜잭션에서 증가"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(sql, params)
+            if bump and cursor.rowcount > 0:
+                self._bump(*bump)
+            return cursor
+
+    def _bump(self, *user_ids: str):
+        """_lock + 트랜잭션 안에서 호출"""
+        self._conn.executemany(
+            "INSERT INTO user_versions (user_id, version) VALUES (?, 1) "
+            "ON CONFLICT(user_id) DO UPDATE SET version = version + 1",
+            [(user_id,) for user_id in user_ids]
+        )
+
+    def get_version(self, user_id: str) -> int:
+        row = self._query_one("SELECT version FROM user_versions WHERE user_id=?", (user_id,))
+        return row['version'] if row else 0
+
+    def get_versions(self, user_ids: List[str]) -> Dict[str, int]:
+        if not user_ids:
+            return {}
+        rows = self._query_all(
+            f"SELECT user_id, version FROM user_versions WHERE user_id IN ({', '.join('?' * len(user_ids))})",
+            tuple(user_ids)
+        )
+        versions = {r['user_id']: r['version'] for r in rows}
+        return {user_id: versions.get(user_id, 0) for user_id in user_ids}
+
+    # ───────── 사용자 / 인증 ─────────
+
+    def create_user(self, username: str, email: str, password: str, name: str, birth: str, photo_url: str = None) -> Optional[Dict]:
+        user_id = str(uuid.uuid4())
+        user = {
+            'user_id': user_id,
+            'username': username,
+            'email': email,
+            'password': hashlib.sha256(password.encode()).hexdigest(),
+            'name': name,
+            'birth': birth,
+            'photo_url': photo_url,
+            'friend_code': hashlib.md5(user_id.encode()).hexdigest()[:8].upper(),
+            'created_at': datetime.now().isoformat()
+        }
+        try:
+            self._write(
+                f"INSERT INTO users ({', '.join(USER_COLUMNS)}) VALUES ({', '.join('?' * len(USER_COLUMNS))})",
+                tuple(user[c] for c in USER_COLUMNS)
+            )
+        except sqlite3.IntegrityError:
+            return None
+        return user
+
+    def login(self, email: str, password: str) -> Optional[Dict]:
+        row = self._query_one("SELECT user_id, password, name FROM users WHERE email=?", (email,))
+        if not row or row['password'] != hashlib.sha256(password.encode()).hexdigest():
+            return None
+        token = self.issue_token(row['user_id'])
+        return {'token': token, 'user_id': row['user_id'], 'name': row['name']}
+
+    def get_user(self, user_id: str) -> Optional[Dict]:
+        row = self._query_one("SELECT * FROM users WHERE user_id=?", (user_id,))
+        return dict(row) if row else None
+
+    def get_default_user(self) -> Optional[Dict]:
+        row = self._query_one("SELECT * FROM users ORDER BY rowid LIMIT 1")
+        return dict(row) if row else None
+
+    def issue_token(self, user_id: str) -> str:
+        token = str(uuid.uuid4())
+        self._write("INSERT INTO tokens (token, user_id) VALUES (?, ?)", (token, user_id))
+        return token
+
+    def update_user(self, user_id: str, name: str = None, birth: str = None, password: str = None):
+        fields = {}
+        if name:
+            fields['name'] = name
+        if birth:
+            fields['birth'] = birth
+        if password:
+            fields['password'] = hashlib.sha256(password.encode()).hexdigest()
+        if fields:
+            assignments = ', '.join(f"{k}=?" for k in fields)
+            self._write(f"UPDATE users SET {assignments} WHERE user_id=?", (*fields.values(), user_id), bump=(user_id,))
+
+    def update_email(self, user_id: str, email: str) -> bool:
+        try:
+            self._write("UPDATE users SET email=? WHERE user_id=?", (email, user_id), bump=(user_id,))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def get_user_by_token(self, token: str) -> Optional[Dict]:
+        row = self._query_one(
+            "SELECT users.* FROM tokens JOIN users ON users.user_id = tokens.user_id WHERE tokens.token=?",
+            (token,)
+        )
+        return dict(row) if row else None
+
+    def get_user_id_by_token(self, token: str) -> Optional[str]:
+        row = self._query_one("SELECT user_id FROM tokens WHERE token=?", (token,))
+        return row['user_id'] if row else None
+
+    def logout(self, token: str) -> bool:
+        return self._write("DELETE FROM tokens WHERE token=?", (token,)).rowcount > 0
+
+    # ───────── 친구 / 알림 / 퀴즈 ─────────
+
+    def get_user_id_by_friend_code(self, friend_code: str) -> Optional[str]:
+        row = self._query_one("SELECT user_id FROM users WHERE friend_code=?", (friend_code,))
+        return row['user_id'] if row else None
+
+    def get_friend_ids(self, user_id: str) -> List[str]:
+        rows = self._query_all("SELECT friend_id FROM friendships WHERE user_id=? ORDER BY seq", (user_id,))
+        return [r['friend_id'] for r in rows]
+
+    def are_friends(self, user_id: str, friend_id: str) -> bool:
+        return self._query_one(
+            "SELECT 1 FROM friendships WHERE user_id=? AND friend_id=?", (user_id, friend_id)
+        ) is not None
+
+    def add_friendship(self, user_id: str, friend_id: str):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO friendships (user_id, friend_id) VALUES (?, ?)",
+                [(user_id, friend_id), (friend_id, user_id)]
+            )
+            self._bump(user_id, friend_id)
+
+    def add_notification(self, user_id: str, message: str):
+        self._write("INSERT INTO notifications (user_id, message) VALUES (?, ?)", (user_id, message), bump=(user_id,))
+
+    def get_notifications(self, user_id: str) -> Dict[str, List[str]]:
+        new = self._query_all(
+            "SELECT message FROM notifications WHERE user_id=? AND read_seq IS NULL ORDER BY seq", (user_id,)
+        )
+        # 읽음 처리 묶음이 최근일수록 앞 (인메모리 저장소의 new + old 순서와 동일)
+        old = self._query_all(
+            "SELECT message FROM notifications WHERE user_id=? AND read_seq IS NOT NULL ORDER BY read_seq DESC, seq",
+            (user_id,)
+        )
+        return {'new': [r['message'] for r in new], 'old': [r['message'] for r in old]}
+
+    def mark_notifications_read(self, user_id: str):
+        with self._lock, self._conn:
+            read_seq = self._conn.execute(
+                "SELECT COALESCE(MAX(read_seq), 0) + 1 FROM notifications WHERE user_id=?", (user_id,)
+            ).fetchone()[0]
+            updated = self._conn.execute(
+                "UPDATE notifications SET read_seq=? WHERE user_id=? AND read_seq IS NULL", (read_seq, user_id)
+            ).rowcount
+            if updated:
+                self._bump(user_id)
+
+    def set_quiz_answers(self, user_id: str, quizzes: List[Dict]):
+        self._write(
+            "INSERT OR REPLACE INTO quiz_answers (user_id, quizzes) VALUES (?, ?)",
+            (user_id, json.dumps(quizzes, ensure_ascii=False)),
+            bump=(user_id,)
+        )
+
+    def get_quiz_answers(self, user_id: str) -> List[Dict]:
+        row = self._query_one("SELECT quizzes FROM quiz_answers WHERE user_id=?", (user_id,))
+        return json.loads(row['quizzes']) if row else []
+
+    # ───────── 학습 계획 ─────────
+
+    def add_plan(self, user_id: str, plan: Dict):
+        """계획 저장 - 하나의 트랜잭션에서 day/task 행을 일괄 삽입"""
+        meta = {k: v for k, v in plan.items() if k != 'daily_schedule'}
+        day_rows = []
+        task_rows = []
+        for day_pos, day in enumerate(plan.get('daily_schedule', [])):
+            day_meta = {k: v for k, v in day.items() if k != 'tasks'}
+            day_rows.append((day_pos, day.get('date'), json.dumps(day_meta, ensure_ascii=False)))
+            for task_pos, task in enumerate(day.get('tasks', [])):
+                task_rows.append((
+                    day_pos, task_pos, task.get('id'), int(bool(task.get('completed', False))),
+                    json.dumps(task, ensure_ascii=False)
+                ))
+
+        with self._lock, self._conn:
+            plan_id = self._conn.execute(
+                "INSERT INTO plans (user_id, meta) VALUES (?, ?)", (user_id, json.dumps(meta, ensure_ascii=False))
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO plan_days (plan_id, position, date, meta) VALUES (?, ?, ?, ?)",
+                [(plan_id, *row) for row in day_rows]
+            )
+            self._conn.executemany(
+                "INSERT INTO plan_tasks (plan_id, day_position, position, task_id, completed, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [(plan_id, *row) for row in task_rows]
+            )
+            self._bump(user_id)
+
+    def _current_plan_id(self, user_id: str) -> Optional[int]:
+        row = self._query_one("SELECT MAX(plan_id) AS plan_id FROM plans WHERE user_id=?", (user_id,))
+        return row['plan_id'] if row else None
+
+    @staticmethod
+    def _task_from_row(row: sqlite3.Row) -> Dict:
+        task = json.loads(row['data'])
+        task['completed'] = bool(row['completed'])
+        return task
+
+    def _day_tasks(self, plan_id: int, day_position: int) -> List[Dict]:
+        rows = self._query_all(
+            "SELECT data, completed FROM plan_tasks WHERE plan_id=? AND day_position=? ORDER BY position",
+            (plan_id, day_position)
+        )
+        return [self._task_from_row(r) for r in rows]
+
+    def _load_plan(self, plan_id: int, meta: str) -> Dict:
+        plan = json.loads(meta)
+        tasks_by_day: Dict[int, List[Dict]] = {}
+        for row in self._query_all(
+            "SELECT day_position, data, completed FROM plan_tasks WHERE plan_id=? ORDER BY day_position, position",
+            (plan_id,)
+        ):
+            tasks_by_day.setdefault(row['day_position'], []).append(self._task_from_row(row))
+
+        schedule = []
+        for row in self._query_all("SELECT position, meta FROM plan_days WHERE plan_id=? ORDER BY position", (plan_id,)):
+            day = json.loads(row['meta'])
+            day['tasks'] = tasks_by_day.get(row['position'], [])
+            schedule.append(day)
+        plan['daily_schedule'] = schedule
+        return plan
+
+    def get_plans(self, user_id: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        rows = self._query_all(
+            "SELECT plan_id, meta FROM plans WHERE user_id=? ORDER BY plan_id LIMIT ? OFFSET ?",
+            (user_id, -1 if limit is None else limit, offset)
+        )
+        return [self._load_plan(r['plan_id'], r['meta']) for r in rows]
+
+    def count_plans(self, user_id: str) -> int:
+        return self._query_one("SELECT COUNT(*) AS n FROM plans WHERE user_id=?", (user_id,))['n']
+
+    def get_current_plan(self, user_id: str) -> Optional[Dict]:
+        row = self._query_one(
+            "SELECT plan_id, meta FROM plans WHERE user_id=? ORDER BY plan_id DESC LIMIT 1", (user_id,)
+        )
+        return self._load_plan(row['plan_id'], row['meta']) if row else None
+
+    def has_current_plan(self, user_id: str) -> bool:
+        return self._query_one("SELECT 1 FROM plans WHERE user_id=? LIMIT 1", (user_id,)) is not None
+
+    def get_current_plan_meta(self, user_id: str) -> Optional[Dict]:
+        """현재 계획의 daily_schedule을 뺀 나머지 (plan_name 등) - 일정/태스크는 읽지 않음"""
+        row = self._query_one(
+            "SELECT meta FROM plans WHERE user_id=? ORDER BY plan_id DESC LIMIT 1", (user_id,)
+        )
+        return json.loads(row['meta']) if row else None
+
+    def _first_day_position(self, plan_id: int, day_date: str) -> Optional[int]:
+        row = self._query_one(
+            "SELECT MIN(position) AS position FROM plan_days WHERE plan_id=? AND date=?", (plan_id, day_date)
+        )
+        return row['position'] if row else None
+
+    def get_day(self, user_id: str, day_date: str) -> Optional[Dict]:
+        plan_id = self._current_plan_id(user_id)
+        if plan_id is None:
+            return None
+        row = self._query_one(
+            "SELECT position, meta FROM plan_days WHERE plan_id=? AND date=? ORDER BY position LIMIT 1",
+            (plan_id, day_date)
+        )
+        if not row:
+            return None
+        day = json.loads(row['meta'])
+        day['tasks'] = self._day_tasks(plan_id, row['position'])
+        return day
+
+    def get_days_between(self, user_id: str, start: str, end: str) -> List[Dict]:
+        plan_id = self._current_plan_id(user_id)
+        if plan_id is None:
+            return []
+        rows = self._query_all(
+            "SELECT MIN(position) AS position, meta FROM plan_days "
+            "WHERE plan_id=? AND date BETWEEN ? AND ? GROUP BY date ORDER BY date",
+            (plan_id, start, end)
+        )
+        days = []
+        for row in rows:
+            day = json.loads(row['meta'])
+            day['tasks'] = self._day_tasks(plan_id, row['position'])
+            days.append(day)
+        return days
+
+    def get_progress(self, user_id: str, day_date: str) -> int:
+        plan_id = self._current_plan_id(user_id)
+        if plan_id is None:
+            return 0
+        day_position = self._first_day_position(plan_id, day_date)
+        if day_position is None:
+            return 0
+        row = self._query_one(
+            "SELECT COUNT(*) AS total, COALESCE(SUM(completed), 0) AS completed "
+            "FROM plan_tasks WHERE plan_id=? AND day_position=?",
+            (plan_id, day_position)
+        )
+        total, completed = row['total'], row['completed']
+        return int((completed / total * 100) if total > 0 else 0)
+
+    def find_task(self, user_id: str, task_id: str) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """(plan_id, task_id) 인덱스로 조회 - plan은 daily_schedule 없이 메타데이터만, day는 그날의 태스크만 포함"""
+        plan_row = self._query_one(
+            "SELECT plan_id, meta FROM plans WHERE user_id=? ORDER BY plan_id DESC LIMIT 1", (user_id,)
+        )
+        if not plan_row:
+            return None
+        plan_id = plan_row['plan_id']
+        row = self._query_one(
+            "SELECT day_position, data, completed FROM plan_tasks WHERE plan_id=? AND task_id=? "
+            "ORDER BY day_position, position LIMIT 1",
+            (plan_id, task_id)
+        )
+        if not row:
+            return None
+        day_row = self._query_one(
+            "SELECT meta FROM plan_days WHERE plan_id=? AND position=?", (plan_id, row['day_position'])
+        )
+        day = json.loads(day_row['meta'])
+        day['tasks'] = self._day_tasks(plan_id, row['day_position'])
+        task = next(
+            (t for t in day['tasks'] if t.get('id') == task_id), self._task_from_row(row)
+        )
+        return json.loads(plan_row['meta']), day, task
+
+    def update_task(self, user_id: str, day_date: str, task_id: str, completed: bool) -> Optional[Dict]:
+        plan_id = self._current_plan_id(user_id)
+        if plan_id is None:
+            return None
+        day_position = self._first_day_position(plan_id, day_date)
+        if day_position is None:
+            return None
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT position, data FROM plan_tasks WHERE plan_id=? AND day_position=? AND task_id=? "
+                "ORDER BY position LIMIT 1",
+                (plan_id, day_position, task_id)
+            ).fetchone()
+            if not row:
+                return None
+            self._conn.execute(
+                "UPDATE plan_tasks SET completed=? WHERE plan_id=? AND day_position=? AND position=?",
+                (int(completed), plan_id, day_position, row['position'])
+            )
+            self._bump(user_id)
+        task = json.loads(row['data'])
+        task['completed'] = completed
+        return task
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,57 @@
 # Backend/services/store.py
 """인메모리 데이터 저장소"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from dotenv import load_dotenv
+import os
+import asyncio
+import bisect
 import uuid
 import hashlib
 
 
+class PlanSchedule:
+    """계획 하나의 인덱스 (date -> day, 정렬된 날짜 목록, 날짜별 진행률, task_id -> task)"""
+
+    def __init__(self, plan: Dict):
+        self.plan = plan
+        self.by_date: Dict[str, Dict] = {}
+        # date -> [전체 태스크 수, 완료 태스크 수]
+        self.progress: Dict[str, List[int]] = {}
+        # task_id -> (date, day, task), 중복 id는 먼저 나온 태스크 기준
+        self.tasks_by_id: Dict[str, Tuple[str, Dict, Dict]] = {}
+        for day in plan.get('daily_schedule', []):
+            day_date = day.get('date')
+            if day_date and day_date not in self.by_date:
+                self.by_date[day_date] = day
+                tasks = day.get('tasks', [])
+                self.progress[day_date] = [len(tasks), sum(1 for t in tasks if t.get('completed', False))]
+                for task in tasks:
+                    if 'id' in task:
+                        self.tasks_by_id.setdefault(task['id'], (day_date, day, task))
+        self.dates: List[str] = sorted(self.by_date)
+
+    def get_day(self, day_date: str) -> Optional[Dict]:
+        return self.by_date.get(day_date)
+
+    def days_between(self, start: str, end: str) -> List[Dict]:
+        """start~end(포함) 범위의 day 목록 - YYYY-MM-DD 문자열 비교"""
+        lo = bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_right(self.dates, end)
+        return [self.by_date[d] for d in self.dates[lo:hi]]
+
+    def progress_percent(self, day_date: str) -> int:
+        total, completed = self.progress.get(day_date, (0, 0))
+        return int((completed / total * 100) if total > 0 else 0)
+
+    def set_completed(self, day_date: str, task: Dict, completed: bool):
+        """태스크 완료 여부 변경 + 진행률 카운터 갱신"""
+        if task.get('completed', False) != completed:
+            self.progress[day_date][1] += 1 if completed else -1
+        task['completed'] = completed
+
+
 class DataStore:
     def __init__(self):
         self.users: Dict[str, Dict] = {}
@@ -14,18 +59,25 @@ class DataStore:
         self.friend_codes: Dict[str, str] = {}
         self.friendships: Dict[str, List[str]] = {}
         self.plans: Dict[str, List[Dict]] = {}
+        # user_id -> plans와 같은 순서의 날짜 인덱스
+        self.plan_schedules: Dict[str, List[PlanSchedule]] = {}
         self.notifications: Dict[str, Dict[str, List[str]]] = {}
         self.quiz_answers: Dict[str, List[Dict]] = {}
+        # email -> user_id (회원가입 중복 확인/로그인용 인덱스)
+        self.email_index: Dict[str, str] = {}
+        # user_id -> 변경 카운터 (ETag용, 사용자에게 보이는 데이터가 바뀔 때마다 증가)
+        self.versions: Dict[str, int] = {}
+        # 프로세스마다 달라지는 값 - 재시작 후 카운터가 겹쳐도 이전 ETag와 일치하지 않도록
+        self.epoch = uuid.uuid4().hex[:8]
 
     def create_user(self, username: str, email: str, password: str, name: str, birth: str, photo_url: str = None) -> Optional[Dict]:
-        for user in self.users.values():
-            if user['email'] == email:
-                return None
+        if email in self.email_index:
+            return None
 
         user_id = str(uuid.uuid4())
         friend_code = hashlib.md5(user_id.encode()).hexdigest()[:8].upper()
 
-        self.users[user_id] = {
+        return self._insert_user({
             'user_id': user_id,
             'username': username,
             'email': email,
@@ -35,24 +87,189 @@ class DataStore:
             'photo_url': photo_url,
             'friend_code': friend_code,
             'created_at': datetime.now().isoformat()
-        }
+        })
 
-        self.friend_codes[friend_code] = user_id
+    def _insert_user(self, user: Dict) -> Dict:
+        user_id = user['user_id']
+        self.users[user_id] = user
+        self.email_index[user['email']] = user_id
+        self.friend_codes[user['friend_code']] = user_id
         self.friendships[user_id] = []
         self.plans[user_id] = []
+        self.plan_schedules[user_id] = []
         self.notifications[user_id] = {'new': [], 'old': []}
         self.quiz_answers[user_id] = []
+        return user
+
+    def _bump(self, user_id: str):
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+
+    def get_version(self, user_id: str) -> int:
+        return self.versions.get(user_id, 0)
 
-        return self.users[user_id]
+    def get_versions(self, user_ids: List[str]) -> Dict[str, int]:
+        return {user_id: self.versions.get(user_id, 0) for user_id in user_ids}
 
     def login(self, email: str, password: str) -> Optional[Dict]:
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        for user_id, user in self.users.items():
-            if user['email'] == email and user['password'] == password_hash:
-                token = str(uuid.uuid4())
-                self.tokens[token] = user_id
-                return {'token': token, 'user_id': user_id, 'name': user['name']}
-        return None
+        user_id = self.email_index.get(email)
+        if not user_id:
+            return None
+        user = self.users[user_id]
+        if user['password'] != hashlib.sha256(password.encode()).hexdigest():
+            return None
+        token = self.issue_token(user_id)
+        return {'token': token, 'user_id': user_id, 'name': user['name']}
+
+    def get_user(self, user_id: str) -> Optional[Dict]:
+        return self.users.get(user_id)
+
+    def get_default_user(self) -> Optional[Dict]:
+        """인증 헤더가 없을 때 사용할 첫 번째 사용자"""
+        return next(iter(self.users.values()), None)
+
+    def issue_token(self, user_id: str) -> str:
+        token = str(uuid.uuid4())
+        self.tokens[token] = user_id
+        return token
+
+    def update_user(self, user_id: str, name: str = None, birth: str = None, password: str = None):
+        """프로필 필드 변경 (None인 필드는 유지)"""
+        fields = {}
+        if name:
+            fields['name'] = name
+        if birth:
+            fields['birth'] = birth
+        if password:
+            fields['password'] = hashlib.sha256(password.encode()).hexdigest()
+        self._set_user_fields(user_id, fields)
+
+    def _set_user_fields(self, user_id: str, fields: Dict):
+        self.users[user_id].update(fields)
+        self._bump(user_id)
+
+    def update_email(self, user_id: str, email: str) -> bool:
+        """이메일 변경 - 다른 사용자가 사용 중이면 False"""
+        owner = self.email_index.get(email)
+        if owner is not None and owner != user_id:
+            return False
+        user = self.users[user_id]
+        self.email_index.pop(user['email'], None)
+        user['email'] = email
+        self.email_index[email] = user_id
+        self._bump(user_id)
+        return True
+
+    def get_user_id_by_friend_code(self, friend_code: str) -> Optional[str]:
+        return self.friend_codes.get(friend_code)
+
+    def get_friend_ids(self, user_id: str) -> List[str]:
+        return self.friendships.get(user_id, [])
+
+    def are_friends(self, user_id: str, friend_id: str) -> bool:
+        return friend_id in self.friendships.get(user_id, [])
+
+    def add_friendship(self, user_id: str, friend_id: str):
+        self.friendships[user_id].append(friend_id)
+        self.friendships[friend_id].append(user_id)
+        self._bump(user_id)
+        self._bump(friend_id)
+
+    def add_notification(self, user_id: str, message: str):
+        self.notifications[user_id]['new'].append(message)
+        self._bump(user_id)
+
+    def get_notifications(self, user_id: str) -> Dict[str, List[str]]:
+        return self.notifications.get(user_id, {'new': [], 'old': []})
+
+    def mark_notifications_read(self, user_id: str):
+        notifications = self.notifications.get(user_id)
+        if notifications and notifications['new']:
+            notifications['old'] = notifications['new'] + notifications['old']
+            notifications['new'] = []
+            self._bump(user_id)
+
+    def set_quiz_answers(self, user_id: str, quizzes: List[Dict]):
+        self.quiz_answers[user_id] = quizzes
+        self._bump(user_id)
+
+    def get_quiz_answers(self, user_id: str) -> List[Dict]:
+        return self.quiz_answers.get(user_id, [])
+
+    def get_plans(self, user_id: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """저장 순서대로 계획 목록 (offset/limit로 일부만)"""
+        plans = self.plans.get(user_id, [])
+        if offset or limit is not None:
+            return plans[offset:None if limit is None else offset + limit]
+        return plans
+
+    def count_plans(self, user_id: str) -> int:
+        return len(self.plans.get(user_id, []))
+
+    def add_plan(self, user_id: str, plan: Dict):
+        """계획 저장 + 날짜 인덱스 생성"""
+        self.plans[user_id].append(plan)
+        self.plan_schedules[user_id].append(PlanSchedule(plan))
+        self._bump(user_id)
+
+    def get_current_plan(self, user_id: str) -> Optional[Dict]:
+        plans = self.plans.get(user_id)
+        return plans[-1] if plans else None
+
+    def has_current_plan(self, user_id: str) -> bool:
+        return bool(self.plans.get(user_id))
+
+    def get_current_plan_meta(self, user_id: str) -> Optional[Dict]:
+        """현재 계획의 daily_schedule을 뺀 나머지 (plan_name 등)"""
+        plan = self.get_current_plan(user_id)
+        return {k: v for k, v in plan.items() if k != 'daily_schedule'} if plan else None
+
+    def get_current_schedule(self, user_id: str) -> Optional[PlanSchedule]:
+        schedules = self.plan_schedules.get(user_id)
+        return schedules[-1] if schedules else None
+
+    def get_day(self, user_id: str, day_date: str) -> Optional[Dict]:
+        """현재 계획에서 특정 날짜의 day 조회"""
+        schedule = self.get_current_schedule(user_id)
+        return schedule.get_day(day_date) if schedule else None
+
+    def get_days_between(self, user_id: str, start: str, end: str) -> List[Dict]:
+        """현재 계획에서 start~end(포함, YYYY-MM-DD) 범위의 day 목록"""
+        schedule = self.get_current_schedule(user_id)
+        return schedule.days_between(start, end) if schedule else []
+
+    def get_progress(self, user_id: str, day_date: str) -> int:
+        """현재 계획의 특정 날짜 진행률(%) - 카운터 기반 O(1)"""
+        schedule = self.get_current_schedule(user_id)
+        return schedule.progress_percent(day_date) if schedule else 0
+
+    def find_task(self, user_id: str, task_id: str) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """현재 계획에서 task_id로 (plan, day, task) 조회"""
+        schedule = self.get_current_schedule(user_id)
+        entry = schedule.tasks_by_id.get(task_id) if schedule else None
+        if not entry:
+            return None
+        _, day, task = entry
+        return schedule.plan, day, task
+
+    def update_task(self, user_id: str, day_date: str, task_id: str, completed: bool) -> Optional[Dict]:
+        """현재 계획의 태스크 완료 여부 변경 - 찾지 못하면 None"""
+        schedule = self.get_current_schedule(user_id)
+        if not schedule:
+            return None
+
+        entry = schedule.tasks_by_id.get(task_id)
+        if entry and entry[0] == day_date:
+            task = entry[2]
+        else:
+            # 날짜가 다른 중복 id - 해당 날짜에서 직접 찾음
+            day = schedule.get_day(day_date)
+            task = next((t for t in day['tasks'] if t['id'] == task_id), None) if day else None
+            if not task:
+                return None
+
+        schedule.set_completed(day_date, task, completed)
+        self._bump(user_id)
+        return task
 
     def get_user_by_token(self, token: str) -> Optional[Dict]:
         user_id = self.tokens.get(token)
@@ -69,6 +286,60 @@ class DataStore:
             return True
         return False
 
+    def close(self):
+        pass
+
+
+def create_store():
+    """STORE_BACKEND 설정에 따라 저장소 생성 (memory | sqlite | journal)
+
+    SHARED_STATE_DIR이 지정되면(멀티 워커 배포) 기본값이 해당 디렉터리의 SQLite 저장소가 됩니다.
+    memory/journal 저장소는 프로세스 하나에서만 사용해야 합니다.
+    """
+    load_dotenv()
+    shared_dir = os.getenv("SHARED_STATE_DIR", "")
+    backend = os.getenv("STORE_BACKEND", "sqlite" if shared_dir else "memory")
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteDataStore
+        default_path = os.path.join(shared_dir, "palearn.db") if shared_dir else "palearn.db"
+        return SQLiteDataStore(os.getenv("STORE_SQLITE_PATH", default_path))
+    if shared_dir:
+        raise RuntimeError(f"SHARED_STATE_DIR 사용 시 STORE_BACKEND={backend}는 지원되지 않습니다 (sqlite 필요)")
+    if backend == "journal":
+        from .journal import JournaledDataStore
+        return JournaledDataStore(
+            os.getenv("STORE_JOURNAL_DIR", "data/journal"),
+            fsync_interval=float(os.getenv("STORE_JOURNAL_FSYNC_MS", "50")) / 1000,
+            snapshot_interval=float(os.getenv("STORE_SNAPSHOT_INTERVAL", "300"))
+        )
+    return DataStore()
+
+
+class AsyncStore:
+    """라우터용 store 래퍼 - 모든 메서드를 await로 호출
+
+    SQLite 저장소(blocking=True)는 스레드에서 실행해 디스크 I/O와 다른 워커의 쓰기 잠금 대기(최대 10초)가
+    이벤트 루프를 막지 않도록 하고, 메모리/저널 저장소는 스레드 전환 없이 바로 호출합니다.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._blocking = getattr(target, "blocking", False)
+
+    async def run(self, fn, *args, **kwargs):
+        """store를 여러 번 호출하는 함수를 한 번에 실행"""
+        if self._blocking:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        return fn(*args, **kwargs)
+
+    def __getattr__(self, name):
+        method = getattr(self._target, name)
+
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
 
 # 싱글톤 인스턴스
-store = DataStore()
+store = create_store()
+astore = AsyncStore(store)
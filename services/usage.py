@@ -0,0 +1,168 @@
+# Backend/services/usage.py
+"""GPT 토큰 사용량/비용 집계 - 호출 위치(site), 모델, 사용자별
+
+upstream 호출마다 response.usage의 prompt/cached/completion 토큰과 호출 시간을 메모리에 누적하고,
+USAGE_FLUSH_INTERVAL마다 마지막 flush 이후 바뀐 항목의 증가분을 USAGE_LOG_PATH(JSON lines)에 추가합니다.
+파일은 append 전용이므로 여러 워커가 같은 파일을 써도 되며, 합계는 줄들을 더해서 구합니다.
+캐시 적중/동일 요청 합류는 upstream 호출이 없으므로 기록되지 않습니다.
+"""
+
+import os
+import json
+import time
+import asyncio
+import contextvars
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+from .jobs import current_job_user_id
+from ..utils.logger import log_info, log_error
+
+load_dotenv()
+
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", "")
+USAGE_LOG_PATH = os.getenv(
+    "USAGE_LOG_PATH", os.path.join(SHARED_STATE_DIR, "gpt_usage.jsonl") if SHARED_STATE_DIR else "gpt_usage.jsonl"
+)
+USAGE_FLUSH_INTERVAL = float(os.getenv("USAGE_FLUSH_INTERVAL", "60"))
+
+# 모델별 100만 토큰당 가격 (USD: 입력, 캐시된 입력, 출력) - USAGE_PRICES(JSON)로 덮어쓰기 가능
+# 웹 검색 모델의 검색 호출당 요금은 포함하지 않습니다.
+MODEL_PRICES: Dict[str, Tuple[float, float, float]] = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-search-preview": (2.50, 2.50, 10.00),
+    "gpt-5-search-api": (1.25, 0.125, 10.00),
+}
+MODEL_PRICES.update({model: tuple(prices) for model, prices in json.loads(os.getenv("USAGE_PRICES", "{}")).items()})
+
+# 요청을 보낸 사용자 (get_current_user에서 설정)
+_usage_user: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("usage_user", default=None)
+
+FIELDS = ("calls", "prompt_tokens", "cached_tokens", "completion_tokens", "cost_usd", "latency_s")
+
+
+def set_usage_user(user_id: Optional[str]):
+    _usage_user.set(user_id)
+
+
+def estimate_cost(model: str, prompt_tokens: int, cached_tokens: int, completion_tokens: int) -> float:
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        return 0.0
+    input_price, cached_price, output_price = prices
+    return (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+
+
+def _empty() -> Dict[str, float]:
+    return {field: 0 for field in FIELDS}
+
+
+class UsageTracker:
+    """(site, model, user) -> 누적 사용량, flush 전 증가분은 따로 보관"""
+
+    def __init__(self, path: str, flush_interval: float):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.started_at = time.time()
+        self.totals: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+        self._pending: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, site: str, model: str, usage, latency: float):
+        """upstream 응답 하나의 usage 기록 (usage가 없으면 호출 수/시간만)"""
+        # 백그라운드 작업 안에서는 작업을 등록한 사용자가 우선 (워커 태스크에 남은 요청 컨텍스트보다)
+        user = current_job_user_id() or _usage_user.get() or "anonymous"
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        delta = {
+            "calls": 1,
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "completion_tokens": completion_tokens,
+            "cost_usd": estimate_cost(model, prompt_tokens, cached_tokens, completion_tokens),
+            "latency_s": latency
+        }
+        key = (site, model, user)
+        for target in (self.totals.setdefault(key, _empty()), self._pending.setdefault(key, _empty())):
+            for field, value in delta.items():
+                target[field] += value
+
+    def summary(self, group_by: str = "site", limit: Optional[int] = None) -> dict:
+        """group_by(site | model | user)별 합계 - 비용이 큰 순서"""
+        index = {"site": 0, "model": 1, "user": 2}[group_by]
+        groups: Dict[str, Dict[str, float]] = {}
+        total = _empty()
+        for key, values in self.totals.items():
+            group = groups.setdefault(key[index], _empty())
+            for field, value in values.items():
+                group[field] += value
+                total[field] += value
+        rows = [
+            {group_by: name, **_rounded(values)}
+            for name, values in sorted(groups.items(), key=lambda item: item[1]["cost_usd"], reverse=True)
+        ]
+        return {
+            "since": self.started_at,
+            "group_by": group_by,
+            "total": _rounded(total),
+            "groups": rows[:limit] if limit else rows
+        }
+
+    # ───────── 파일 기록 ─────────
+
+    def flush(self):
+        """마지막 flush 이후 증가분을 파일에 추가"""
+        if not self.path or not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        now = time.time()
+        lines: List[str] = [
+            json.dumps({"ts": now, "site": site, "model": model, "user": user, **_rounded(values)}, ensure_ascii=False)
+            for (site, model, user), values in pending.items()
+        ]
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            log_error(f"GPT 사용량 기록 실패: {e}")
+            # 다음 flush에서 다시 시도
+            for key, values in pending.items():
+                target = self._pending.setdefault(key, _empty())
+                for field, value in values.items():
+                    target[field] += value
+
+    async def start(self):
+        if self.path and self.flush_interval > 0:
+            self._task = asyncio.create_task(self._flush_loop())
+            log_info(f"GPT 사용량 기록: {self.path} ({self.flush_interval:.0f}초마다)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+
+def _rounded(values: Dict[str, float]) -> Dict[str, float]:
+    return {
+        **{field: int(values[field]) for field in ("calls", "prompt_tokens", "cached_tokens", "completion_tokens")},
+        "cost_usd": round(values["cost_usd"], 6),
+        "latency_s": round(values["latency_s"], 3)
+    }
+
+
+# 싱글톤 인스턴스
+usage_tracker = UsageTracker(USAGE_LOG_PATH, USAGE_FLUSH_INTERVAL)
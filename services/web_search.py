@@ -2,12 +2,15 @@
 """웹 검색 서비스 - 유튜브/블로그 링크 검색"""
 
 import os
-import requests
-from typing import List, Dict
+import asyncio
+import httpx
+from typing import List, Dict, Optional
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
 from ..utils.logger import log_info, log_error, log_success
+from ..utils.metrics import metrics, web_search_duration, timed
+from .search_cache import search_cache
 
 load_dotenv()
 
@@ -16,15 +19,63 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 
+# API 엔드포인트 (테스트 시 로컬 스텁 서버로 교체 가능)
+YOUTUBE_SEARCH_URL = os.getenv("YOUTUBE_SEARCH_URL", "https://www.googleapis.com/youtube/v3/search")
+GOOGLE_CSE_URL = os.getenv("GOOGLE_CSE_URL", "https://www.googleapis.com/customsearch/v1")
 
-def search_youtube(query: str, max_results: int = 1) -> List[Dict]:
+# 일괄 검색 시 동시에 진행할 주제 수
+WEB_SEARCH_MAX_CONCURRENCY = int(os.getenv("WEB_SEARCH_MAX_CONCURRENCY", "8"))
+
+# HTTP 커넥션 풀 설정
+WEB_SEARCH_POOL_SIZE = int(os.getenv("WEB_SEARCH_POOL_SIZE", "20"))
+WEB_SEARCH_CONNECT_TIMEOUT = float(os.getenv("WEB_SEARCH_CONNECT_TIMEOUT", "3"))
+WEB_SEARCH_TIMEOUT = float(os.getenv("WEB_SEARCH_TIMEOUT", "10"))
+
+# keep-alive 커넥션을 재사용하는 공유 클라이언트
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 생성 (앱 시작 시 호출)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(WEB_SEARCH_TIMEOUT, connect=WEB_SEARCH_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=WEB_SEARCH_POOL_SIZE,
+                max_keepalive_connections=WEB_SEARCH_POOL_SIZE
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """공유 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    search_cache.close()
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    # startup 이벤트 없이 사용되는 경우(스크립트, 테스트)를 위해 지연 생성
+    if _http_client is None or _http_client.is_closed:
+        return await init_http_client()
+    return _http_client
+
+
+@timed(web_search_duration, "youtube")
+async def search_youtube(query: str, max_results: int = 1) -> List[Dict]:
     """유튜브에서 강의 영상 검색"""
     log_info(f"유튜브 검색: {query}")
 
     # YouTube Data API 사용 (API 키가 있는 경우)
     if YOUTUBE_API_KEY:
+        cached = await search_cache.aget("youtube", query, max_results)
+        if cached is not None:
+            return cached
         try:
-            url = "https://www.googleapis.com/youtube/v3/search"
             params = {
                 "part": "snippet",
                 "q": f"{query} 강의 튜토리얼",
@@ -34,7 +85,8 @@ def search_youtube(query: str, max_results: int = 1) -> List[Dict]:
                 "relevanceLanguage": "ko",
                 "videoDuration": "medium"  # 4-20분 영상
             }
-            response = requests.get(url, params=params, timeout=10)
+            client = await _get_http_client()
+            response = await client.get(YOUTUBE_SEARCH_URL, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -50,6 +102,7 @@ def search_youtube(query: str, max_results: int = 1) -> List[Dict]:
                     })
                 if results:
                     log_success(f"유튜브 검색 성공: {len(results)}개")
+                    await search_cache.aset("youtube", query, max_results, results)
                     return results
         except Exception as e:
             log_error(f"YouTube API 오류: {e}")
@@ -64,14 +117,17 @@ def search_youtube(query: str, max_results: int = 1) -> List[Dict]:
     }]
 
 
-def search_blog(query: str, max_results: int = 1) -> List[Dict]:
+@timed(web_search_duration, "blog")
+async def search_blog(query: str, max_results: int = 1) -> List[Dict]:
     """블로그에서 학습 자료 검색"""
     log_info(f"블로그 검색: {query}")
 
     # Google Custom Search API 사용 (API 키가 있는 경우)
     if GOOGLE_API_KEY and GOOGLE_CSE_ID:
+        cached = await search_cache.aget("blog", query, max_results)
+        if cached is not None:
+            return cached
         try:
-            url = "https://www.googleapis.com/customsearch/v1"
             params = {
                 "key": GOOGLE_API_KEY,
                 "cx": GOOGLE_CSE_ID,
@@ -79,7 +135,8 @@ def search_blog(query: str, max_results: int = 1) -> List[Dict]:
                 "num": max_results,
                 "lr": "lang_ko"
             }
-            response = requests.get(url, params=params, timeout=10)
+            client = await _get_http_client()
+            response = await client.get(GOOGLE_CSE_URL, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -93,6 +150,7 @@ def search_blog(query: str, max_results: int = 1) -> List[Dict]:
                     })
                 if results:
                     log_success(f"블로그 검색 성공: {len(results)}개")
+                    await search_cache.aset("blog", query, max_results, results)
                     return results
         except Exception as e:
             log_error(f"Google Search API 오류: {e}")
@@ -107,12 +165,14 @@ def search_blog(query: str, max_results: int = 1) -> List[Dict]:
     }]
 
 
-def search_materials_for_topic(topic: str) -> Dict[str, List[Dict]]:
-    """특정 주제에 대한 학습 자료 검색 (유튜브 1개 + 블로그 1개)"""
+async def search_materials_for_topic(topic: str) -> Dict[str, List[Dict]]:
+    """특정 주제에 대한 학습 자료 검색 (유튜브 1개 + 블로그 1개, 동시 요청)"""
     log_info(f"학습 자료 검색 시작: {topic}")
 
-    youtube_results = search_youtube(topic, max_results=1)
-    blog_results = search_blog(topic, max_results=1)
+    youtube_results, blog_results = await asyncio.gather(
+        search_youtube(topic, max_results=1),
+        search_blog(topic, max_results=1)
+    )
 
     return {
         "related_materials": youtube_results + blog_results,
@@ -120,28 +180,85 @@ def search_materials_for_topic(topic: str) -> Dict[str, List[Dict]]:
     }
 
 
-def batch_search_materials(topics: List[str]) -> Dict[str, Dict[str, List[Dict]]]:
-    """여러 주제에 대한 학습 자료 일괄 검색"""
-    log_info(f"일괄 검색 시작: {len(topics)}개 주제")
+def _default_materials(topic: str) -> Dict[str, List[Dict]]:
+    """검색 실패 시 기본 검색 URL"""
+    search_query = quote_plus(topic)
+    return {
+        "related_materials": [
+            {"title": f"{topic} 강의", "type": "유튜브", "url": f"https://www.youtube.com/results?search_query={search_query}+강의", "description": "유튜브 검색"},
+            {"title": f"{topic} 블로그", "type": "블로그", "url": f"https://www.google.com/search?q={search_query}+블로그", "description": "구글 검색"}
+        ],
+        "review_materials": [
+            {"title": f"{topic} 복습", "type": "유튜브", "url": f"https://www.youtube.com/results?search_query={search_query}+강의", "description": "유튜브 검색"},
+            {"title": f"{topic} 정리", "type": "블로그", "url": f"https://www.google.com/search?q={search_query}+정리", "description": "구글 검색"}
+        ]
+    }
+
 
-    results = {}
-    for topic in topics:
-        try:
-            results[topic] = search_materials_for_topic(topic)
-        except Exception as e:
-            log_error(f"검색 실패 ({topic}): {e}")
-            # 실패 시 기본 검색 URL
-            search_query = quote_plus(topic)
-            results[topic] = {
-                "related_materials": [
-                    {"title": f"{topic} 강의", "type": "유튜브", "url": f"https://www.youtube.com/results?search_query={search_query}+강의", "description": "유튜브 검색"},
-                    {"title": f"{topic} 블로그", "type": "블로그", "url": f"https://www.google.com/search?q={search_query}+블로그", "description": "구글 검색"}
-                ],
-                "review_materials": [
-                    {"title": f"{topic} 복습", "type": "유튜브", "url": f"https://www.youtube.com/results?search_query={search_query}+강의", "description": "유튜브 검색"},
-                    {"title": f"{topic} 정리", "type": "블로그", "url": f"https://www.google.com/search?q={search_query}+정리", "description": "구글 검색"}
-                ]
-            }
+def _normalize_topic(topic: str) -> str:
+    return ' '.join(topic.split())
 
-    log_success(f"일괄 검색 완료: {len(results)}개")
+
+class MaterialSearcher:
+    """요청 단위 학습 자료 검색기 - 같은 주제는 한 번만 검색하고 동시 검색 수를 제한
+
+    주제를 나중에 추가해도 되므로, 스트리밍처럼 주제가 점진적으로 생기는 경우에도 사용합니다.
+    검색 실패 시 기본 검색 URL을 반환합니다.
+    """
+
+    def __init__(self, max_concurrency: int = WEB_SEARCH_MAX_CONCURRENCY):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: Dict[str, "asyncio.Future"] = {}
+
+    def search(self, topic: str) -> "asyncio.Future":
+        key = _normalize_topic(topic)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_one(key))
+            self._tasks[key] = task
+        return task
+
+    async def _search_one(self, topic: str) -> Dict[str, List[Dict]]:
+        async with self._semaphore:
+            try:
+                return await search_materials_for_topic(topic)
+            except Exception as e:
+                log_error(f"검색 실패 ({topic}): {e}")
+                return _default_materials(topic)
+
+    @property
+    def topic_count(self) -> int:
+        return len(self._tasks)
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+
+async def batch_search_materials(topics: List[str]) -> Dict[str, Dict[str, List[Dict]]]:
+    """여러 주제에 대한 학습 자료 일괄 검색 - 중복 제거 후 병렬 검색
+
+    반환값은 입력된 모든 주제를 키로 가지며, 같은 주제는 한 번만 검색합니다.
+    """
+    searcher = MaterialSearcher()
+    futures = [searcher.search(t) for t in topics]
+    log_info(f"일괄 검색 시작: {len(topics)}개 주제 (중복 제거 후 {searcher.topic_count}개)")
+
+    found = await asyncio.gather(*futures)
+    results = dict(zip(topics, found))
+    log_success(f"일괄 검색 완료: {searcher.topic_count}개")
     return results
+
+
+def get_search_cache_stats() -> dict:
+    """검색 결과 디스크 캐시 통계 반환"""
+    return search_cache.stats()
+
+
+metrics.stats(get_search_cache_stats, {
+    "entries": ("search_cache_entries", "gauge", "검색 결과 캐시 항목 수"),
+    "hits": ("search_cache_hits_total", "counter", "검색 결과 캐시 적중 수 (이 워커)"),
+    "misses": ("search_cache_misses_total", "counter", "검색 결과 캐시 미스 수 (이 워커)"),
+    "writes": ("search_cache_writes_total", "counter", "검색 결과 캐시 저장 수 (이 워커)"),
+    "evictions": ("search_cache_evictions_total", "counter", "만료/상한으로 삭제된 검색 결과 캐시 항목 수 (이 워커)")
+})
@@ -0,0 +1,54 @@
+# Backend/tests/conftest.py
+"""테스트 공통 설정 - 패키지(Backend) 임포트 경로와 가짜 OpenAI 클라이언트"""
+
+import os
+import sys
+import json
+import types
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 앱 임포트 전에 외부 의존 설정을 끕니다 (실제 API 키/파일 캐시 사용 안 함)
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ["SEARCH_CACHE_PATH"] = ""
+os.environ["USAGE_LOG_PATH"] = os.devnull
+
+# 저장소 디렉터리 이름과 상관없이 Backend 패키지로 임포트
+if "Backend" not in sys.modules:
+    if os.path.basename(ROOT) == "Backend":
+        sys.path.insert(0, os.path.dirname(ROOT))
+    else:
+        package = types.ModuleType("Backend")
+        package.__path__ = [ROOT]
+        sys.modules["Backend"] = package
+
+
+@pytest.fixture
+def gpt(monkeypatch):
+    """chat.completions.create를 대체 - replies[키워드] = 응답 객체(dict/list면 JSON으로 직렬화)"""
+    from Backend.services import gpt_service
+
+    replies = {}
+
+    async def create(model, messages, **kwargs):
+        prompt = messages[0]["content"]
+        content = next((reply for key, reply in replies.items() if key in prompt), "{}")
+        if not isinstance(content, str):
+            content = json.dumps(content, ensure_ascii=False)
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=20, prompt_tokens_details=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+    monkeypatch.setattr(gpt_service, "client", SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))))
+    return replies
+
+
+@pytest.fixture
+def client(gpt):
+    from fastapi.testclient import TestClient
+    from Backend.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
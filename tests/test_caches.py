@@ -0,0 +1,45 @@
+# Backend/tests/test_caches.py
+"""캐시 통계 - /metrics 렌더링 시 DB에 접근하지 않는지 확인"""
+
+import os
+
+
+def test_search_cache_stats_do_not_open_db(tmp_path):
+    from Backend.services.search_cache import SearchResultCache
+
+    path = tmp_path / "search.db"
+    cache = SearchResultCache(str(path), ttl=60, max_entries=2)
+    assert cache.stats()["entries"] == 0
+    assert not os.path.exists(path)
+
+    for query in ("a", "b", "c"):
+        cache.set("youtube", query, 3, [{"title": query}])
+    assert cache.get("youtube", "C", 3) == [{"title": "c"}]
+    assert cache.stats()["entries"] == 2
+    cache.close()
+
+    reopened = SearchResultCache(str(path), ttl=60, max_entries=2)
+    assert reopened.get("youtube", "c", 3) is not None
+    assert reopened.stats()["entries"] == 2
+    reopened.close()
+
+
+def test_gpt_cache_stats_track_size_in_memory(tmp_path):
+    from Backend.services.gpt_service import SQLiteGPTResponseCache
+
+    path = str(tmp_path / "gpt.db")
+    cache = SQLiteGPTResponseCache(path, max_bytes=10)
+    cache.set("a", "12345", ttl=60)
+    cache.set("b", "1234", ttl=60)
+    assert (cache.stats()["entries"], cache.stats()["bytes"]) == (2, 9)
+
+    cache.set("c", "123", ttl=60)
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 7, 1)
+    cache.close()
+
+    reopened = SQLiteGPTResponseCache(path, max_bytes=10)
+    assert (reopened.stats()["entries"], reopened.stats()["bytes"]) == (2, 7)
+    reopened.clear()
+    assert reopened.stats()["entries"] == 0
+    reopened.close()
@@ -0,0 +1,40 @@
+# Backend/tests/test_gpt_responses.py
+"""GPT 응답 형식이 어긋나도 엔드포인트가 200을 반환하는지 확인"""
+
+from datetime import date
+
+
+def test_malformed_plan_still_returns_200(client, gpt):
+    today = date.today().isoformat()
+    gpt["학습 계획"] = {
+        "plan_name": 3,
+        "daily_schedule": [
+            {"date": today, "tasks": [
+                {"title": "제목", "description": None, "duration": 60, "completed": None},
+                {"id": 2, "title": ["리스트", "제목"], "related_materials": "없음"},
+            ]},
+            {"date": None, "tasks": [{"title": 0}]},
+        ],
+    }
+    gpt["materials"] = {"materials": []}
+
+    response = client.post("/plans/generate", json={
+        "skill": "py", "hourPerDay": 1, "startDate": today, "restDays": [], "selfLevel": "초급"
+    })
+    assert response.status_code == 200, response.text
+    assert response.json()["plan_name"] == 3
+
+    assert client.get("/plans/all").status_code == 200
+    assert client.get(f"/plans/date/{today}").status_code == 200
+
+
+def test_malformed_quiz_and_courses_still_return_200(client, gpt):
+    gpt["OX 퀴즈"] = {"quizzes": [{"type": "OX", "answerKey": 1}, {"id": "2", "question": None}]}
+    gpt["교육 추천"] = {"recommendations": [{"title": 7, "curriculum": "한 줄"}, {"link": "https://x"}]}
+
+    response = client.get("/quiz/items", params={"refresh": True})
+    assert response.status_code == 200, response.text
+    assert response.json()[0]["answerKey"] == 1
+
+    response = client.get("/recommend/courses")
+    assert response.status_code == 200, response.text
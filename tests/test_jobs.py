@@ -0,0 +1,36 @@
+# Backend/tests/test_jobs.py
+"""백그라운드 작업 - GPT 사용량이 작업을 등록한 사용자로 집계되는지 확인"""
+
+import asyncio
+import contextvars
+import os
+
+
+def test_job_usage_is_recorded_for_submitting_user(monkeypatch):
+    from Backend.services import usage
+    from Backend.services.jobs import JobQueue
+
+    tracker = usage.UsageTracker(os.devnull, 60)
+    monkeypatch.setattr(usage, "usage_tracker", tracker)
+
+    async def work():
+        tracker.record("test", "gpt-4o-mini", None, 0.1)
+
+    async def main():
+        queue = JobQueue(workers=1, max_size=10, timeout=5, result_ttl=60)
+
+        def submit(user_id):
+            # 요청마다 별도 컨텍스트 - 인증 의존성이 사용량 집계 사용자를 설정한 뒤 작업 등록
+            usage.set_usage_user(user_id)
+            return queue.submit("test", user_id, work)
+
+        # 첫 submit이 워커를 시작하므로, 워커가 user-a 요청의 컨텍스트를 물려받으면 안 됨
+        jobs = [contextvars.copy_context().run(submit, user_id) for user_id in ("user-a", "user-b")]
+        for job in jobs:
+            await job.wait(5)
+        await queue.stop()
+        return jobs
+
+    jobs = asyncio.run(main())
+    assert [job.status for job in jobs] == ["succeeded", "succeeded"]
+    assert {key[2] for key in tracker.totals} == {"user-a", "user-b"}
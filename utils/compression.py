@@ -0,0 +1,164 @@
+# Backend/utils/compression.py
+"""응답 압축 미들웨어 - 큰 JSON 응답만 gzip/brotli로 압축
+
+Accept-Encoding에 따라 br(brotli 패키지가 설치된 경우) 또는 gzip을 고르고,
+지정한 경로(prefix)의 응답 본문이 COMPRESSION_MIN_SIZE 이상일 때만 압축합니다.
+SSE(text/event-stream)처럼 조각 단위로 바로 보내야 하는 응답은 버퍼링하지 않고 그대로 전달합니다.
+지정한 경로의 응답에는 압축 여부와 관계없이 항상 Vary: Accept-Encoding을 붙여,
+공유 캐시가 압축된/압축되지 않은 본문을 다른 클라이언트에게 잘못 돌려주지 않도록 합니다.
+"""
+
+import os
+import gzip
+from typing import Iterable, List, Optional, Tuple
+from dotenv import load_dotenv
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+load_dotenv()
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_PATHS = [
+    p.strip() for p in os.getenv("COMPRESSION_PATHS", "/plans,/recommend/courses,/review/yesterday").split(",")
+    if p.strip()
+]
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# 압축하지 않고 바로 흘려보낼 Content-Type
+_PASSTHROUGH_TYPES = (b"text/event-stream",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (br > gzip, q=0은 제외)"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = COMPRESSION_GZIP_LEVEL,
+             brotli_quality: int = COMPRESSION_BROTLI_QUALITY) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """경로 prefix + 최소 크기 기준 응답 압축 (ASGI 미들웨어)"""
+
+    def __init__(self, app, paths: Iterable[str] = COMPRESSION_PATHS, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.paths = tuple(paths)
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept) if accept else None
+        if encoding is None:
+            async def send_with_vary(message):
+                if message["type"] == "http.response.start":
+                    message = {**message, "headers": _with_vary(message.get("headers", []))}
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+        await _CompressedResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressedResponder:
+    """응답 하나를 모아서 크기를 확인한 뒤 압축해 전송"""
+
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start_message: Optional[dict] = None
+        self.passthrough = False
+        self.chunks: List[bytes] = []
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message):
+        if message["type"] == "http.response.start":
+            headers = message.get("headers", [])
+            content_type = _header(headers, b"content-type") or b""
+            # 본문이 없거나, 이미 인코딩되었거나, 스트리밍 응답이면 그대로 전달
+            self.passthrough = (
+                message["status"] in (204, 304)
+                or _header(headers, b"content-encoding") is not None
+                or content_type.startswith(_PASSTHROUGH_TYPES)
+            )
+            if self.passthrough:
+                await self.send({**message, "headers": _with_vary(headers)})
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        body = b"".join(self.chunks)
+        self.chunks = []
+        headers = [(k, v) for k, v in self.start_message.get("headers", []) if k != b"content-length"]
+        if len(body) >= self.minimum_size:
+            body = compress(body, self.encoding)
+            headers.append((b"content-encoding", self.encoding.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+        await self.send({**self.start_message, "headers": _with_vary(headers)})
+        await self.send({"type": "http.response.body", "body": body})
+
+
+def _with_vary(headers) -> List[Tuple[bytes, bytes]]:
+    """Vary에 Accept-Encoding 추가 (이미 있거나 *이면 그대로, 다른 값이 있으면 이어 붙임)"""
+    result = []
+    merged = False
+    for key, value in headers:
+        if key.lower() == b"vary" and not merged:
+            names = [v.strip().lower() for v in value.split(b",")]
+            if b"accept-encoding" not in names and b"*" not in names:
+                value = value + b", Accept-Encoding"
+            merged = True
+        result.append((key, value))
+    if not merged:
+        result.append((b"vary", b"Accept-Encoding"))
+    return result
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
@@ -0,0 +1,37 @@
+# Backend/utils/etag.py
+"""조건부 GET (ETag / If-None-Match) 유틸리티
+
+ETag는 저장소의 사용자별 변경 카운터와 응답에 영향을 주는 값(오늘 날짜, 쿼리 등)으로 만들며,
+일치하면 응답 본문을 만들지 않고 304를 반환합니다.
+압축 여부와 무관하게 같은 내용이면 같은 태그이므로 weak ETag(W/)를 사용합니다.
+"""
+
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # 비교는 weak 비교 (W/ 접두사 무시)
+    opaque = etag[2:]
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def check_not_modified(request: Request, response: Response, *parts) -> Optional[Response]:
+    """ETag 헤더를 설정하고, If-None-Match가 일치하면 304 응답 반환 (아니면 None)"""
+    etag = make_etag(*parts)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
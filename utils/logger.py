@@ -1,5 +1,28 @@
 # Backend/utils/logger.py
-"""터미널 컬러 로깅 유틸리티"""
+"""로깅 유틸리티 - 백그라운드 스레드가 출력하는 큐 기반 로거
+
+log_* 함수는 (시각, 레벨, 이벤트, 필드)만 큐에 넣고 바로 반환하며,
+문자열 생성과 stdout 쓰기는 백그라운드 스레드가 여러 건씩 모아서 처리합니다.
+- LOG_FORMAT=pretty(기본): 기존 컬러/박스 출력 (개발용)
+- LOG_FORMAT=json: 한 줄에 하나의 JSON 객체 (운영용, 배너/장식 없음)
+- LOG_LEVEL 미만 레벨은 큐에 넣지도 않고, 요청/화면 이동/GPT 로그는 LOG_SAMPLE_RATE 비율만 남깁니다.
+"""
+
+import os
+import sys
+import time
+import queue
+import atexit
+import random
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import orjson
+from dotenv import load_dotenv
+
+load_dotenv()
+
 
 class Colors:
     HEADER = '\033[95m'
@@ -15,71 +38,230 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "pretty").lower()
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if LOG_FORMAT == "pretty" else "INFO").upper()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+LOG_QUEUE_MAX_SIZE = int(os.getenv("LOG_QUEUE_MAX_SIZE", "10000"))
+
+# 요청마다 여러 번 발생하는 이벤트 (LOG_SAMPLE_RATE 적용 대상)
+SAMPLED_EVENTS = frozenset({"request", "navigation", "stage", "gpt"})
+
+_threshold = {name: level for level, name in LEVEL_NAMES.items()}.get(LOG_LEVEL, INFO)
+
+# (시각, 레벨, 이벤트, 필드)
+Record = Tuple[float, int, str, Dict]
+
+
+class LogWriter:
+    """로그 레코드를 모아 백그라운드 스레드에서 출력 (큐가 가득 차면 버리고 dropped 증가)"""
+
+    BATCH_SIZE = 256
+
+    def __init__(self, render: Callable[[Record], str], max_size: int):
+        self.render = render
+        self.dropped = 0
+        self._queue: "queue.Queue[Record]" = queue.Queue(max_size)
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, record: Record):
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        # 워커 프로세스로 fork된 경우에도 스레드를 새로 시작
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            batch: List[Record] = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for record in batch:
+                try:
+                    lines.append(self.render(record))
+                except Exception as e:
+                    lines.append(f"[LOGGER] 로그 출력 실패: {record[2]} - {e}")
+            try:
+                # 출력 시점의 sys.stdout 사용 (테스트/벤치마크에서 교체 가능)
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            except Exception:
+                pass
+            for _ in batch:
+                self._queue.task_done()
+
+    def flush(self):
+        """큐에 쌓인 로그가 모두 출력될 때까지 대기"""
+        if self._pid == os.getpid():
+            self._queue.join()
+
+
+# ───────── 출력 형식 ─────────
+
+def _render_json(record: Record) -> str:
+    ts, level, event, fields = record
+    return orjson.dumps({
+        "ts": datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="milliseconds"),
+        "level": LEVEL_NAMES[level],
+        "event": event,
+        **fields
+    }).decode()
+
+
+def _pretty_request(endpoint: str, user: str, details: str = "") -> str:
+    lines = [
+        f"\n{Colors.CYAN}┌{'─'*68}┐{Colors.ENDC}",
+        f"{Colors.CYAN}│{Colors.ENDC} {Colors.BOLD}[REQUEST]{Colors.ENDC} {endpoint}",
+        f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}User:{Colors.ENDC} {user}"
+    ]
+    if details:
+        lines.append(f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}Details:{Colors.ENDC} {details}")
+    lines.append(f"{Colors.CYAN}└{'─'*68}┘{Colors.ENDC}")
+    return "\n".join(lines)
+
+
+def _pretty_gpt(prompt: str, response: str, response_chars: int) -> str:
+    lines = [
+        f"\n{Colors.MAGENTA}┌{'─'*68}┐{Colors.ENDC}",
+        f"{Colors.MAGENTA}│{Colors.ENDC} {Colors.BOLD}[GPT REQUEST]{Colors.ENDC}",
+        f"{Colors.MAGENTA}│{Colors.ENDC} Prompt: {prompt}...",
+        f"{Colors.MAGENTA}├{'─'*68}┤{Colors.ENDC}",
+        f"{Colors.MAGENTA}│{Colors.ENDC} {Colors.BOLD}[GPT RESPONSE]{Colors.ENDC}"
+    ]
+    for line in response.split('\n')[:10]:
+        lines.append(f"{Colors.MAGENTA}│{Colors.ENDC} {line[:66]}")
+    if response_chars > 500:
+        lines.append(f"{Colors.MAGENTA}│{Colors.ENDC} ... (총 {response_chars} 글자)")
+    lines.append(f"{Colors.MAGENTA}└{'─'*68}┘{Colors.ENDC}")
+    return "\n".join(lines)
+
+
+STAGES = {
+    1: "🔐 회원가입",
+    2: "🔑 로그인",
+    3: "🏠 홈 화면",
+    4: "📝 퀴즈 시작",
+    5: "✅ 퀴즈 채점",
+    6: "📚 강좌 추천",
+    7: "📋 계획 생성",
+    8: "👥 친구 목록",
+    9: "🔔 알림 확인",
+    10: "👤 프로필"
+}
+
+
+def _pretty_stage(stage: int, name: str, user: str) -> str:
+    emoji_stage = STAGES.get(stage, f"📍 {name}")
+    return (
+        f"\n{Colors.YELLOW}{'='*70}{Colors.ENDC}\n"
+        f"{Colors.YELLOW}  STAGE {stage}: {emoji_stage}{Colors.ENDC}\n"
+        f"{Colors.YELLOW}  User: {user}{Colors.ENDC}\n"
+        f"{Colors.YELLOW}{'='*70}{Colors.ENDC}\n"
+    )
+
+
+_PRETTY: Dict[str, Callable[..., str]] = {
+    "request": _pretty_request,
+    "gpt": _pretty_gpt,
+    "stage": _pretty_stage,
+    "navigation": lambda user, screen: (
+        f"{Colors.YELLOW}→ [NAVIGATION]{Colors.ENDC} {Colors.BOLD}{user}{Colors.ENDC} → "
+        f"{Colors.UNDERLINE}{screen}{Colors.ENDC}"
+    ),
+    "success": lambda message: f"{Colors.GREEN}✓ [SUCCESS]{Colors.ENDC} {message}",
+    "error": lambda message: f"{Colors.RED}✗ [ERROR]{Colors.ENDC} {message}",
+    "info": lambda message: f"{Colors.BLUE}ℹ [INFO]{Colors.ENDC} {message}",
+    "divider": lambda: f"{Colors.CYAN}{'─'*70}{Colors.ENDC}",
+    "banner": lambda text: text
+}
+
+
+def _render_pretty(record: Record) -> str:
+    _, _, event, fields = record
+    return _PRETTY[event](**fields)
+
+
+_writer = LogWriter(_render_json if LOG_FORMAT == "json" else _render_pretty, LOG_QUEUE_MAX_SIZE)
+atexit.register(_writer.flush)
+
+
+def _emit(level: int, event: str, **fields):
+    if level < _threshold:
+        return
+    if event in SAMPLED_EVENTS and LOG_SAMPLE_RATE < 1.0 and random.random() >= LOG_SAMPLE_RATE:
+        return
+    _writer.submit((time.time(), level, event, fields))
+
+
+def flush_logs():
+    """대기 중인 로그를 모두 출력 (서버 종료 시)"""
+    _writer.flush()
+
+
+# ───────── 로깅 함수 ─────────
+
 def log_divider():
-    print(f"{Colors.CYAN}{'─'*70}{Colors.ENDC}")
+    if LOG_FORMAT == "pretty":
+        _emit(DEBUG, "divider")
+
+
+def log_banner(text: str):
+    """시작 배너 등 장식 출력 (pretty 형식에서만)"""
+    if LOG_FORMAT == "pretty":
+        _emit(INFO, "banner", text=text)
 
 
 def log_request(endpoint: str, user: str = "Anonymous", details: str = ""):
     """API 요청 로깅"""
-    print(f"\n{Colors.CYAN}┌{'─'*68}┐{Colors.ENDC}")
-    print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.BOLD}[REQUEST]{Colors.ENDC} {endpoint}")
-    print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}User:{Colors.ENDC} {user}")
-    if details:
-        print(f"{Colors.CYAN}│{Colors.ENDC} {Colors.YELLOW}Details:{Colors.ENDC} {details}")
-    print(f"{Colors.CYAN}└{'─'*68}┘{Colors.ENDC}")
+    _emit(INFO, "request", endpoint=endpoint, user=user, details=details)
 
 
 def log_success(message: str):
     """성공 로깅"""
-    print(f"{Colors.GREEN}✓ [SUCCESS]{Colors.ENDC} {message}")
+    _emit(INFO, "success", message=message)
 
 
 def log_error(message: str):
     """에러 로깅"""
-    print(f"{Colors.RED}✗ [ERROR]{Colors.ENDC} {message}")
+    _emit(ERROR, "error", message=message)
 
 
 def log_info(message: str):
     """정보 로깅"""
-    print(f"{Colors.BLUE}ℹ [INFO]{Colors.ENDC} {message}")
+    _emit(INFO, "info", message=message)
 
 
 def log_gpt(prompt_preview: str, response_preview: str):
     """GPT 요청/응답 로깅"""
-    print(f"\n{Colors.MAGENTA}┌{'─'*68}┐{Colors.ENDC}")
-    print(f"{Colors.MAGENTA}│{Colors.ENDC} {Colors.BOLD}[GPT REQUEST]{Colors.ENDC}")
-    print(f"{Colors.MAGENTA}│{Colors.ENDC} Prompt: {prompt_preview[:100]}...")
-    print(f"{Colors.MAGENTA}├{'─'*68}┤{Colors.ENDC}")
-    print(f"{Colors.MAGENTA}│{Colors.ENDC} {Colors.BOLD}[GPT RESPONSE]{Colors.ENDC}")
-    lines = response_preview[:500].split('\n')
-    for line in lines[:10]:
-        print(f"{Colors.MAGENTA}│{Colors.ENDC} {line[:66]}")
-    if len(response_preview) > 500:
-        print(f"{Colors.MAGENTA}│{Colors.ENDC} ... (총 {len(response_preview)} 글자)")
-    print(f"{Colors.MAGENTA}└{'─'*68}┘{Colors.ENDC}")
+    _emit(
+        DEBUG, "gpt",
+        prompt=prompt_preview[:100], response=response_preview[:500], response_chars=len(response_preview)
+    )
 
 
 def log_navigation(user: str, screen: str):
     """사용자 화면 이동 로깅"""
-    print(f"{Colors.YELLOW}→ [NAVIGATION]{Colors.ENDC} {Colors.BOLD}{user}{Colors.ENDC} → {Colors.UNDERLINE}{screen}{Colors.ENDC}")
+    _emit(DEBUG, "navigation", user=user, screen=screen)
 
 
 def log_stage(stage_num: int, stage_name: str, user: str = ""):
     """사용자 단계 로깅"""
-    stages = {
-        1: "🔐 회원가입",
-        2: "🔑 로그인",
-        3: "🏠 홈 화면",
-        4: "📝 퀴즈 시작",
-        5: "✅ 퀴즈 채점",
-        6: "📚 강좌 추천",
-        7: "📋 계획 생성",
-        8: "👥 친구 목록",
-        9: "🔔 알림 확인",
-        10: "👤 프로필"
-    }
-    emoji_stage = stages.get(stage_num, f"📍 {stage_name}")
-    print(f"\n{Colors.YELLOW}{'='*70}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}  STAGE {stage_num}: {emoji_stage}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}  User: {user}{Colors.ENDC}")
-    print(f"{Colors.YELLOW}{'='*70}{Colors.ENDC}\n")
+    _emit(DEBUG, "stage", stage=stage_num, name=stage_name, user=user)
@@ -0,0 +1,225 @@
+# Backend/utils/metrics.py
+"""지연 시간/요청 수 메트릭 - Prometheus 텍스트 형식으로 /metrics에 노출
+
+라우트 템플릿(/jobs/{job_id} 등) 단위로 요청 지연 히스토그램, 상태 코드별 요청 수, 진행 중 요청 수를 기록하고,
+GPT 호출/웹 검색/JSON 추출 구간은 각 서비스에서 히스토그램에 직접 기록합니다.
+값은 프로세스 메모리에만 있으므로 멀티 워커 배포에서는 워커별로 수집됩니다.
+"""
+
+import time
+import functools
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+
+# 초 단위 버킷
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+GPT_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self, kind: str = "counter") -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {kind}"]
+        for values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, values)} {_number(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, *label_values: str, amount: float = 1):
+        self.inc(*label_values, amount=-amount)
+
+    def render(self, kind: str = "gauge") -> List[str]:
+        return super().render(kind)
+
+
+class Histogram:
+    """레이블 값 조합마다 버킷별 개수(누적 전), 합계, 개수를 보관"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, seconds: float, *label_values: str):
+        series = self._series.get(label_values)
+        if series is None:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, seconds)] += 1
+        series[-1] += seconds
+
+    @contextmanager
+    def time(self, *label_values: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *label_values)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for values, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                labels = _labels(self.label_names, values, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.label_names, values)
+            lines.append(f"{self.name}_sum{labels} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class StatsCollector:
+    """렌더링할 때마다 stats()를 호출해 항목별로 내보냄 (캐시 통계처럼 다른 모듈이 직접 세는 값)
+
+    fields: stats 키 -> (메트릭 이름, 종류(gauge/counter), 설명)
+    """
+
+    def __init__(self, stats: Callable[[], dict], fields: Dict[str, Tuple[str, str, str]]):
+        self.stats = stats
+        self.fields = fields
+
+    def render(self) -> List[str]:
+        values = self.stats()
+        lines = []
+        for key, (name, kind, help_text) in self.fields.items():
+            if key in values:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {_number(values[key])}"]
+        return lines
+
+
+def timed(histogram: Histogram, *label_values: str):
+    """async 함수의 실행 시간을 histogram에 기록하는 데코레이터"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with histogram.time(*label_values):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, *args, **kwargs) -> Counter:
+        return self._register(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs) -> Gauge:
+        return self._register(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        return self._register(Histogram(*args, **kwargs))
+
+    def stats(self, *args, **kwargs) -> StatsCollector:
+        return self._register(StatsCollector(*args, **kwargs))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 싱글톤 레지스트리와 메트릭
+metrics = MetricsRegistry()
+
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)", ("method", "route")
+)
+http_requests_total = metrics.counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+http_requests_in_flight = metrics.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수", ("method", "route"))
+gpt_call_duration = metrics.histogram(
+    "gpt_call_duration_seconds", "OpenAI 호출 시간 (role: primary/fallback/stream)",
+    ("model", "role", "outcome"), GPT_BUCKETS
+)
+web_search_duration = metrics.histogram(
+    "web_search_duration_seconds", "유튜브/블로그 검색 시간 (캐시 적중 포함)", ("source",)
+)
+json_extract_duration = metrics.histogram(
+    "json_extract_duration_seconds", "GPT 응답 JSON 추출 시간", ("outcome",), FAST_BUCKETS
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 요청 지연/상태 코드/진행 중 요청 수 기록 (ASGI 미들웨어)
+
+    라우트는 요청 처리 전에 앱의 라우트 목록과 매칭해 정하며, 매칭되지 않으면 "unmatched"로 묶습니다.
+    """
+
+    def __init__(self, app, routes_app=None):
+        self.app = app
+        self._routes_app = routes_app
+
+    def _route_template(self, scope) -> str:
+        routes = self._routes_app.routes if self._routes_app is not None else []
+        partial: Optional[str] = None
+        for route in routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self._route_template(scope)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method, route)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method, route)
+            http_request_duration.observe(time.perf_counter() - start, method, route)
+            http_requests_total.inc(method, route, str(status))